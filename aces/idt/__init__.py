@@ -1,13 +1,30 @@
 from .core import (
     CAT,
+    EXECUTABLE_FFMPEG,
+    EXECUTABLE_FFPROBE,
+    EXTENSIONS_VIDEO,
+    FILENAME_INDEX_DIRECTORY,
+    FRAMES_COUNT_EARLY_STOP_MINIMUM,
+    HEIGHT_STRIP,
+    MARGIN_REGION_OF_INTEREST,
     OPTIMISATION_FACTORIES,
+    RADIUS_KERNEL_FFT,
     RGB_COLORCHECKER_CLASSIC_ACES,
     SAMPLES_COUNT_DEFAULT,
     SD_ILLUMINANT_ACES,
     SDS_COLORCHECKER_CLASSIC,
     SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC,
+    SIZE_BUFFER_ARCHIVE,
+    SIZE_BUFFER_HASH,
+    SIZE_CACHE_COLORIMETRY_DEFAULT,
+    SIZE_CACHE_EXTRACTION_DEFAULT,
+    SIZE_CACHE_SAMPLES_DEFAULT,
+    THROUGHPUT_DECODING_ESTIMATE,
+    TOLERANCE_EARLY_STOP_DEFAULT,
     DecodingMethods,
+    DirectoryIndex,
     DirectoryStructure,
+    ExtractionCache,
     Interpolators,
     LUTSize,
     Metadata,
@@ -17,25 +34,50 @@ from .core import (
     PathEncoder,
     ProjectSettingsMetadataConstants,
     RGBDisplayColourspace,
+    SamplesAnalysis,
+    SamplesCache,
     SerializableConstants,
+    StreamingHasher,
     UICategories,
     UITypes,
+    VideoFrame,
+    ZipArchiveReader,
+    apply_LUT_uniform,
     clf_processing_elements,
     error_delta_E,
+    expand_video_frames,
     extract_archive,
+    find_duplicate_frames,
     format_exposure_key,
+    generate_optimisation_targets,
     generate_reference_colour_checker,
     get_sds_colour_checker,
     get_sds_illuminant,
     hash_file,
+    is_video,
     list_sub_directories,
     mask_outliers,
     metadata_property,
     optimisation_factory_IPT,
     optimisation_factory_Oklab,
     png_compare_colour_checkers,
+    prefetch_frames,
+    preflight_frames,
+    probe_video,
+    read_frame,
+    read_frame_header,
+    read_frame_reduced,
+    read_frame_region,
+    read_video_frame,
+    resolve_path,
+    sample_frame,
+    sample_frames,
+    sample_frames_until_stable,
+    sample_stack,
+    select_video_frames,
     slugify,
     sort_exposure_keys,
+    swatch_index,
     working_directory,
 )
 from .framework import IDTProjectSettings
@@ -51,14 +93,31 @@ from .application import IDTGeneratorApplication  # isort: skip
 
 __all__ = [
     "CAT",
+    "EXECUTABLE_FFMPEG",
+    "EXECUTABLE_FFPROBE",
+    "EXTENSIONS_VIDEO",
+    "FILENAME_INDEX_DIRECTORY",
+    "FRAMES_COUNT_EARLY_STOP_MINIMUM",
+    "HEIGHT_STRIP",
+    "MARGIN_REGION_OF_INTEREST",
     "OPTIMISATION_FACTORIES",
+    "RADIUS_KERNEL_FFT",
     "RGB_COLORCHECKER_CLASSIC_ACES",
     "SAMPLES_COUNT_DEFAULT",
     "SD_ILLUMINANT_ACES",
     "SDS_COLORCHECKER_CLASSIC",
     "SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC",
+    "SIZE_BUFFER_ARCHIVE",
+    "SIZE_BUFFER_HASH",
+    "SIZE_CACHE_COLORIMETRY_DEFAULT",
+    "SIZE_CACHE_EXTRACTION_DEFAULT",
+    "SIZE_CACHE_SAMPLES_DEFAULT",
+    "THROUGHPUT_DECODING_ESTIMATE",
+    "TOLERANCE_EARLY_STOP_DEFAULT",
     "DecodingMethods",
+    "DirectoryIndex",
     "DirectoryStructure",
+    "ExtractionCache",
     "Interpolators",
     "LUTSize",
     "Metadata",
@@ -68,23 +127,48 @@ __all__ = [
     "PathEncoder",
     "ProjectSettingsMetadataConstants",
     "RGBDisplayColourspace",
+    "SamplesAnalysis",
+    "SamplesCache",
     "SerializableConstants",
+    "StreamingHasher",
     "UICategories",
     "UITypes",
+    "VideoFrame",
+    "ZipArchiveReader",
+    "apply_LUT_uniform",
     "clf_processing_elements",
     "error_delta_E",
+    "expand_video_frames",
     "extract_archive",
+    "find_duplicate_frames",
     "format_exposure_key",
+    "generate_optimisation_targets",
     "generate_reference_colour_checker",
     "get_sds_colour_checker",
     "get_sds_illuminant",
     "hash_file",
+    "is_video",
     "list_sub_directories",
     "mask_outliers",
     "metadata_property",
     "optimisation_factory_IPT",
     "optimisation_factory_Oklab",
     "png_compare_colour_checkers",
+    "prefetch_frames",
+    "preflight_frames",
+    "probe_video",
+    "read_frame",
+    "read_frame_header",
+    "read_frame_reduced",
+    "read_frame_region",
+    "read_video_frame",
+    "resolve_path",
+    "sample_frame",
+    "sample_frames",
+    "sample_frames_until_stable",
+    "sample_stack",
+    "select_video_frames",
+    "swatch_index",
     "slugify",
     "sort_exposure_keys",
     "working_directory",
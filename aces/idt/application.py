@@ -10,20 +10,25 @@ from __future__ import annotations
 import logging
 import re
 import typing
+from fnmatch import fnmatch
 from pathlib import Path
 
 if typing.TYPE_CHECKING:
-    from colour.hints import List
+    from colour.hints import Callable, Dict, List, Tuple
 
 from colour.utilities import attest, optional
 
 import aces.idt.core.common
+from aces.idt.core.archive import ZipArchiveReader
 from aces.idt.core.constants import DirectoryStructure
+from aces.idt.core.index import DirectoryIndex
+from aces.idt.core.preflight import preflight_frames
 from aces.idt.core.transform_id import generate_idt_urn, is_valid_csc_urn
 from aces.idt.framework.project_settings import IDTProjectSettings
 from aces.idt.generators import GENERATORS
 
 if typing.TYPE_CHECKING:
+    from aces.idt.core.cache import ExtractionCache
     from aces.idt.generators.base_generator import IDTBaseGenerator
 
 __author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
@@ -53,14 +58,22 @@ class IDTGeneratorApplication:
         Name of the *IDT* generator to use.
     project_settings
         *IDT* project settings.
+    extraction_cache
+        Cache the archives are extracted into and reused from, when no
+        extraction directory is given.
     """
 
     def __init__(
         self,
         generator: str = "IDTGeneratorLogCamera",
         project_settings: IDTProjectSettings | None = None,
+        extraction_cache: ExtractionCache | None = None,
     ) -> None:
         self._project_settings = optional(project_settings, IDTProjectSettings())
+        self._extraction_cache = extraction_cache
+        self._archive = None
+        self._index = None
+        self._persist_index = False
         self._generator = None
         self.generator = generator
 
@@ -103,6 +116,42 @@ class IDTGeneratorApplication:
             raise ValueError(exception)
 
         self._generator = GENERATORS[value](self.project_settings)
+        self._generator.archive = self._archive
+        self._generator.index = self._index
+
+    @property
+    def extraction_cache(self) -> ExtractionCache | None:
+        """
+        Getter and setter property for the cache the archives are extracted
+        into and reused from.
+
+        Returns
+        -------
+        :class:`ExtractionCache` or :py:data:`None`
+            Cache the archives are extracted into.
+        """
+
+        return self._extraction_cache
+
+    @extraction_cache.setter
+    def extraction_cache(self, value: ExtractionCache | None) -> None:
+        """Setter for the **self.extraction_cache** property."""
+
+        self._extraction_cache = value
+
+    @property
+    def archive(self) -> ZipArchiveReader | None:
+        """
+        Getter property for the reader of the archive extracted on demand, if
+        any.
+
+        Returns
+        -------
+        :class:`ZipArchiveReader` or :py:data:`None`
+            Reader of the archive extracted on demand.
+        """
+
+        return self._archive
 
     @property
     def project_settings(self) -> IDTProjectSettings:
@@ -128,7 +177,9 @@ class IDTGeneratorApplication:
         self._project_settings.update(value)
 
     def _update_project_settings_from_implicit_directory_structure(
-        self, root_directory: Path
+        self,
+        root_directory: Path,
+        index: ZipArchiveReader | DirectoryIndex | None = None,
     ) -> None:
         """
         Update the *IDT* project settings using the sub-directory structure under
@@ -148,44 +199,69 @@ class IDTGeneratorApplication:
         ----------
         root_directory:
             Root directory holding the sub-directory structure.
+        index
+            Reader of the archive or index of the directory the sub-directory
+            structure is listed from rather than from the disk.
         """
 
+        exists, iterdir = self._path_accessors(index)
+
+        def _list_images(directory: Path) -> List[Path]:
+            """List the images in given directory."""
+
+            return [
+                file
+                for file in iterdir(directory)
+                if fnmatch(file.name, "*.*") and not file.name.startswith(".")
+            ]
+
         colour_checker_directory = (
             root_directory / DirectoryStructure.DATA / DirectoryStructure.COLOUR_CHECKER
         )
-        attest(colour_checker_directory.exists())
-        for exposure_directory in colour_checker_directory.iterdir():
+        attest(exists(colour_checker_directory))
+        for exposure_directory in iterdir(colour_checker_directory):
             if re.match(r"-?\d", exposure_directory.name):
                 EV = exposure_directory.name
-                self.project_settings.data[DirectoryStructure.COLOUR_CHECKER][EV] = [
-                    file
-                    for file in (colour_checker_directory / exposure_directory).glob(
-                        "*.*"
-                    )
-                    if not file.name.startswith(".")
-                ]
+                self.project_settings.data[DirectoryStructure.COLOUR_CHECKER][EV] = (
+                    _list_images(colour_checker_directory / exposure_directory)
+                )
 
         flatfield_directory = (
             root_directory / DirectoryStructure.DATA / DirectoryStructure.FLATFIELD
         )
-        if flatfield_directory.exists():
-            self.project_settings.data[DirectoryStructure.FLATFIELD] = [
-                file
-                for file in flatfield_directory.glob("*.*")
-                if not file.name.startswith(".")
-            ]
+        if exists(flatfield_directory):
+            self.project_settings.data[DirectoryStructure.FLATFIELD] = _list_images(
+                flatfield_directory
+            )
 
         grey_card_directory = (
             root_directory / DirectoryStructure.DATA / DirectoryStructure.GREY_CARD
         )
-        if grey_card_directory.exists():
-            self.project_settings.data[DirectoryStructure.GREY_CARD] = [
-                file
-                for file in grey_card_directory.glob("*.*")
-                if not file.name.startswith(".")
-            ]
+        if exists(grey_card_directory):
+            self.project_settings.data[DirectoryStructure.GREY_CARD] = _list_images(
+                grey_card_directory
+            )
 
-    def _verify_archive(self, root_directory: Path | str) -> None:
+    @staticmethod
+    def _path_accessors(
+        index: ZipArchiveReader | DirectoryIndex | None = None,
+    ) -> Tuple[Callable, Callable]:
+        """
+        Return the callables testing whether a path exists and listing a
+        directory, either on disk or in given archive reader or directory
+        index.
+        """
+
+        if index is None:
+            return Path.exists, Path.iterdir
+
+        return index.exists, index.iterdir
+
+    def _verify_archive(
+        self,
+        root_directory: Path | str,
+        index: ZipArchiveReader | DirectoryIndex | None = None,
+    ) -> None:
         """
         Verify the *IDT* archive at given root directory.
 
@@ -194,8 +270,13 @@ class IDTGeneratorApplication:
         root_directory
             Root directory holding the *IDT* archive and that needs to be
             verified.
+        index
+            Reader of the archive or index of the directory the images are
+            verified in rather than on the disk.
         """
 
+        exists, _iterdir = self._path_accessors(index)
+
         for exposure in list(
             self.project_settings.data[DirectoryStructure.COLOUR_CHECKER].keys()
         ):
@@ -207,7 +288,7 @@ class IDTGeneratorApplication:
             ]
 
             for image in images:
-                attest(image.exists())
+                attest(exists(image))
 
             self.project_settings.data[DirectoryStructure.COLOUR_CHECKER][
                 float(exposure)
@@ -221,7 +302,7 @@ class IDTGeneratorApplication:
                 )
             ]
             for image in images:
-                attest(image.exists())
+                attest(exists(image))
 
             self.project_settings.data[DirectoryStructure.FLATFIELD] = images
         else:
@@ -235,7 +316,7 @@ class IDTGeneratorApplication:
                 )
             ]
             for image in images:
-                attest(image.exists())
+                attest(exists(image))
 
             self.project_settings.data[DirectoryStructure.GREY_CARD] = images
         else:
@@ -263,7 +344,13 @@ class IDTGeneratorApplication:
 
         self.project_settings.file_type = next(iter(file_types))
 
-    def extract(self, archive: str, directory: str | None = None) -> str:
+    def extract(
+        self,
+        archive: str,
+        directory: str | None = None,
+        stream: bool = False,
+        archive_hash: str | None = None,
+    ) -> str:
         """
         Extract the *IDT* archive.
 
@@ -272,19 +359,80 @@ class IDTGeneratorApplication:
         archive
             Archive to extract.
         directory
-            Directory to extract the archive to.
+            Directory to extract the archive to, the extraction cache entry
+            of the archive is used if not given and the application has an
+            extraction cache.
+        stream
+            Whether to only read the archive central directory and project
+            settings file, the frames being then materialised on demand as
+            they are sampled, see :class:`aces.idt.ZipArchiveReader` class.
+            The archive must remain available until the frames are sampled.
+        archive_hash
+            Hash of the archive as returned by :func:`aces.idt.hash_file`
+            definition, e.g., computed while it was uploaded, it is otherwise
+            computed when required by the extraction cache.
 
         Returns
         -------
         :class:`str`
             Extracted directory.
+
+        Notes
+        -----
+        -   When the archive is extracted into an extraction cache entry, the
+            :attr:`aces.idt.IDTProjectSettings.cleanup` attribute is set to
+            *False* so that the entry is not removed after sampling and can be
+            reused, the entries being evicted by the extraction cache instead.
         """
 
-        directory = aces.idt.core.common.extract_archive(archive, directory)
-        extracted_directories = aces.idt.core.common.list_sub_directories(directory)
-        root_directory = next(iter(extracted_directories))
+        if self._archive is not None:
+            self._archive.close()
+
+        extraction_cache = self._extraction_cache if directory is None else None
+        if extraction_cache is not None:
+            key = archive_hash or extraction_cache.key(archive)
+            if stream:
+                directory = extraction_cache.entry(archive, key)
+                extraction_cache.evict(key)
+            else:
+                directory = extraction_cache.extract(archive, key)
+
+        if stream:
+            self._archive = ZipArchiveReader(archive, directory)
+            directory = self._archive.directory
+            root_directory = next(
+                path
+                for path in self._archive.iterdir(directory)
+                if "__MACOSX" not in path.name and self._archive.is_dir(path)
+            )
+        else:
+            self._archive = None
+            if extraction_cache is None:
+                directory = aces.idt.core.common.extract_archive(archive, directory)
+            extracted_directories = aces.idt.core.common.list_sub_directories(directory)
+            root_directory = next(iter(extracted_directories))
+
+        self.generator.archive = self._archive
+
+        # The extracted files are indexed once rather than listed and then
+        # tested for existence individually. The index of an extraction cache
+        # entry is persisted in it along the content hashes of the frames so
+        # that they are not computed again when the archive is re-processed.
+        self._persist_index = extraction_cache is not None and self._archive is None
+        if self._archive is not None:
+            index = self._archive
+        elif self._persist_index:
+            index = DirectoryIndex.from_directory(directory, persist=True)
+        else:
+            index = DirectoryIndex.scan(directory)
+
+        self._index = index if self._archive is None else None
+        self.generator.index = self._index
 
-        json_files = list(root_directory.glob("*.json"))
+        _exists, iterdir = self._path_accessors(index)
+        json_files = [
+            file for file in iterdir(root_directory) if fnmatch(file.name, "*.json")
+        ]
 
         if len(json_files) > 1:
             msg = 'Multiple "JSON" files found in the root directory!'
@@ -292,17 +440,29 @@ class IDTGeneratorApplication:
         if len(json_files) == 1:
             json_file = next(iter(json_files))
             LOGGER.info('Found explicit "%s" "IDT" project settings file.', json_file)
+            if self._archive is not None:
+                json_file = self._archive.extract(json_file)
             self.project_settings = IDTProjectSettings.from_file(json_file)
         else:
             LOGGER.info('Assuming implicit "IDT" specification...')
             self.project_settings.camera_model = Path(archive).stem
             self._update_project_settings_from_implicit_directory_structure(
-                root_directory
+                root_directory, index
             )
 
         self.project_settings.working_directory = root_directory
 
-        self._verify_archive(root_directory)
+        if extraction_cache is not None and self.project_settings.cleanup:
+            # The extraction cache manages its entries, removing the working
+            # directory after sampling would prevent reusing it.
+            LOGGER.info(
+                'Disabling the "cleanup" project setting as the "%s" working '
+                "directory is managed by the extraction cache.",
+                root_directory,
+            )
+            self.project_settings.cleanup = False
+
+        self._verify_archive(root_directory, index)
         self._verify_file_type()
 
         return directory
@@ -348,6 +508,43 @@ class IDTGeneratorApplication:
 
         return self.process()
 
+    def preflight(self, workers: int | None = None) -> Dict:
+        """
+        Validate the frames of the extracted *IDT* archive from their headers
+        only and estimate the cost of sampling them, before any heavy
+        processing starts.
+
+        Parameters
+        ----------
+        workers
+            Number of threads reading the headers.
+
+        Returns
+        -------
+        :class:`dict`
+            Preflight report, see :func:`aces.idt.preflight_frames`
+            definition.
+        """
+
+        data = self.project_settings.data
+        frames = {
+            DirectoryStructure.COLOUR_CHECKER: [
+                path
+                for paths in data[DirectoryStructure.COLOUR_CHECKER].values()
+                for path in paths
+            ],
+            DirectoryStructure.FLATFIELD: data.get(DirectoryStructure.FLATFIELD, []),
+            DirectoryStructure.GREY_CARD: data.get(DirectoryStructure.GREY_CARD, []),
+        }
+
+        return preflight_frames(
+            frames,
+            optional(self._archive, self.project_settings.working_directory),
+            workers,
+            self.project_settings.sampling_workers,
+            self.project_settings.sampling_video_frames,
+        )
+
     def process(self) -> IDTBaseGenerator:
         """
         Run the *IDT* generator application process maintaining the execution steps.
@@ -360,6 +557,10 @@ class IDTGeneratorApplication:
 
         self.validate_project_settings()
         self.generator.sample()
+
+        if self._index is not None and self._persist_index:
+            self._index.save()
+
         self.generator.sort()
         self.generator.remove_clipped_samples()
         self.generator.generate_LUT()
@@ -397,6 +598,31 @@ class IDTGeneratorApplication:
             output_directory, archive_serialised_generator=archive_serialised_generator
         )
 
+    def zip_bytes(self, archive_serialised_generator: bool = False) -> bytes:
+        """
+        Create a *zip* file in memory with the output of the *IDT* application
+        process.
+
+        Parameters
+        ----------
+        archive_serialised_generator : bool
+            Whether to serialise and archive the *IDT* generator.
+
+        Returns
+        -------
+        :class:`bytes`
+            *Zip* file content.
+        """
+
+        if not self.generator:
+            exception = 'No "IDT" generator was set!'
+
+            raise ValueError(exception)
+
+        return self.generator.zip_bytes(
+            archive_serialised_generator=archive_serialised_generator
+        )
+
     def validate_project_settings(self) -> None:
         """Run validation checks on the project settings.
 
@@ -0,0 +1,481 @@
+"""
+IDT Batch Processing
+====================
+
+Define the objects processing many *IDT* archives in parallel without the
+*Dash* applications, e.g., to recalibrate a whole camera fleet at once.
+
+The :func:`aces.idt.batch.main` definition is the ``idt-calculator-batch``
+console entry point, it can also be run with
+``python -m aces.idt.batch``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import logging
+import os
+import shutil
+import sys
+import time
+import traceback
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+if typing.TYPE_CHECKING:
+    from colour.hints import Dict, List, Sequence
+
+import numpy as np
+from colour.characterisation import camera_RGB_to_ACES2065_1
+
+from aces.idt.application import IDTGeneratorApplication
+from aces.idt.core.common import apply_LUT_uniform, error_delta_E
+from aces.idt.framework.project_settings import IDTProjectSettings
+from aces.idt.generators import GENERATORS
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "expand_archives",
+    "archive_output_names",
+    "process_archive_summary",
+    "process_archives",
+    "main",
+]
+
+LOGGER = logging.getLogger(__name__)
+
+
+def expand_archives(patterns: Sequence[str]) -> List[str]:
+    """
+    Expand given archive paths and *glob* patterns into a list of unique
+    archive paths.
+
+    Parameters
+    ----------
+    patterns
+        Archive paths or *glob* patterns, e.g., ``"fleet/**/*.zip"``.
+
+    Returns
+    -------
+    :class:`list`
+        Unique archive paths, in given order.
+    """
+
+    archives = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            archives.extend(sorted(glob.glob(pattern, recursive=True)))
+        else:
+            archives.append(pattern)
+
+    return list(dict.fromkeys(archives))
+
+
+def archive_output_names(archives: Sequence[str]) -> List[str]:
+    """
+    Return unique names for the output sub-directories of given archives,
+    i.e., their paths relative to their common parent directory without
+    extension.
+
+    Archives with the same file name in different directories, e.g.,
+    ``fleet/camA/data.zip`` and ``fleet/camB/data.zip``, thus do not write to
+    the same output sub-directory.
+
+    Parameters
+    ----------
+    archives
+        Archive *zip* file paths.
+
+    Returns
+    -------
+    :class:`list`
+        Output sub-directory names, in given archives order.
+
+    Examples
+    --------
+    >>> archive_output_names(["fleet/camA/data.zip", "fleet/camB/data.zip"])
+    ['camA/data', 'camB/data']
+    >>> archive_output_names(["fleet/camA/data.zip"])
+    ['data']
+    """
+
+    paths = [os.path.abspath(archive) for archive in archives]
+    if not paths:
+        return []
+
+    parent = os.path.commonpath([os.path.dirname(path) for path in paths])
+
+    return [
+        Path(os.path.relpath(path, parent)).with_suffix("").as_posix() for path in paths
+    ]
+
+
+def _delta_E(generator: typing.Any) -> Dict:
+    """
+    Return the median and maximum :math:`\\Delta E_{00}` of the colour checker
+    samples at the baseline exposure corrected by the *IDT* of given generator
+    against the reference colour checker samples.
+    """
+
+    samples_median = generator.samples_analysis.colour_checker_median(
+        generator.baseline_exposure
+    )
+
+    samples_idt = camera_RGB_to_ACES2065_1(
+        # "camera_RGB_to_ACES2065_1" divides RGB by "min(RGB_w)" for highlights
+        # recovery, this is not required here as the images are expected to be
+        # fully processed, thus we pre-emptively multiply by "min(RGB_w)".
+        apply_LUT_uniform(generator.LUT_decoding, samples_median)
+        * np.min(generator.RGB_w),
+        generator.M,
+        generator.RGB_w,
+        generator.k,
+    )
+    samples_idt *= pow(2, -generator.baseline_exposure)
+
+    delta_E = error_delta_E(
+        samples_idt,
+        generator.project_settings.get_reference_colour_checker_samples(),
+    )
+
+    return {"median": float(np.median(delta_E)), "max": float(np.max(delta_E))}
+
+
+def _verify_preflight(
+    application: IDTGeneratorApplication, archive: str, report: Dict
+) -> None:
+    """
+    Raise an exception if given preflight report of given archive extracted by
+    given application is not valid.
+    """
+
+    if report["valid"]:
+        return
+
+    if application.project_settings.cleanup:
+        shutil.rmtree(
+            application.project_settings.working_directory, ignore_errors=True
+        )
+
+    exception = (
+        f'"{archive}" archive frames are not valid: '
+        f"{report['errors'] + report['inconsistencies']}"
+    )
+
+    raise ValueError(exception)
+
+
+def process_archive_summary(
+    archive: str,
+    generator: str,
+    settings: str,
+    output_directory: str,
+    *,
+    archive_serialised_generator: bool = False,
+    preflight: bool = False,
+    output_name: str | None = None,
+) -> Dict:
+    """
+    Compute the *IDT* of given archive *zip* file, write its *zip* file to a
+    sub-directory of given output directory named after the archive and return
+    a summary of the computation.
+
+    Exceptions are not raised but reported in the summary so that an archive
+    failing does not interrupt the processing of the other archives.
+
+    Parameters
+    ----------
+    archive
+        Archive *zip* file path.
+    generator
+        Name of the *IDT* generator to use.
+    settings
+        *IDT* project settings as *JSON*.
+    output_directory
+        Output directory.
+    archive_serialised_generator
+        Whether to serialise and archive the *IDT* generator.
+    preflight
+        Whether to validate the archive frames from their headers before
+        processing them, the archive fails without being processed if they
+        are not valid.
+    output_name
+        Name of the output sub-directory, e.g., as returned by
+        :func:`aces.idt.batch.archive_output_names` definition, defaults to
+        the archive file name without extension.
+
+    Returns
+    -------
+    :class:`dict`
+        Summary of the computation, i.e., the archive path, status, *zip* file
+        path, :math:`M` matrix, :math:`RGB_w` white balance multipliers,
+        :math:`k` exposure factor, :math:`\\Delta E_{00}`, timings in
+        seconds and preflight report if requested.
+    """
+
+    summary = {"archive": archive, "generator": generator, "status": "success"}
+    timings = summary["timings"] = {}
+
+    start = lap = time.perf_counter()
+
+    def _timing(name: str) -> None:
+        """Record the time elapsed since the previous step with given name."""
+
+        nonlocal lap
+
+        timings[name] = time.perf_counter() - lap
+        lap = time.perf_counter()
+
+    try:
+        # The project settings are loaded for each archive so that the data of
+        # a previous archive processed by the same worker process is not
+        # shared.
+        application = IDTGeneratorApplication(
+            generator, IDTProjectSettings.from_json(settings)
+        )
+
+        application.project_settings.working_directory = application.extract(archive)
+        _timing("extract")
+
+        if preflight:
+            summary["preflight"] = application.preflight()
+            _timing("preflight")
+
+            _verify_preflight(application, archive, summary["preflight"])
+
+        generator_instance = application.process_archive(None)
+        _timing("process")
+
+        zip_file = application.zip(
+            Path(output_directory, output_name or Path(archive).stem),
+            archive_serialised_generator=archive_serialised_generator,
+        )
+        _timing("zip")
+
+        summary.update(
+            {
+                "zip": str(zip_file),
+                "M": np.asarray(generator_instance.M).tolist(),
+                "RGB_w": np.asarray(generator_instance.RGB_w).tolist(),
+                "k": float(np.asarray(generator_instance.k)),
+                "delta_E": _delta_E(generator_instance),
+            }
+        )
+    except Exception as error:
+        LOGGER.exception('Processing "%s" archive failed!', archive)
+
+        summary["status"] = "failure"
+        summary["error"] = "".join(traceback.format_exception(error))
+
+    timings["total"] = time.perf_counter() - start
+
+    return summary
+
+
+def process_archives(
+    archives: Sequence[str],
+    generator: str = "IDTGeneratorLogCamera",
+    settings: str | None = None,
+    output_directory: str = ".",
+    *,
+    jobs: int | None = None,
+    archive_serialised_generator: bool = False,
+    preflight: bool = False,
+) -> List[Dict]:
+    """
+    Compute the *IDTs* of given archive *zip* files across a pool of worker
+    processes.
+
+    Parameters
+    ----------
+    archives
+        Archive *zip* file paths.
+    generator
+        Name of the *IDT* generator to use.
+    settings
+        *IDT* project settings as *JSON*, the default project settings are
+        used if not given.
+    output_directory
+        Output directory, the *zip* file of each archive is written to a
+        sub-directory named after its path relative to the archives common
+        parent directory, see :func:`aces.idt.batch.archive_output_names`
+        definition.
+    jobs
+        Number of worker processes, defaults to the number of processors.
+    archive_serialised_generator
+        Whether to serialise and archive the *IDT* generators.
+    preflight
+        Whether to validate the archives frames from their headers before
+        processing them.
+
+    Returns
+    -------
+    :class:`list`
+        Summaries of the computations, in given archives order.
+    """
+
+    if generator not in GENERATORS:
+        exception = f'"{generator}" generator does not exist!'
+
+        raise ValueError(exception)
+
+    if settings is None:
+        settings = IDTProjectSettings().to_json()
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(archives) or 1))
+
+    LOGGER.info(
+        'Processing %s archive(s) with "%s" generator and %s worker process(es)...',
+        len(archives),
+        generator,
+        jobs,
+    )
+
+    options = {
+        "archive_serialised_generator": archive_serialised_generator,
+        "preflight": preflight,
+    }
+    arguments = list(zip(archives, archive_output_names(archives), strict=True))
+
+    if jobs == 1:
+        return [
+            process_archive_summary(
+                archive,
+                generator,
+                settings,
+                output_directory,
+                output_name=output_name,
+                **options,
+            )
+            for archive, output_name in arguments
+        ]
+
+    with ProcessPoolExecutor(jobs) as executor:
+        futures = [
+            executor.submit(
+                process_archive_summary,
+                archive,
+                generator,
+                settings,
+                output_directory,
+                output_name=output_name,
+                **options,
+            )
+            for archive, output_name in arguments
+        ]
+
+        return [future.result() for future in futures]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the *IDT* batch processing from the command line.
+
+    Parameters
+    ----------
+    argv
+        Command line arguments, :attr:`sys.argv` is used if not given.
+
+    Returns
+    -------
+    :class:`int`
+        Exit code, non-zero if any archive failed.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="idt-calculator-batch",
+        description="Compute the IDTs of many archives in parallel.",
+    )
+    parser.add_argument(
+        "archives", nargs="+", help="Archive zip file paths or glob patterns."
+    )
+    parser.add_argument(
+        "--generator",
+        "-g",
+        default="IDTGeneratorLogCamera",
+        choices=list(GENERATORS),
+        help="IDT generator name.",
+    )
+    parser.add_argument("--settings", "-s", help="IDT project settings JSON file.")
+    parser.add_argument(
+        "--output-directory", "-o", default=".", help="Output directory."
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Number of worker processes, defaults to the number of processors.",
+    )
+    parser.add_argument(
+        "--summary",
+        default=None,
+        help='Summary JSON file, defaults to "summary.json" in the output directory.',
+    )
+    parser.add_argument(
+        "--archive-serialised-generator",
+        action="store_true",
+        help="Serialise and archive the IDT generators.",
+    )
+    parser.add_argument(
+        "--preflight",
+        action="store_true",
+        help="Validate the archives frames from their headers before processing them.",
+    )
+    parser.add_argument(
+        "--verbose", "-v", action="store_true", help="Log debug messages."
+    )
+
+    arguments = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if arguments.verbose else logging.INFO)
+
+    archives = expand_archives(arguments.archives)
+    if not archives:
+        parser.error("No archive matches given paths or patterns!")
+
+    settings = None
+    if arguments.settings is not None:
+        with open(arguments.settings) as settings_file:
+            settings = settings_file.read()
+
+    summaries = process_archives(
+        archives,
+        arguments.generator,
+        settings,
+        arguments.output_directory,
+        jobs=arguments.jobs,
+        archive_serialised_generator=arguments.archive_serialised_generator,
+        preflight=arguments.preflight,
+    )
+
+    summary_file = arguments.summary or os.path.join(
+        arguments.output_directory, "summary.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(summary_file)), exist_ok=True)
+    with open(summary_file, "w") as output_file:
+        json.dump(summaries, output_file, indent=4)
+
+    failures = [summary for summary in summaries if summary["status"] != "success"]
+
+    LOGGER.info(
+        '%s archive(s) processed, %s failed, summary written to "%s".',
+        len(summaries),
+        len(failures),
+        summary_file,
+    )
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
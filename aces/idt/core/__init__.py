@@ -1,20 +1,30 @@
+from .archive import SIZE_BUFFER_ARCHIVE, ZipArchiveReader, resolve_path
+from .cache import ExtractionCache, SamplesCache
 from .common import (
     OPTIMISATION_FACTORIES,
+    RADIUS_KERNEL_FFT,
     RGB_COLORCHECKER_CLASSIC_ACES,
     SAMPLES_COUNT_DEFAULT,
     SD_ILLUMINANT_ACES,
     SDS_COLORCHECKER_CLASSIC,
     SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC,
+    SIZE_BUFFER_HASH,
+    StreamingHasher,
+    apply_LUT_uniform,
     clf_processing_elements,
     error_delta_E,
     extract_archive,
+    extrapolate_channels,
+    filter_gaussian,
     find_clipped_exposures,
     find_similar_rows,
     format_exposure_key,
+    generate_optimisation_targets,
     generate_reference_colour_checker,
     get_sds_colour_checker,
     get_sds_illuminant,
     hash_file,
+    jacobian_factory_Iab,
     list_sub_directories,
     mask_outliers,
     optimisation_factory_IPT,
@@ -27,6 +37,10 @@ from .common import (
 from .constants import (
     CAT,
     EXPOSURE_CLIPPING_THRESHOLD,
+    SIZE_CACHE_COLORIMETRY_DEFAULT,
+    SIZE_CACHE_EXTRACTION_DEFAULT,
+    SIZE_CACHE_SAMPLES_DEFAULT,
+    TOLERANCE_EARLY_STOP_DEFAULT,
     DecodingMethods,
     DirectoryStructure,
     Interpolators,
@@ -37,30 +51,70 @@ from .constants import (
     UICategories,
     UITypes,
 )
+from .index import FILENAME_INDEX_DIRECTORY, DirectoryIndex, find_duplicate_frames
+from .preflight import (
+    THROUGHPUT_DECODING_ESTIMATE,
+    preflight_frames,
+    read_frame_header,
+)
+from .sampling import (
+    FRAMES_COUNT_EARLY_STOP_MINIMUM,
+    HEIGHT_STRIP,
+    MARGIN_REGION_OF_INTEREST,
+    prefetch_frames,
+    read_frame,
+    read_frame_reduced,
+    read_frame_region,
+    sample_frame,
+    sample_frames,
+    sample_frames_until_stable,
+    sample_stack,
+    swatch_index,
+)
+from .video import (
+    EXECUTABLE_FFMPEG,
+    EXECUTABLE_FFPROBE,
+    EXTENSIONS_VIDEO,
+    VideoFrame,
+    expand_video_frames,
+    is_video,
+    probe_video,
+    read_video_frame,
+    select_video_frames,
+)
 from .structures import (
     Metadata,
     MetadataProperty,
     MixinSerializableProperties,
     PathEncoder,
+    SamplesAnalysis,
     SerializableConstants,
     metadata_property,
 )
 
 __all__ = [
     "OPTIMISATION_FACTORIES",
+    "RADIUS_KERNEL_FFT",
     "RGB_COLORCHECKER_CLASSIC_ACES",
     "SAMPLES_COUNT_DEFAULT",
     "SD_ILLUMINANT_ACES",
     "SDS_COLORCHECKER_CLASSIC",
     "SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC",
+    "SIZE_BUFFER_HASH",
+    "StreamingHasher",
+    "apply_LUT_uniform",
     "clf_processing_elements",
     "error_delta_E",
     "extract_archive",
+    "extrapolate_channels",
+    "filter_gaussian",
     "format_exposure_key",
+    "generate_optimisation_targets",
     "generate_reference_colour_checker",
     "get_sds_colour_checker",
     "get_sds_illuminant",
     "hash_file",
+    "jacobian_factory_Iab",
     "list_sub_directories",
     "mask_outliers",
     "optimisation_factory_IPT",
@@ -75,6 +129,10 @@ __all__ = [
 
 __all__ += [
     "EXPOSURE_CLIPPING_THRESHOLD",
+    "SIZE_CACHE_COLORIMETRY_DEFAULT",
+    "SIZE_CACHE_EXTRACTION_DEFAULT",
+    "SIZE_CACHE_SAMPLES_DEFAULT",
+    "TOLERANCE_EARLY_STOP_DEFAULT",
     "CAT",
     "DirectoryStructure",
     "DecodingMethods",
@@ -87,11 +145,62 @@ __all__ += [
     "UITypes",
 ]
 
+__all__ += [
+    "SIZE_BUFFER_ARCHIVE",
+    "ZipArchiveReader",
+    "resolve_path",
+]
+
+__all__ += [
+    "ExtractionCache",
+    "SamplesCache",
+]
+
+__all__ += [
+    "FILENAME_INDEX_DIRECTORY",
+    "DirectoryIndex",
+    "find_duplicate_frames",
+]
+
+__all__ += [
+    "THROUGHPUT_DECODING_ESTIMATE",
+    "preflight_frames",
+    "read_frame_header",
+]
+
+__all__ += [
+    "FRAMES_COUNT_EARLY_STOP_MINIMUM",
+    "HEIGHT_STRIP",
+    "MARGIN_REGION_OF_INTEREST",
+    "read_frame",
+    "read_frame_reduced",
+    "read_frame_region",
+    "prefetch_frames",
+    "sample_frame",
+    "sample_frames",
+    "sample_frames_until_stable",
+    "sample_stack",
+    "swatch_index",
+]
+
+__all__ += [
+    "EXECUTABLE_FFMPEG",
+    "EXECUTABLE_FFPROBE",
+    "EXTENSIONS_VIDEO",
+    "VideoFrame",
+    "expand_video_frames",
+    "is_video",
+    "probe_video",
+    "read_video_frame",
+    "select_video_frames",
+]
+
 __all__ += [
     "Metadata",
     "MetadataProperty",
     "MixinSerializableProperties",
     "PathEncoder",
+    "SamplesAnalysis",
     "SerializableConstants",
     "metadata_property",
 ]
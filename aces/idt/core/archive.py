@@ -0,0 +1,456 @@
+"""
+Archive
+=======
+
+Define the objects reading the frames of an *IDT* archive directly from its
+*zip* file.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import threading
+import typing
+import zipfile
+from pathlib import Path, PurePosixPath
+
+if typing.TYPE_CHECKING:
+    from colour.hints import Dict, List, Tuple
+
+from aces.idt.core.common import StreamingHasher, hash_file
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "SIZE_BUFFER_ARCHIVE",
+    "ZipArchiveReader",
+    "resolve_path",
+]
+
+LOGGER = logging.getLogger(__name__)
+
+SIZE_BUFFER_ARCHIVE: int = 2**24
+"""Size in bytes of the buffer the archive members are copied with."""
+
+
+class ZipArchiveReader:
+    """
+    Define a reader of the members of an *IDT* archive *zip* file that
+    materialises them on demand rather than extracting the whole archive
+    upfront.
+
+    Only the archive central directory is read on instantiation, a member is
+    written to given directory, at the path :func:`shutil.unpack_archive`
+    definition would have extracted it to, the first time it is resolved. The
+    sampling can thus start as soon as the first frame is materialised, while
+    the remaining frames are still unread. Stored, i.e., uncompressed,
+    members are copied straight from the archive without being decompressed.
+
+    The reader can be pickled so that the worker processes of the sampling
+    resolve the frames themselves, the members are written atomically so that
+    concurrent readers never see a partial member.
+
+    Parameters
+    ----------
+    archive
+        Archive *zip* file path.
+    directory
+        Directory the archive members are materialised to, a temporary
+        directory is used if not given.
+
+    Raises
+    ------
+    ValueError
+        If a member name is absolute or traverses up, i.e., if the member would
+        be materialised outside of given directory.
+
+    Attributes
+    ----------
+    -   :attr:`~aces.idt.ZipArchiveReader.archive`
+    -   :attr:`~aces.idt.ZipArchiveReader.directory`
+    -   :attr:`~aces.idt.ZipArchiveReader.names`
+
+    Methods
+    -------
+    -   :meth:`~aces.idt.ZipArchiveReader.member`
+    -   :meth:`~aces.idt.ZipArchiveReader.exists`
+    -   :meth:`~aces.idt.ZipArchiveReader.is_dir`
+    -   :meth:`~aces.idt.ZipArchiveReader.iterdir`
+    -   :meth:`~aces.idt.ZipArchiveReader.size`
+    -   :meth:`~aces.idt.ZipArchiveReader.fingerprint`
+    -   :meth:`~aces.idt.ZipArchiveReader.digest`
+    -   :meth:`~aces.idt.ZipArchiveReader.extract`
+    -   :meth:`~aces.idt.ZipArchiveReader.close`
+    """
+
+    def __init__(
+        self, archive: str | Path, directory: str | Path | None = None
+    ) -> None:
+        self._archive = str(archive)
+        self._directory = str(directory or tempfile.TemporaryDirectory().name)
+
+        self._zip_file = None
+        self._lock = threading.Lock()
+
+        with zipfile.ZipFile(self._archive) as zip_file:
+            self._infos = {
+                info.filename: (info.file_size, info.CRC)
+                for info in zip_file.infolist()
+                if not info.is_dir()
+            }
+
+        # The members must be materialised under the reader directory, absolute
+        # names and names traversing up would be written outside of it.
+        for name in self._infos:
+            parts = PurePosixPath(name).parts
+            if (
+                PurePosixPath(name).is_absolute()
+                or ".." in parts
+                or os.path.isabs(os.path.join(*parts))
+            ):
+                exception = (
+                    f'"{self._archive}" archive member "{name}" would be '
+                    "extracted outside of the archive directory!"
+                )
+
+                raise ValueError(exception)
+
+        self._names = tuple(self._infos)
+        self._digests = {}
+
+        # The archives do not necessarily store entries for the directories,
+        # they are inferred from the members.
+        self._directories = {
+            str(parent)
+            for name in self._names
+            for parent in PurePosixPath(name).parents
+            if str(parent) != "."
+        }
+
+        os.makedirs(self._directory, exist_ok=True)
+
+    def __getstate__(self) -> Dict:
+        """Return the state of the reader for pickling."""
+
+        return {"archive": self._archive, "directory": self._directory}
+
+    def __setstate__(self, state: Dict) -> None:
+        """Set the state of the reader when unpickling."""
+
+        self.__init__(state["archive"], state["directory"])
+
+    @property
+    def archive(self) -> str:
+        """
+        Getter property for the archive *zip* file path.
+
+        Returns
+        -------
+        :class:`str`
+            Archive *zip* file path.
+        """
+
+        return self._archive
+
+    @property
+    def directory(self) -> str:
+        """
+        Getter property for the directory the archive members are materialised
+        to.
+
+        Returns
+        -------
+        :class:`str`
+            Directory the archive members are materialised to.
+        """
+
+        return self._directory
+
+    @property
+    def names(self) -> tuple:
+        """
+        Getter property for the names of the archive members.
+
+        Returns
+        -------
+        :class:`tuple`
+            Names of the archive members.
+        """
+
+        return self._names
+
+    def member(self, path: str | Path) -> str:
+        """
+        Return the name of the archive member at given path.
+
+        Parameters
+        ----------
+        path
+            Member path, relative paths are resolved against the reader
+            directory.
+
+        Returns
+        -------
+        :class:`str`
+            Archive member name.
+        """
+
+        return Path(
+            os.path.relpath(os.path.join(self._directory, path), self._directory)
+        ).as_posix()
+
+    def exists(self, path: str | Path) -> bool:
+        """
+        Return whether the archive stores a member or directory at given path.
+
+        Parameters
+        ----------
+        path
+            Member path, relative paths are resolved against the reader
+            directory.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the archive stores a member or directory at given path.
+        """
+
+        name = self.member(path)
+
+        return name in self._directories or name in self._names
+
+    def is_dir(self, path: str | Path) -> bool:
+        """
+        Return whether the archive stores a directory at given path.
+
+        Parameters
+        ----------
+        path
+            Directory path, relative paths are resolved against the reader
+            directory.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the archive stores a directory at given path.
+        """
+
+        return self.member(path) in self._directories
+
+    def iterdir(self, path: str | Path) -> List[Path]:
+        """
+        Return the paths of the members and directories the archive stores
+        directly under given directory path, like :meth:`Path.iterdir`
+        method.
+
+        Parameters
+        ----------
+        path
+            Directory path, relative paths are resolved against the reader
+            directory.
+
+        Returns
+        -------
+        :class:`list`
+            Paths of the members and directories under given directory path.
+        """
+
+        name = self.member(path)
+
+        return [
+            Path(self._directory, child)
+            for child in sorted(self._directories | set(self._names))
+            if str(PurePosixPath(child).parent) == name
+        ]
+
+    def size(self, path: str | Path) -> int:
+        """
+        Return the uncompressed size in bytes of the archive member at given
+        path.
+
+        Parameters
+        ----------
+        path
+            Member path, relative paths are resolved against the reader
+            directory.
+
+        Returns
+        -------
+        :class:`int`
+            Member uncompressed size in bytes.
+        """
+
+        return self._infos[self.member(path)][0]
+
+    def fingerprint(self, path: str | Path) -> Tuple[int, int]:
+        """
+        Return the fingerprint of the archive member at given path, i.e., its
+        uncompressed size and *CRC-32* read from the archive central
+        directory.
+
+        Members with different fingerprints have a different content, members
+        with the same fingerprint must be compared with their digest.
+
+        Parameters
+        ----------
+        path
+            Member path, relative paths are resolved against the reader
+            directory.
+
+        Returns
+        -------
+        :class:`tuple`
+            Member fingerprint.
+        """
+
+        return self._infos[self.member(path)]
+
+    def digest(self, path: str | Path) -> str:
+        """
+        Return the hash of the content of the archive member at given path,
+        as :func:`aces.idt.hash_file` definition would return for the
+        materialised member.
+
+        The member is materialised while it is hashed, see
+        :meth:`aces.idt.ZipArchiveReader.extract` method, so that reading it
+        afterwards does not decompress it again, a member already materialised
+        is hashed from the disk. The hash is retained.
+
+        Parameters
+        ----------
+        path
+            Member path, relative paths are resolved against the reader
+            directory.
+
+        Returns
+        -------
+        :class:`str`
+            Member content hash.
+        """
+
+        name = self.member(path)
+
+        if name not in self._digests:
+            path = self.extract(path)
+
+            # The member was materialised before, e.g., by another process.
+            if name not in self._digests:
+                self._digests[name] = hash_file(path)
+
+        return self._digests[name]
+
+    def _open(self) -> zipfile.ZipFile:
+        """Open the archive *zip* file once and return it."""
+
+        with self._lock:
+            if self._zip_file is None:
+                self._zip_file = zipfile.ZipFile(self._archive)
+
+            return self._zip_file
+
+    def extract(self, path: str | Path) -> str:
+        """
+        Materialise the archive member at given path if it does not exist
+        and return its path.
+
+        The member is hashed while it is materialised and its hash retained,
+        see :meth:`aces.idt.ZipArchiveReader.digest` method.
+
+        Parameters
+        ----------
+        path
+            Member path, relative paths are resolved against the reader
+            directory.
+
+        Returns
+        -------
+        :class:`str`
+            Materialised member path.
+
+        Raises
+        ------
+        ValueError
+            If the member path is outside of the reader directory.
+        """
+
+        name = self.member(path)
+        target = os.path.join(self._directory, *PurePosixPath(name).parts)
+
+        directory = os.path.realpath(self._directory)
+        if os.path.commonpath([directory, os.path.realpath(target)]) != directory:
+            exception = (
+                f'"{name}" archive member path is outside of the archive directory!'
+            )
+
+            raise ValueError(exception)
+
+        if os.path.exists(target):
+            return target
+
+        zip_file = self._open()
+
+        LOGGER.debug('Materialising "%s" archive member...', name)
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        file_descriptor, path_temporary = tempfile.mkstemp(
+            suffix=".tmp", dir=os.path.dirname(target)
+        )
+        hasher = StreamingHasher()
+        try:
+            with (
+                zip_file.open(name) as source,
+                os.fdopen(file_descriptor, "wb") as destination,
+            ):
+                while chunk := source.read(SIZE_BUFFER_ARCHIVE):
+                    hasher.update(chunk)
+                    destination.write(chunk)
+
+            os.replace(path_temporary, target)
+        finally:
+            if os.path.exists(path_temporary):
+                os.remove(path_temporary)
+
+        self._digests[name] = hasher.hexdigest()
+
+        return target
+
+    def close(self) -> None:
+        """Close the archive *zip* file."""
+
+        with self._lock:
+            if self._zip_file is not None:
+                self._zip_file.close()
+                self._zip_file = None
+
+
+def resolve_path(
+    path: str | Path, directory: str | Path | ZipArchiveReader = ""
+) -> str:
+    """
+    Resolve given path against given directory, materialising it first if the
+    directory is a :class:`ZipArchiveReader` class instance.
+
+    Parameters
+    ----------
+    path
+        Path to resolve, relative paths are resolved against given directory.
+    directory
+        Directory or archive reader relative paths are resolved against.
+
+    Returns
+    -------
+    :class:`str`
+        Resolved path.
+    """
+
+    if isinstance(directory, ZipArchiveReader):
+        return directory.extract(path)
+
+    return os.path.join(directory, path)
@@ -0,0 +1,591 @@
+"""
+Cache
+=====
+
+Define the objects caching the samples of the frames of an *IDT* archive and
+the extracted *IDT* archives on disk.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+import typing
+
+import numpy as np
+import xxhash
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+    from colour.hints import ArrayLike, Any, Dict, NDArrayFloat, Tuple
+
+from aces.idt.core.archive import ZipArchiveReader
+from aces.idt.core.common import hash_file
+from aces.idt.core.constants import (
+    SIZE_CACHE_EXTRACTION_DEFAULT,
+    SIZE_CACHE_SAMPLES_DEFAULT,
+)
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "SamplesCache",
+    "ExtractionCache",
+]
+
+LOGGER = logging.getLogger(__name__)
+
+_AGE_TEMPORARY_STALE: float = 3600
+"""
+Age in seconds after which a temporary file left in a cache is considered
+stale, i.e., abandoned by a process that crashed while writing it.
+"""
+
+_AGE_ENTRY_IN_USE: float = 3600
+"""
+Age in seconds under which an extraction cache entry is considered in use,
+e.g., by another process sampling its frames, and is not evicted.
+"""
+
+
+def _stat_entry(path: str) -> Tuple[float, int]:
+    """
+    Return the modification time of the most recently modified file or
+    directory of the cache entry at given path and its size in bytes.
+    """
+
+    mtime, size = os.stat(path).st_mtime, 0
+    for root, _directories, files in os.walk(path):
+        for name in files:
+            stat = _stat(os.path.join(root, name))
+            if stat is not None:
+                mtime, size = max(mtime, stat.st_mtime), size + stat.st_size
+
+    return mtime, size
+
+
+def _stat(path: str) -> os.stat_result | None:
+    """Return the status of given path or *None* if it does not exist anymore."""
+
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _serialise_value(value: Any) -> Any:
+    """Serialise given value to a *JSON* compatible value for hashing."""
+
+    if isinstance(value, np.ndarray | np.generic):
+        return value.tolist()
+
+    return repr(value)
+
+
+class SamplesCache:
+    """
+    Define a persistent content-addressed cache storing the swatches colours
+    sampled from the frames of an *IDT* archive.
+
+    The entries are keyed by the frame content hash, the segmentation
+    settings and the colour checker quadrilateral so that a frame is only
+    sampled again if any of them changes, irrespective of its path or the
+    archive it belongs to. The least recently used entries are evicted when
+    the cache exceeds its maximum size.
+
+    Parameters
+    ----------
+    directory
+        Directory storing the cache entries, created if it does not exist.
+    size
+        Maximum size in bytes of the cache entries.
+
+    Attributes
+    ----------
+    -   :attr:`~aces.idt.SamplesCache.directory`
+    -   :attr:`~aces.idt.SamplesCache.size`
+
+    Methods
+    -------
+    -   :meth:`~aces.idt.SamplesCache.digest`
+    -   :meth:`~aces.idt.SamplesCache.key`
+    -   :meth:`~aces.idt.SamplesCache.get`
+    -   :meth:`~aces.idt.SamplesCache.set`
+    -   :meth:`~aces.idt.SamplesCache.evict`
+    -   :meth:`~aces.idt.SamplesCache.clear`
+    """
+
+    def __init__(
+        self, directory: str | Path, size: int = SIZE_CACHE_SAMPLES_DEFAULT
+    ) -> None:
+        self._directory = str(directory)
+        self._size = size
+        self._digests = {}
+
+        os.makedirs(self._directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        """
+        Getter property for the directory storing the cache entries.
+
+        Returns
+        -------
+        :class:`str`
+            Directory storing the cache entries.
+        """
+
+        return self._directory
+
+    @property
+    def size(self) -> int:
+        """
+        Getter property for the maximum size in bytes of the cache entries.
+
+        Returns
+        -------
+        :class:`int`
+            Maximum size in bytes of the cache entries.
+        """
+
+        return self._size
+
+    def _path(self, key: str) -> str:
+        """Return the path of the cache entry with given key."""
+
+        return os.path.join(self._directory, f"{key}.npy")
+
+    def digest(self, path: str | Path) -> str:
+        """
+        Return the hash of the content of the file at given path, computed
+        with :func:`aces.idt.hash_file` definition, and retain it.
+
+        The hash is retained along the file size and modification time so
+        that a file referenced by several frames, e.g., a video file, is only
+        read once, and is computed again if the file is modified.
+
+        Parameters
+        ----------
+        path
+            File path.
+
+        Returns
+        -------
+        :class:`str`
+            File content hash.
+        """
+
+        path = os.path.abspath(path)
+        statistics = os.stat(path)
+        signature = (statistics.st_size, statistics.st_mtime_ns)
+
+        signature_retained, digest = self._digests.get(path, (None, None))
+        if signature_retained != signature:
+            digest = hash_file(path)
+            self._digests[path] = (signature, digest)
+
+        return digest
+
+    @staticmethod
+    def key(
+        path: str | Path,
+        settings: Dict,
+        quadrilateral: ArrayLike,
+        digest: str | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Return the cache key of the frame at given path.
+
+        Parameters
+        ----------
+        path
+            Frame path.
+        settings
+            Segmentation settings.
+        quadrilateral
+            Quadrilateral of the colour checker the frame is sampled within.
+        digest
+            Hash of the frame content as returned by :func:`aces.idt.hash_file`
+            definition, e.g., retained by a :class:`aces.idt.DirectoryIndex`
+            or :class:`aces.idt.ZipArchiveReader` class instance, the frame is
+            hashed if not given.
+
+        Other Parameters
+        ----------------
+        kwargs
+            Any other option affecting the sampling, e.g., the frame read mode.
+
+        Returns
+        -------
+        :class:`str`
+            Cache key.
+        """
+
+        hasher = xxhash.xxh3_128()
+        hasher.update((digest or hash_file(str(path))).encode())
+        hasher.update(
+            json.dumps(
+                [dict(settings), kwargs], sort_keys=True, default=_serialise_value
+            ).encode()
+        )
+        hasher.update(np.asarray(quadrilateral, dtype=np.float64).tobytes())
+
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> NDArrayFloat | None:
+        """
+        Return the swatches colours stored with given key.
+
+        Parameters
+        ----------
+        key
+            Cache key.
+
+        Returns
+        -------
+        :class:`np.ndarray` or :py:data:`None`
+            Swatches colours or *None* if the cache does not store them.
+        """
+
+        path = self._path(key)
+
+        try:
+            swatch_colours = np.load(path)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            LOGGER.debug('Could not update "%s" cache entry access time.', path)
+
+        return swatch_colours
+
+    def set(self, key: str, swatch_colours: ArrayLike, evict: bool = True) -> None:
+        """
+        Store given swatches colours with given key and optionally evict the
+        least recently used entries if the cache exceeds its maximum size.
+
+        The entry is written to a temporary file that atomically replaces any
+        existing entry so that concurrent readers never see a partial entry.
+
+        Parameters
+        ----------
+        key
+            Cache key.
+        swatch_colours
+            Swatches colours to store.
+        evict
+            Whether to evict the least recently used entries, storing many
+            entries at once should evict only after the last one.
+        """
+
+        file_descriptor, path = tempfile.mkstemp(suffix=".tmp", dir=self._directory)
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                np.save(file, np.asarray(swatch_colours))
+
+            os.replace(path, self._path(key))
+        except OSError:
+            LOGGER.warning('Could not store "%s" cache entry!', key)
+
+            if os.path.exists(path):
+                os.remove(path)
+
+            return
+
+        if evict:
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Evict the least recently used entries until the cache size is lower
+        than its maximum size.
+        """
+
+        entries = []
+        for entry in os.scandir(self._directory):
+            if not entry.name.endswith(".npy"):
+                continue
+
+            try:
+                statistics = entry.stat()
+            except OSError:
+                continue
+
+            entries.append((statistics.st_mtime, statistics.st_size, entry.path))
+
+        size = sum(entry[1] for entry in entries)
+        for _mtime, entry_size, path in sorted(entries):
+            if size <= self._size:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+
+            size -= entry_size
+
+    def clear(self) -> None:
+        """Remove all the cache entries."""
+
+        for entry in os.scandir(self._directory):
+            if entry.name.endswith((".npy", ".tmp")):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    continue
+
+
+class ExtractionCache:
+    """
+    Define a persistent content-addressed cache storing the extracted *IDT*
+    archives.
+
+    The entries are directories keyed by the archive content hash so that
+    processing the same archive again reuses its extraction irrespective of
+    its path. The archive members are written atomically by the
+    :class:`aces.idt.ZipArchiveReader` class, an entry interrupted by a crash
+    thus only misses some members that are extracted the next time it is
+    used, and the stale temporary files are removed when the cache is
+    instantiated. The least recently used entries are evicted when the cache
+    exceeds its maximum size.
+
+    Parameters
+    ----------
+    directory
+        Directory storing the cache entries, created if it does not exist.
+    size
+        Maximum size in bytes of the cache entries.
+
+    Attributes
+    ----------
+    -   :attr:`~aces.idt.ExtractionCache.directory`
+    -   :attr:`~aces.idt.ExtractionCache.size`
+
+    Methods
+    -------
+    -   :meth:`~aces.idt.ExtractionCache.key`
+    -   :meth:`~aces.idt.ExtractionCache.entry`
+    -   :meth:`~aces.idt.ExtractionCache.extract`
+    -   :meth:`~aces.idt.ExtractionCache.evict`
+    -   :meth:`~aces.idt.ExtractionCache.clear`
+    """
+
+    def __init__(
+        self, directory: str | Path, size: int = SIZE_CACHE_EXTRACTION_DEFAULT
+    ) -> None:
+        self._directory = str(directory)
+        self._size = size
+
+        os.makedirs(self._directory, exist_ok=True)
+
+        self._remove_stale()
+
+    @property
+    def directory(self) -> str:
+        """
+        Getter property for the directory storing the cache entries.
+
+        Returns
+        -------
+        :class:`str`
+            Directory storing the cache entries.
+        """
+
+        return self._directory
+
+    @property
+    def size(self) -> int:
+        """
+        Getter property for the maximum size in bytes of the cache entries.
+
+        Returns
+        -------
+        :class:`int`
+            Maximum size in bytes of the cache entries.
+        """
+
+        return self._size
+
+    def _remove_stale(self) -> None:
+        """Remove the stale temporary files left by crashed processes."""
+
+        now = time.time()
+        for root, _directories, files in os.walk(self._directory):
+            for file in files:
+                if not file.endswith(".tmp"):
+                    continue
+
+                path = os.path.join(root, file)
+                try:
+                    if now - os.path.getmtime(path) > _AGE_TEMPORARY_STALE:
+                        LOGGER.debug('Removing "%s" stale temporary file...', path)
+                        os.remove(path)
+                except OSError:
+                    continue
+
+    @staticmethod
+    def key(archive: str | Path) -> str:
+        """
+        Return the cache key of given archive.
+
+        Parameters
+        ----------
+        archive
+            Archive *zip* file path.
+
+        Returns
+        -------
+        :class:`str`
+            Cache key.
+        """
+
+        return hash_file(str(archive))
+
+    def entry(self, archive: str | Path, key: str | None = None) -> str:
+        """
+        Return the directory of the cache entry of given archive, creating it
+        if it does not exist and marking it as the most recently used.
+
+        The archive members are not extracted, the directory can be given to
+        the :class:`aces.idt.ZipArchiveReader` class so that they are
+        extracted on demand.
+
+        Parameters
+        ----------
+        archive
+            Archive *zip* file path.
+        key
+            Cache key of the archive, computed if not given.
+
+        Returns
+        -------
+        :class:`str`
+            Cache entry directory.
+        """
+
+        path = os.path.join(self._directory, key or self.key(archive))
+
+        os.makedirs(path, exist_ok=True)
+        os.utime(path)
+
+        return path
+
+    def extract(self, archive: str | Path, key: str | None = None) -> str:
+        """
+        Extract given archive into its cache entry, only extracting the
+        members the entry does not store, and evict the least recently used
+        entries if the cache exceeds its maximum size.
+
+        Parameters
+        ----------
+        archive
+            Archive *zip* file path.
+        key
+            Cache key of the archive, computed if not given.
+
+        Returns
+        -------
+        :class:`str`
+            Cache entry directory.
+
+        Raises
+        ------
+        ValueError
+            If an archive member would be extracted outside of the cache entry,
+            see :class:`aces.idt.ZipArchiveReader` class.
+        """
+
+        path = self.entry(archive, key)
+
+        reader = ZipArchiveReader(archive, path)
+        try:
+            extracted = 0
+            for name in reader.names:
+                if not os.path.exists(os.path.join(path, name)):
+                    reader.extract(name)
+                    extracted += 1
+        finally:
+            reader.close()
+
+        LOGGER.info(
+            'Extracted %s of "%s" archive %s members to "%s".',
+            extracted,
+            archive,
+            len(reader.names),
+            path,
+        )
+
+        self.evict(os.path.basename(path))
+
+        return path
+
+    def evict(self, *exclude: str) -> None:
+        """
+        Evict the least recently used entries until the cache size is lower
+        than its maximum size.
+
+        The entries with a file or directory modified less than an hour ago
+        are considered in use, e.g., by another process materialising and
+        sampling their frames, and are not evicted.
+
+        Parameters
+        ----------
+        exclude
+            Keys of the entries that must not be evicted, e.g., those in use.
+        """
+
+        entries = []
+        for entry in os.scandir(self._directory):
+            if not entry.is_dir():
+                continue
+
+            with contextlib.suppress(OSError):
+                entries.append((*_stat_entry(entry.path), entry.name))
+
+        now = time.time()
+        size = sum(entry[1] for entry in entries)
+        for mtime, entry_size, name in sorted(entries):
+            if size <= self._size:
+                break
+
+            if name in exclude:
+                continue
+
+            if now - mtime < _AGE_ENTRY_IN_USE:
+                LOGGER.debug(
+                    'Not evicting "%s" extraction cache entry as it is in use.', name
+                )
+                continue
+
+            LOGGER.info('Evicting "%s" extraction cache entry...', name)
+
+            shutil.rmtree(os.path.join(self._directory, name), ignore_errors=True)
+
+            size -= entry_size
+
+    def clear(self) -> None:
+        """Remove all the cache entries."""
+
+        for entry in os.scandir(self._directory):
+            if entry.is_dir():
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    continue
@@ -15,10 +15,11 @@ import os
 import re
 import shutil
 import tempfile
+import threading
 import typing
 import unicodedata
 import xml.etree.ElementTree as ET
-from functools import partial
+from collections import OrderedDict
 from pathlib import Path
 
 import colour
@@ -27,15 +28,19 @@ import cv2
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+import scipy.ndimage
+import scipy.signal
 import scipy.stats
 import xxhash
 from colour import (
+    LUT1D,
     SDS_COLOURCHECKERS,
     SDS_ILLUMINANTS,
+    LUT3x1D,
     SpectralDistribution,
     sd_to_aces_relative_exposure_values,
 )
-from colour.algebra import euclidean_distance, vecmul
+from colour.algebra import euclidean_distance, sdiv, sdiv_mode, spow, vecmul
 from colour.characterisation import (
     optimisation_factory_Jzazbz,
     optimisation_factory_rawtoaces_v1,
@@ -48,6 +53,7 @@ if typing.TYPE_CHECKING:
         ArrayLike,
         Callable,
         Dict,
+        DTypeFloat,
         List,
         LiteralChromaticAdaptationTransform,
         NDArrayBoolean,
@@ -55,12 +61,19 @@ if typing.TYPE_CHECKING:
         NDArrayInt,
         Sequence,
         Tuple,
+        Type,
     )
 
 from colour.models import RGB_COLOURSPACE_ACES2065_1, XYZ_to_IPT, XYZ_to_Oklab
-from colour.utilities import as_float_array, as_int_array, zeros
-
-from aces.idt.core.constants import EXPOSURE_CLIPPING_THRESHOLD
+from colour.models.ipt import MATRIX_IPT_LMS_P_TO_IPT, MATRIX_IPT_XYZ_TO_LMS
+from colour.models.oklab import MATRIX_1_XYZ_TO_LMS, MATRIX_2_LMS_TO_LAB
+from colour.constants import DTYPE_FLOAT_DEFAULT
+from colour.utilities import as_float_array, as_int_array, optional, zeros
+
+from aces.idt.core.constants import (
+    EXPOSURE_CLIPPING_THRESHOLD,
+    SIZE_CACHE_COLORIMETRY_DEFAULT,
+)
 
 __author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
 __copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
@@ -78,8 +91,10 @@ __all__ = [
     "SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC",
     "generate_reference_colour_checker",
     "RGB_COLORCHECKER_CLASSIC_ACES",
+    "jacobian_factory_Iab",
     "optimisation_factory_Oklab",
     "optimisation_factory_IPT",
+    "generate_optimisation_targets",
     "error_delta_E",
     "png_compare_colour_checkers",
     "clf_processing_elements",
@@ -88,6 +103,8 @@ __all__ = [
     "list_sub_directories",
     "mask_outliers",
     "working_directory",
+    "SIZE_BUFFER_HASH",
+    "StreamingHasher",
     "hash_file",
     "extract_archive",
     "sort_exposure_keys",
@@ -96,6 +113,10 @@ __all__ = [
     "find_clipped_exposures",
     "create_colour_checker_image",
     "interpolate_nan_values",
+    "extrapolate_channels",
+    "RADIUS_KERNEL_FFT",
+    "filter_gaussian",
+    "apply_LUT_uniform",
     "calculate_camera_npm_and_primaries_wp",
 ]
 
@@ -179,6 +200,68 @@ SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC.update(
 )
 
 
+_CACHE_COLORIMETRY: OrderedDict = OrderedDict()
+"""
+Reference colour checker values and optimisation targets memoised in memory,
+the least recently used entries are evicted beyond
+:attr:`aces.idt.core.SIZE_CACHE_COLORIMETRY_DEFAULT` entries.
+"""
+
+_LOCK_CACHE_COLORIMETRY: threading.Lock = threading.Lock()
+"""Lock guarding the colorimetry cache accesses."""
+
+
+def _hash_colorimetry(*args: Any) -> str:
+    """
+    Hash given colorimetry arguments, i.e., spectral distributions, arrays and
+    hashable values, by content.
+    """
+
+    hasher = xxhash.xxh3_128()
+    for value in args:
+        if isinstance(value, SpectralDistribution):
+            hasher.update(value.domain.tobytes())
+            hasher.update(value.range.tobytes())
+        elif isinstance(value, np.ndarray):
+            hasher.update(repr((value.dtype.str, value.shape)).encode())
+            hasher.update(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value, tuple | list):
+            hasher.update(_hash_colorimetry(*value).encode())
+        else:
+            hasher.update(repr(value).encode())
+
+        hasher.update(b"\0")
+
+    return hasher.hexdigest()
+
+
+def _memoise_colorimetry(key: Any, function: Callable) -> NDArrayFloat:
+    """
+    Return the value memoised for given key or compute it with given function
+    and memoise it.
+
+    A copy of the memoised value is returned so that the callers can modify it
+    in-place.
+    """
+
+    with _LOCK_CACHE_COLORIMETRY:
+        value = _CACHE_COLORIMETRY.get(key)
+        if value is not None:
+            _CACHE_COLORIMETRY.move_to_end(key)
+
+            return np.copy(value)
+
+    value = as_float_array(function())
+
+    with _LOCK_CACHE_COLORIMETRY:
+        _CACHE_COLORIMETRY[key] = value
+        _CACHE_COLORIMETRY.move_to_end(key)
+        while len(_CACHE_COLORIMETRY) > SIZE_CACHE_COLORIMETRY_DEFAULT:
+            _CACHE_COLORIMETRY.popitem(last=False)
+
+    return np.copy(value)
+
+
 def generate_reference_colour_checker(
     sds: Tuple[SpectralDistribution] = SDS_COLORCHECKER_CLASSIC,
     illuminant: SpectralDistribution = SD_ILLUMINANT_ACES,
@@ -201,17 +284,27 @@ def generate_reference_colour_checker(
     -------
     :class:`np.ndarray`
         Reference *ACES* *RGB* values.
+
+    Notes
+    -----
+    -   The reference *ACES* *RGB* values are memoised by content of the
+        reflectances and illuminant spectral distributions, and chromatic
+        adaptation transform.
     """
 
-    return as_float_array(
-        [
+    return _memoise_colorimetry(
+        (
+            "reference_colour_checker",
+            _hash_colorimetry(sds, illuminant, chromatic_adaptation_transform),
+        ),
+        lambda: [
             sd_to_aces_relative_exposure_values(
                 sd,
                 illuminant,
                 chromatic_adaptation_transform=chromatic_adaptation_transform,
             )
             for sd in sds
-        ]
+        ],
     )
 
 
@@ -221,7 +314,88 @@ Reference *ACES* *RGB* values for the *ColorChecker Classic*.
 """
 
 
-def optimisation_factory_Oklab() -> Tuple[NDArrayFloat, Callable, Callable, Callable]:
+def jacobian_factory_Iab(
+    matrix_XYZ_to_LMS: ArrayLike, exponent: float, matrix_LMS_p_to_Iab: ArrayLike
+) -> Callable:
+    """
+    Produce the analytic Jacobian of the objective function of the
+    optimisation factories based on an *Iab* colour model, i.e., a matrix,
+    a power function and a matrix, e.g., the *Oklab* or *IPT* colourspaces.
+
+    The objective function is the sum of the Euclidean distances between the
+    training data *CIE XYZ* tristimulus values and the training data *RGB*
+    tristimulus values converted with the whitepoint preserving matrix, both
+    in the *Iab* colour model. Its gradient with respect to the 6 free matrix
+    coefficients is computed with a single backward pass over the training
+    data instead of the 7 objective function evaluations required by a
+    *2-point* finite differences approximation.
+
+    Parameters
+    ----------
+    matrix_XYZ_to_LMS
+        *CIE XYZ* colourspace to *LMS* colourspace matrix.
+    exponent
+        Exponent of the *LMS* colourspace non-linearity.
+    matrix_LMS_p_to_Iab
+        Non-linear *LMS* colourspace to *Iab* colour model matrix.
+
+    Returns
+    -------
+    Callable
+        Jacobian of the objective function.
+
+    Examples
+    --------
+    >>> from colour.models.oklab import MATRIX_1_XYZ_TO_LMS, MATRIX_2_LMS_TO_LAB
+    >>> jacobian_factory_Iab(
+    ...     MATRIX_1_XYZ_TO_LMS, 1 / 3, MATRIX_2_LMS_TO_LAB
+    ... )  # doctest: +SKIP
+    <function jacobian_factory_Iab.<locals>.jacobian_function at 0x...>
+    """
+
+    matrix_RGB_to_LMS = np.matmul(
+        matrix_XYZ_to_LMS, RGB_COLOURSPACE_ACES2065_1.matrix_RGB_to_XYZ
+    )
+    matrix_LMS_p_to_Iab = as_float_array(matrix_LMS_p_to_Iab)
+
+    def jacobian_function(
+        M: NDArrayFloat, RGB: NDArrayFloat, Jab: NDArrayFloat
+    ) -> NDArrayFloat:
+        """*Iab* colour model based objective function Jacobian."""
+
+        M = whitepoint_preserving_matrix(
+            np.hstack([np.reshape(M, (3, 2)), zeros((3, 1))])
+        )
+
+        LMS = vecmul(np.matmul(matrix_RGB_to_LMS, M), RGB)
+        LMS_p = spow(LMS, exponent)
+        Jab_t = vecmul(matrix_LMS_p_to_Iab, LMS_p)
+
+        # NOTE: The gradient is back-propagated from the distances to the
+        # whitepoint preserving matrix, the derivative of the power function
+        # is expressed as "exponent * LMS_p / LMS" so that it is zeroed rather
+        # than infinite where the *LMS* values are null, as are the gradients
+        # of the null distances.
+        with sdiv_mode():
+            gradient = sdiv(Jab_t - Jab, euclidean_distance(Jab, Jab_t)[..., None])
+            gradient = np.matmul(gradient, matrix_LMS_p_to_Iab)
+            gradient *= sdiv(LMS_p, LMS)
+            gradient *= exponent
+
+        gradient = np.matmul(np.transpose(np.matmul(gradient, matrix_RGB_to_LMS)), RGB)
+
+        # The last column of the whitepoint preserving matrix is "1 - M_0 - M_1".
+        return np.ravel(gradient[:, :2] - gradient[:, 2:])
+
+    return jacobian_function
+
+
+def optimisation_factory_Oklab(
+    jacobian: bool = False,
+) -> (
+    Tuple[NDArrayFloat, Callable, Callable, Callable]
+    | Tuple[NDArrayFloat, Callable, Callable, Callable, Callable]
+):
     """
     Produce the objective function and *CIE XYZ* colourspace to optimisation
     colourspace/colour model function based on the *Oklab* colourspace.
@@ -230,11 +404,18 @@ def optimisation_factory_Oklab() -> Tuple[NDArrayFloat, Callable, Callable, Call
     data *RGB* tristimulus values and the training data *CIE XYZ* tristimulus
     values** in the *Oklab* colourspace.
 
+    Parameters
+    ----------
+    jacobian
+        Whether to also return the analytic Jacobian of the objective function,
+        see :func:`aces.idt.core.jacobian_factory_Iab` definition.
+
     Returns
     -------
     :class:`tuple`
         :math:`x_0` initial values, objective function, *CIE XYZ* colourspace
-        to *Oklab* colourspace function and finaliser function.
+        to *Oklab* colourspace function, finaliser function and, if
+        requested, Jacobian of the objective function.
 
     Examples
     --------
@@ -276,6 +457,15 @@ finaliser_function at 0x...>)
             np.hstack([np.reshape(M, (3, 2)), zeros((3, 1))])
         )
 
+    if jacobian:
+        return (
+            x_0,
+            objective_function,
+            XYZ_to_optimization_colour_model,
+            finaliser_function,
+            jacobian_factory_Iab(MATRIX_1_XYZ_TO_LMS, 1 / 3, MATRIX_2_LMS_TO_LAB),
+        )
+
     return (
         x_0,
         objective_function,
@@ -284,7 +474,12 @@ finaliser_function at 0x...>)
     )
 
 
-def optimisation_factory_IPT() -> Tuple[NDArrayFloat, Callable, Callable, Callable]:
+def optimisation_factory_IPT(
+    jacobian: bool = False,
+) -> (
+    Tuple[NDArrayFloat, Callable, Callable, Callable]
+    | Tuple[NDArrayFloat, Callable, Callable, Callable, Callable]
+):
     """
     Produce the objective function and *CIE XYZ* colourspace to optimisation
     colourspace/colour model function based on the *IPT* colourspace.
@@ -293,11 +488,18 @@ def optimisation_factory_IPT() -> Tuple[NDArrayFloat, Callable, Callable, Callab
     data *RGB* tristimulus values and the training data *CIE XYZ* tristimulus
     values** in the *IPT* colourspace.
 
+    Parameters
+    ----------
+    jacobian
+        Whether to also return the analytic Jacobian of the objective function,
+        see :func:`aces.idt.core.jacobian_factory_Iab` definition.
+
     Returns
     -------
     :class:`tuple`
         :math:`x_0` initial values, objective function, *CIE XYZ* colourspace
-        to *IPT* colourspace function and finaliser function.
+        to *IPT* colourspace function, finaliser function and, if
+        requested, Jacobian of the objective function.
 
     Examples
     --------
@@ -339,6 +541,15 @@ finaliser_function at 0x...>)
             np.hstack([np.reshape(M, (3, 2)), zeros((3, 1))])
         )
 
+    if jacobian:
+        return (
+            x_0,
+            objective_function,
+            XYZ_to_optimization_colour_model,
+            finaliser_function,
+            jacobian_factory_Iab(MATRIX_IPT_XYZ_TO_LMS, 0.43, MATRIX_IPT_LMS_P_TO_IPT),
+        )
+
     return (
         x_0,
         objective_function,
@@ -347,6 +558,61 @@ finaliser_function at 0x...>)
     )
 
 
+def generate_optimisation_targets(
+    training_data: ArrayLike, optimisation_factory: Callable
+) -> NDArrayFloat:
+    """
+    Generate the optimisation targets, i.e., the training data *ACES* *RGB*
+    values converted to the optimisation colourspace/colour model of given
+    optimisation factory.
+
+    Parameters
+    ----------
+    training_data
+        Training data *ACES* *RGB* values.
+    optimisation_factory
+        Optimisation factory, e.g.,
+        :func:`aces.idt.optimisation_factory_Oklab` definition.
+
+    Returns
+    -------
+    :class:`np.ndarray`
+        Optimisation targets.
+
+    Notes
+    -----
+    -   The optimisation targets are memoised by content of the training data
+        and optimisation factory.
+
+    Examples
+    --------
+    >>> generate_optimisation_targets(
+    ...     RGB_COLORCHECKER_CLASSIC_ACES, optimisation_factory_Oklab
+    ... )[0]  # doctest: +ELLIPSIS
+    array([ 0.4...,  0.0...,  0.0...])
+    """
+
+    training_data = as_float_array(training_data)
+
+    def generate() -> NDArrayFloat:
+        """Generate the optimisation targets."""
+
+        XYZ_to_optimization_colour_model = optimisation_factory()[2]
+
+        return XYZ_to_optimization_colour_model(
+            vecmul(RGB_COLOURSPACE_ACES2065_1.matrix_RGB_to_XYZ, training_data)
+        )
+
+    return _memoise_colorimetry(
+        (
+            "optimisation_targets",
+            _hash_colorimetry(training_data),
+            optimisation_factory,
+        ),
+        generate,
+    )
+
+
 def error_delta_E(
     samples_test: ArrayLike, samples_reference: ArrayLike
 ) -> NDArrayFloat:
@@ -650,6 +916,10 @@ def working_directory(directory: str) -> None:
     Define a context manager that temporarily sets the current working
     directory.
 
+    The current working directory is a process-global state, the context
+    manager must not be used where several threads may resolve relative
+    paths, e.g., when sampling, which resolves them explicitly instead.
+
     Parameters
     ----------
     directory
@@ -664,10 +934,146 @@ def working_directory(directory: str) -> None:
         os.chdir(current_working_directory)
 
 
+SIZE_BUFFER_HASH: int = 2**24
+"""
+Size in bytes of the buffer the files are read with when hashed, and default
+maximum size of the chunks a :class:`StreamingHasher` class instance retains.
+"""
+
+
+class StreamingHasher:
+    """
+    Define a hasher fed incrementally with the chunks of a file, e.g., as they
+    are uploaded, whose digest is the one :func:`hash_file` definition returns
+    for the file.
+
+    The chunks can be given out of order along their offset in the file,
+    those ahead of the data hashed so far are retained until the data
+    preceding them is given. If the retained chunks exceed given buffer size,
+    the hasher gives up so that its memory is bounded, and the digest must be
+    computed with :func:`hash_file` definition instead.
+
+    Parameters
+    ----------
+    size_buffer
+        Maximum size in bytes of the retained out of order chunks.
+
+    Attributes
+    ----------
+    -   :attr:`~aces.idt.StreamingHasher.size`
+
+    Methods
+    -------
+    -   :meth:`~aces.idt.StreamingHasher.update`
+    -   :meth:`~aces.idt.StreamingHasher.hexdigest`
+    """
+
+    def __init__(self, size_buffer: int = SIZE_BUFFER_HASH) -> None:
+        self._hasher = xxhash.xxh3_64()
+        self._size = 0
+        self._size_buffer = size_buffer
+
+        self._chunks = {}
+        self._size_chunks = 0
+        self._overflow = False
+
+        # The chunks of an upload can be received by concurrent threads.
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """
+        Getter property for the size in bytes of the contiguous data hashed
+        so far.
+
+        Returns
+        -------
+        :class:`int`
+            Size in bytes of the contiguous data hashed so far.
+        """
+
+        return self._size
+
+    def update(self, data: bytes | memoryview, offset: int | None = None) -> None:
+        """
+        Update the hasher with given chunk.
+
+        Parameters
+        ----------
+        data
+            Chunk data.
+        offset
+            Chunk offset in the file, the chunk is assumed to follow the data
+            hashed so far if not given. Chunks preceding the data hashed so
+            far, e.g., re-sent chunks, are ignored.
+        """
+
+        with self._lock:
+            if offset is None:
+                offset = self._size
+
+            if self._overflow or offset < self._size:
+                return
+
+            if offset > self._size:
+                if offset in self._chunks:
+                    return
+
+                if self._size_chunks + len(data) > self._size_buffer:
+                    LOGGER.debug(
+                        "Out of order chunks exceed the hasher buffer, the "
+                        "digest must be computed from the file."
+                    )
+                    self._overflow = True
+                    self._chunks.clear()
+
+                    return
+
+                self._chunks[offset] = bytes(data)
+                self._size_chunks += len(data)
+
+                return
+
+            while data is not None:
+                self._hasher.update(data)
+                self._size += len(data)
+
+                data = self._chunks.pop(self._size, None)
+                if data is not None:
+                    self._size_chunks -= len(data)
+
+    def hexdigest(self, size: int | None = None) -> str | None:
+        """
+        Return the digest of the data hashed so far.
+
+        Parameters
+        ----------
+        size
+            Expected size in bytes of the hashed data, e.g., the file size,
+            *None* is returned if it differs from the size of the data hashed
+            so far.
+
+        Returns
+        -------
+        :class:`str` or :py:data:`None`
+            Digest or *None* if the hasher gave up or has not hashed the
+            expected size.
+        """
+
+        with self._lock:
+            if self._overflow or (size is not None and size != self._size):
+                return None
+
+            return self._hasher.hexdigest()
+
+
 def hash_file(path: str) -> str:
     """
     Hash the file a given path.
 
+    The file is read with a buffer of :attr:`SIZE_BUFFER_HASH` bytes reused
+    across the reads.
+
     Parameters
     ----------
     path
@@ -679,12 +1085,15 @@ def hash_file(path: str) -> str:
         File hash.
     """
 
+    hasher = StreamingHasher()
+
+    buffer = bytearray(SIZE_BUFFER_HASH)
+    view = memoryview(buffer)
     with open(path, "rb") as input_file:
-        x = xxhash.xxh3_64()
-        for chunk in iter(partial(input_file.read, 2**32), b""):
-            x.update(chunk)
+        while size := input_file.readinto(buffer):
+            hasher.update(view[:size])
 
-        return x.hexdigest()
+    return hasher.hexdigest()
 
 
 def extract_archive(archive: str, directory: None | str = None) -> str:
@@ -951,6 +1360,241 @@ def interpolate_nan_values(array: ArrayLike) -> NDArrayFloat:
     return np.where(np.isnan(array), interpolated_df.to_numpy(), array)
 
 
+def extrapolate_channels(
+    x: ArrayLike, y: ArrayLike, samples: ArrayLike
+) -> Tuple[NDArrayFloat, NDArrayFloat]:
+    """
+    Linearly interpolate the channels of given :math:`x` and :math:`y` arrays
+    at given samples, the samples outside the :math:`x` range being
+    both linearly and constant extrapolated.
+
+    The output is equivalent to evaluating
+    ``Extrapolator(LinearInterpolator(x[..., i], y[..., i]))`` with the
+    *Linear* and *Constant* methods for each channel but the channels are
+    processed at once.
+
+    Parameters
+    ----------
+    x
+        Independent variable values of shape (n, c), e.g., camera samples.
+    y
+        Dependent variable values of shape (n, c), e.g., reference samples.
+    samples
+        Samples of shape (m, ) to evaluate the channels at.
+
+    Returns
+    -------
+    :class:`tuple`
+        Linearly and constant extrapolated channels of shape (m, c).
+
+    Examples
+    --------
+    >>> x = np.array([[1.0, 2.0], [3.0, 4.0]])
+    >>> y = np.array([[1.0, 2.0], [2.0, 4.0]])
+    >>> linear, constant = extrapolate_channels(x, y, np.arange(6))
+    >>> linear[..., 0]
+    array([ 0.5,  1. ,  1.5,  2. ,  2.5,  3. ])
+    >>> constant[..., 1]
+    array([ 2.,  2.,  2.,  3.,  4.,  4.])
+    """
+
+    # The channels are processed along the last axis so that the operations
+    # are performed on contiguous memory.
+    x = np.transpose(as_float_array(x))
+    y = np.transpose(as_float_array(y))
+    samples = as_float_array(samples)
+
+    # *np.interp* returns the first and last values outside the range, i.e.,
+    # the constant extrapolation, it is faster than any gather based vectorised
+    # equivalent.
+    samples_constant = np.array(
+        [np.interp(samples, x[i], y[i]) for i in range(x.shape[0])]
+    )
+
+    x_0, x_1 = x[..., :1], x[..., -1:]
+    y_0, y_1 = y[..., :1], y[..., -1:]
+
+    with sdiv_mode():
+        slope_left = sdiv(y[..., 1:2] - y_0, x[..., 1:2] - x_0)
+        slope_right = sdiv(y_1 - y[..., -2:-1], x_1 - x[..., -2:-1])
+
+    samples_linear = np.where(
+        samples < x_0, y_0 + (samples - x_0) * slope_left, samples_constant
+    )
+    samples_linear = np.where(
+        samples > x_1, y_1 + (samples - x_1) * slope_right, samples_linear
+    )
+
+    samples_linear, samples_constant = (
+        np.transpose(samples_linear),
+        np.transpose(samples_constant),
+    )
+
+    return samples_linear, samples_constant
+
+
+RADIUS_KERNEL_FFT: int = 64
+"""
+Gaussian kernel radius above which :func:`filter_gaussian` definition
+convolves in the frequency domain, the direct convolution cost growing
+linearly with the radius.
+"""
+
+
+def filter_gaussian(
+    array: ArrayLike, sigma: float, axis: int = -1, truncate: float = 4.0
+) -> NDArrayFloat:
+    """
+    Filter given array along given axis with a gaussian kernel, all the other
+    axes, e.g., the channels, being filtered at once.
+
+    The output is equivalent to :func:`scipy.ndimage.gaussian_filter1d`
+    definition with the *reflect* mode. When the kernel radius is larger than
+    :attr:`aces.idt.core.RADIUS_KERNEL_FFT` attribute and the array values
+    are finite, the array is reflect padded and convolved with the same kernel
+    using overlap-add *FFT* convolution whose cost barely depends on the
+    radius.
+
+    Parameters
+    ----------
+    array
+        Array to filter.
+    sigma
+        Standard deviation of the gaussian kernel.
+    axis
+        Axis to filter along.
+    truncate
+        Kernel truncation in standard deviations.
+
+    Returns
+    -------
+    :class:`np.ndarray`
+        Filtered array.
+
+    Examples
+    --------
+    >>> array = np.zeros([2, 1024])
+    >>> array[..., 512] = 1
+    >>> np.allclose(
+    ...     filter_gaussian(array, 32),
+    ...     scipy.ndimage.gaussian_filter1d(array, 32),
+    ... )
+    True
+    """
+
+    array = as_float_array(array)
+
+    radius = int(truncate * float(sigma) + 0.5)
+
+    # The non-finite values would spread over the whole axis in the frequency
+    # domain rather than over the kernel radius.
+    if radius <= RADIUS_KERNEL_FFT or not np.all(np.isfinite(array)):
+        return scipy.ndimage.gaussian_filter1d(
+            array, sigma, axis=axis, truncate=truncate
+        )
+
+    kernel = np.exp(-0.5 / (sigma * sigma) * np.arange(-radius, radius + 1) ** 2)
+    kernel = np.expand_dims(
+        kernel / np.sum(kernel),
+        [i for i in range(array.ndim) if i != axis % array.ndim],
+    )
+
+    padding = [(0, 0)] * array.ndim
+    padding[axis] = (radius, radius)
+
+    # The *reflect* mode of :mod:`scipy.ndimage` module is the *symmetric*
+    # mode of :func:`np.pad` definition.
+    return scipy.signal.oaconvolve(
+        np.pad(array, padding, mode="symmetric"), kernel, mode="valid", axes=axis
+    )
+
+
+def apply_LUT_uniform(
+    LUT: LUT1D | LUT3x1D, RGB: ArrayLike, dtype: Type[DTypeFloat] | None = None
+) -> NDArrayFloat:
+    """
+    Apply given uniformly spaced *LUT1D* or *LUT3x1D* class instance to given
+    *RGB* colourspace array with direct index arithmetic and linear blending.
+
+    The output is equivalent to the :meth:`colour.LUT1D.apply` and
+    :meth:`colour.LUT3x1D.apply` methods with their default linear
+    interpolator and extrapolator but it avoids building the interpolators
+    and masking the values on each call. The *LUT* class instances with an
+    explicit domain are applied with their :meth:`apply` method.
+
+    Parameters
+    ----------
+    LUT
+        *LUT1D* or *LUT3x1D* class instance to apply.
+    RGB
+        *RGB* colourspace array of any shape, its last dimension must be 3 for
+        a *LUT3x1D* class instance.
+    dtype
+        Floating point data type the *LUT* is applied with, e.g.,
+        :class:`np.float32` to halve the memory traffic of large images.
+
+    Returns
+    -------
+    :class:`np.ndarray`
+        *RGB* colourspace array with the *LUT* applied.
+
+    Examples
+    --------
+    >>> LUT = LUT1D(LUT1D.linear_table(5) ** 2)
+    >>> apply_LUT_uniform(LUT, np.array([0.1, 0.5, 1.25]))
+    array([ 0.025 ,  0.25  ,  1.4375])
+    """
+
+    if LUT.is_domain_explicit():
+        return as_float_array(LUT.apply(RGB), dtype)
+
+    dtype = optional(dtype, DTYPE_FLOAT_DEFAULT)
+
+    RGB = as_float_array(RGB, dtype)
+    table = as_float_array(LUT.table, dtype)
+    domain = as_float_array(LUT.domain, dtype)
+
+    size = table.shape[0]
+
+    index = RGB - domain[0]
+    index *= (size - 1) / (domain[1] - domain[0])
+
+    # The values outside the domain are blended with the first and last
+    # segments, i.e., linearly extrapolated.
+    index_lower = np.clip(np.floor(index), 0, size - 2)
+    index -= index_lower
+
+    # *NaN* values are cast to an arbitrary index, the gathering is clipped
+    # and they stay *NaN* through the blending weight.
+    with np.errstate(invalid="ignore"):
+        index_lower = index_lower.astype(np.intp)
+
+    # The *LUT3x1D* class instance table is gathered as a flat view whose
+    # channels are either contiguous or interleaved depending on its memory
+    # layout, offsetting the indices in-place is much faster than
+    # broadcasting the offsets over the last dimension.
+    step = 1
+    if table.ndim == 2:
+        if table.flags.f_contiguous:
+            table, offset = np.transpose(table), size
+        else:
+            step, offset = 3, 1
+            index_lower *= step
+        for i in range(1, 3):
+            index_lower[..., i] += i * offset
+
+    table = np.ravel(table)
+
+    RGB = np.take(table, index_lower, mode="clip")
+    index_lower += step
+    table_upper = np.take(table, index_lower, mode="clip")
+    table_upper -= RGB
+    table_upper *= index
+    RGB += table_upper
+
+    return RGB
+
+
 def calculate_camera_npm_and_primaries_wp(
     input_matrix: np.array,
     target_white_point: str = "D65",
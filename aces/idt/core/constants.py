@@ -25,6 +25,10 @@ __status__ = "Production"
 
 __all__ = [
     "EXPOSURE_CLIPPING_THRESHOLD",
+    "SIZE_CACHE_SAMPLES_DEFAULT",
+    "SIZE_CACHE_EXTRACTION_DEFAULT",
+    "SIZE_CACHE_COLORIMETRY_DEFAULT",
+    "TOLERANCE_EARLY_STOP_DEFAULT",
     "DirectoryStructure",
     "UITypes",
     "UICategories",
@@ -43,6 +47,24 @@ The threshold for determining if RGB values are clipped. The threshold is
 2 code values in a 10 bit system
 """
 
+SIZE_CACHE_SAMPLES_DEFAULT: int = 2**28
+"""Default maximum size in bytes of the frame samples cache."""
+
+SIZE_CACHE_EXTRACTION_DEFAULT: int = 2**34
+"""Default maximum size in bytes of the archives extraction cache."""
+
+SIZE_CACHE_COLORIMETRY_DEFAULT: int = 32
+"""
+Default maximum count of reference colour checker values and optimisation
+targets memoised in memory.
+"""
+
+TOLERANCE_EARLY_STOP_DEFAULT: float = 1e-3
+"""
+Default relative tolerance the robust estimate of the swatches colours of an
+exposure must be stable within for the sampling to stop early.
+"""
+
 
 class DirectoryStructure:
     """Constants for the directory names which compose the data structure."""
@@ -64,6 +86,7 @@ class UITypes:
     BOOLEAN_FIELD: ClassVar[str] = "BooleanField"
     ARRAY_FIELD: ClassVar[str] = "ArrayField"
     MAP_FIELD: ClassVar[str] = "MapField"
+    FLOAT_FIELD: ClassVar[str] = "FloatField"
 
 
 class UICategories:
@@ -471,6 +494,119 @@ class ProjectSettingsMetadataConstants:
         ui_category=UICategories.STANDARD,
     )
 
+    SAMPLING_WORKERS = Metadata(
+        name="sampling_workers",
+        default_value=1,
+        description="Number of worker processes used to sample the images, a "
+        "value lower than 1 uses all the available CPU cores",
+        display_name="Sampling Workers",
+        ui_type=UITypes.INT_FIELD,
+        ui_category=UICategories.HIDDEN,
+    )
+
+    SAMPLING_PREFETCH = Metadata(
+        name="sampling_prefetch",
+        default_value=2,
+        description="Number of frames read and decoded ahead of the sampling, a "
+        "value lower than 1 disables the prefetching",
+        display_name="Sampling Prefetch",
+        ui_type=UITypes.INT_FIELD,
+        ui_category=UICategories.HIDDEN,
+    )
+
+    SAMPLING_REGION_OF_INTEREST = Metadata(
+        name="sampling_region_of_interest",
+        default_value=False,
+        description="Whether to only decode the frames region covering the colour "
+        "checker detected in the baseline exposure frame",
+        display_name="Sampling Region of Interest",
+        ui_type=UITypes.BOOLEAN_FIELD,
+        ui_category=UICategories.HIDDEN,
+    )
+
+    SAMPLING_REDUCED_RESOLUTION = Metadata(
+        name="sampling_reduced_resolution",
+        default_value=False,
+        description="Whether to decode the frames directly at the working "
+        "resolution, using their embedded MIP levels when present",
+        display_name="Sampling Reduced Resolution",
+        ui_type=UITypes.BOOLEAN_FIELD,
+        ui_category=UICategories.HIDDEN,
+    )
+
+    SAMPLING_CACHE_DIRECTORY = Metadata(
+        name="sampling_cache_directory",
+        default_value="",
+        description="Directory of the persistent frame samples cache, an empty "
+        "value disables the cache",
+        display_name="Sampling Cache Directory",
+        ui_type=UITypes.STRING_FIELD,
+        ui_category=UICategories.HIDDEN,
+    )
+
+    SAMPLING_CACHE_SIZE = Metadata(
+        name="sampling_cache_size",
+        default_value=SIZE_CACHE_SAMPLES_DEFAULT,
+        description="Maximum size in bytes of the persistent frame samples cache, "
+        "the least recently used samples are evicted beyond it",
+        display_name="Sampling Cache Size",
+        ui_type=UITypes.INT_FIELD,
+        ui_category=UICategories.HIDDEN,
+    )
+
+    SAMPLING_SWATCH_INDEX = Metadata(
+        name="sampling_swatch_index",
+        default_value=False,
+        description="Whether to gather the swatches colours of the frames with a "
+        "swatch index computed once per archive instead of warping "
+        "each frame.",
+        display_name="Sampling Swatch Index",
+        ui_type=UITypes.BOOLEAN_FIELD,
+        ui_category=UICategories.HIDDEN,
+    )
+
+    SAMPLING_EARLY_STOP = Metadata(
+        name="sampling_early_stop",
+        default_value=False,
+        description="Whether to stop sampling the frames of an exposure once the "
+        "robust estimate of the swatches colours is stable.",
+        display_name="Sampling Early Stop",
+        ui_type=UITypes.BOOLEAN_FIELD,
+        ui_category=UICategories.HIDDEN,
+    )
+
+    SAMPLING_EARLY_STOP_TOLERANCE = Metadata(
+        name="sampling_early_stop_tolerance",
+        default_value=TOLERANCE_EARLY_STOP_DEFAULT,
+        description="Relative tolerance the robust estimate of the swatches "
+        "colours of an exposure must be stable within to stop "
+        "sampling early.",
+        display_name="Sampling Early Stop Tolerance",
+        ui_type=UITypes.FLOAT_FIELD,
+        ui_category=UICategories.HIDDEN,
+    )
+
+    SAMPLING_VIDEO_FRAMES = Metadata(
+        name="sampling_video_frames",
+        default_value=10,
+        description="Number of frames sampled from each video file, evenly "
+        "spaced across it, a value lower than 1 samples every frame",
+        display_name="Sampling Video Frames",
+        ui_type=UITypes.INT_FIELD,
+        ui_category=UICategories.HIDDEN,
+    )
+
+    SAMPLING_DUPLICATE_FRAMES = Metadata(
+        name="sampling_duplicate_frames",
+        default_value=False,
+        description="Whether to detect the frames with the same content so that "
+        "they are only sampled once, the duplicate frames of an exposure being "
+        "excluded from its samples.",
+        display_name="Sampling Duplicate Frames",
+        ui_type=UITypes.BOOLEAN_FIELD,
+        ui_category=UICategories.HIDDEN,
+    )
+
     ALL: ClassVar[tuple[Metadata, ...]] = (
         SCHEMA_VERSION,
         CAMERA_MAKE,
@@ -505,4 +641,15 @@ class ProjectSettingsMetadataConstants:
         INCLUDE_WHITE_BALANCE_IN_CLF,
         FLATTEN_CLF,
         INCLUDE_EXPOSURE_FACTOR_IN_CLF,
+        SAMPLING_WORKERS,
+        SAMPLING_PREFETCH,
+        SAMPLING_REGION_OF_INTEREST,
+        SAMPLING_REDUCED_RESOLUTION,
+        SAMPLING_CACHE_DIRECTORY,
+        SAMPLING_CACHE_SIZE,
+        SAMPLING_SWATCH_INDEX,
+        SAMPLING_EARLY_STOP,
+        SAMPLING_EARLY_STOP_TOLERANCE,
+        SAMPLING_VIDEO_FRAMES,
+        SAMPLING_DUPLICATE_FRAMES,
     )
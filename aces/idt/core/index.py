@@ -0,0 +1,590 @@
+"""
+Index
+=====
+
+Define the objects indexing the files of an *IDT* capture directory in a
+single pass so that it does not have to be walked again, e.g., to build the
+project settings and then verify them, and finding the duplicate frames of an
+*IDT* capture.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import typing
+from collections import defaultdict
+from pathlib import Path
+
+import xxhash
+
+if typing.TYPE_CHECKING:
+    from colour.hints import Any, Dict, List, Sequence, Tuple
+
+    from aces.idt.core.archive import ZipArchiveReader
+
+from aces.idt.core.common import hash_file
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "FILENAME_INDEX_DIRECTORY",
+    "DirectoryIndex",
+    "find_duplicate_frames",
+]
+
+LOGGER = logging.getLogger(__name__)
+
+FILENAME_INDEX_DIRECTORY: str = ".idt_index.json"
+"""File name of the persisted index of a directory, stored in it."""
+
+_VERSION_INDEX_DIRECTORY: int = 1
+"""Version of the persisted directory index format."""
+
+_SIZE_FINGERPRINT_CONTENT: int = 2**16
+"""
+Size in bytes of the content read at the start and end of a file to compute
+its fingerprint.
+"""
+
+
+class DirectoryIndex:
+    """
+    Define an index of the files and sub-directories of a directory, with the
+    size and modification time of the files, built with a single
+    :func:`os.scandir` definition pass.
+
+    The index exposes the same accessors as the
+    :class:`aces.idt.ZipArchiveReader` class, i.e., testing whether a path
+    exists and listing a directory, so that they do not access the disk again.
+
+    The index can be persisted as a small *JSON* file in the directory and
+    loaded instead of walking the directory again. The modification times of
+    the directories are recorded, the index is considered stale, and the
+    directory walked again, if any of them changed, i.e., if an entry was
+    added, removed or renamed. Only the directories are stated to validate the
+    index, modifying the content of a file in place is thus not detected.
+
+    The content hashes of the files are computed on demand, retained and
+    persisted along the index.
+
+    Parameters
+    ----------
+    directory
+        Directory to index.
+    files
+        Size and modification time in nanoseconds of the indexed files,
+        keyed by their path relative to the directory, the directory is
+        scanned if not given.
+    directories
+        Modification time in nanoseconds of the indexed directories, keyed by
+        their path relative to the directory, the directory itself being keyed
+        by an empty string.
+    digests
+        Content hashes of the indexed files, keyed by their path relative to
+        the directory.
+
+    Attributes
+    ----------
+    -   :attr:`~aces.idt.DirectoryIndex.directory`
+    -   :attr:`~aces.idt.DirectoryIndex.files`
+    -   :attr:`~aces.idt.DirectoryIndex.directories`
+
+    Methods
+    -------
+    -   :meth:`~aces.idt.DirectoryIndex.scan`
+    -   :meth:`~aces.idt.DirectoryIndex.from_directory`
+    -   :meth:`~aces.idt.DirectoryIndex.save`
+    -   :meth:`~aces.idt.DirectoryIndex.is_stale`
+    -   :meth:`~aces.idt.DirectoryIndex.member`
+    -   :meth:`~aces.idt.DirectoryIndex.exists`
+    -   :meth:`~aces.idt.DirectoryIndex.is_dir`
+    -   :meth:`~aces.idt.DirectoryIndex.iterdir`
+    -   :meth:`~aces.idt.DirectoryIndex.size`
+    -   :meth:`~aces.idt.DirectoryIndex.mtime`
+    -   :meth:`~aces.idt.DirectoryIndex.fingerprint`
+    -   :meth:`~aces.idt.DirectoryIndex.digest`
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        files: Dict[str, Tuple[int, int]] | None = None,
+        directories: Dict[str, int] | None = None,
+        digests: Dict[str, str] | None = None,
+    ) -> None:
+        self._directory = str(directory)
+
+        if files is None:
+            files, directories = self._scan(self._directory)
+
+        self._files = dict(files)
+        self._directories = dict(directories or {})
+        self._digests = {
+            path: digest
+            for path, digest in (digests or {}).items()
+            if path in self._files
+        }
+        self._fingerprints = {}
+
+        self._children = {}
+        for path in sorted((set(self._directories) - {""}) | set(self._files)):
+            self._children.setdefault(os.path.dirname(path), []).append(path)
+
+    @staticmethod
+    def _scan(
+        directory: str,
+    ) -> Tuple[Dict[str, Tuple[int, int]], Dict[str, int]]:
+        """Scan given directory recursively in a single pass."""
+
+        LOGGER.debug('Indexing "%s" directory...', directory)
+
+        # The modification time of a directory is stated before it is listed
+        # so that any entry changed while scanning marks the index stale.
+        files = {}
+        directories = {"": os.stat(directory).st_mtime_ns}
+        stack = [""]
+        while stack:
+            relative_directory = stack.pop()
+            with os.scandir(os.path.join(directory, relative_directory)) as entries:
+                for entry in entries:
+                    path = os.path.join(relative_directory, entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        directories[path] = entry.stat(
+                            follow_symlinks=False
+                        ).st_mtime_ns
+                        stack.append(path)
+                    elif path != FILENAME_INDEX_DIRECTORY:
+                        stat = entry.stat()
+                        files[path] = (stat.st_size, stat.st_mtime_ns)
+
+        return files, directories
+
+    @property
+    def directory(self) -> str:
+        """
+        Getter property for the indexed directory.
+
+        Returns
+        -------
+        :class:`str`
+            Indexed directory.
+        """
+
+        return self._directory
+
+    @property
+    def files(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Getter property for the size and modification time in nanoseconds of
+        the indexed files, keyed by their path relative to the directory.
+
+        Returns
+        -------
+        :class:`dict`
+            Size and modification time of the indexed files.
+        """
+
+        return self._files
+
+    @property
+    def directories(self) -> List[str]:
+        """
+        Getter property for the paths of the indexed sub-directories relative
+        to the directory.
+
+        Returns
+        -------
+        :class:`list`
+            Paths of the indexed sub-directories.
+        """
+
+        return sorted(set(self._directories) - {""})
+
+    @classmethod
+    def scan(cls, directory: str | Path) -> DirectoryIndex:
+        """
+        Index given directory by walking it.
+
+        Parameters
+        ----------
+        directory
+            Directory to index.
+
+        Returns
+        -------
+        :class:`DirectoryIndex`
+            Directory index.
+        """
+
+        return cls(directory)
+
+    @classmethod
+    def from_directory(
+        cls, directory: str | Path, persist: bool = False
+    ) -> DirectoryIndex:
+        """
+        Load the index persisted in given directory if it is not stale, or
+        index the directory otherwise.
+
+        The content hashes of a stale index are retained for the files whose
+        size and modification time did not change.
+
+        Parameters
+        ----------
+        directory
+            Directory to index.
+        persist
+            Whether to persist the index in the directory when it had to be
+            walked.
+
+        Returns
+        -------
+        :class:`DirectoryIndex`
+            Directory index.
+        """
+
+        path = os.path.join(directory, FILENAME_INDEX_DIRECTORY)
+
+        index_persisted = None
+        try:
+            with open(path) as index_file:
+                data = json.load(index_file)
+
+            if data["version"] == _VERSION_INDEX_DIRECTORY:
+                index_persisted = cls(
+                    directory,
+                    {name: tuple(value) for name, value in data["files"].items()},
+                    data["directories"],
+                    data.get("digests"),
+                )
+
+                if not index_persisted.is_stale():
+                    LOGGER.debug('Loaded "%s" directory index.', path)
+
+                    return index_persisted
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        files, directories = cls._scan(str(directory))
+        digests = None
+        if index_persisted is not None:
+            digests = {
+                name: digest
+                for name, digest in index_persisted._digests.items()
+                if files.get(name) == index_persisted.files.get(name)
+            }
+
+        index = cls(directory, files, directories, digests)
+
+        if persist:
+            index.save()
+
+        return index
+
+    def save(self) -> str:
+        """
+        Persist the index in the directory.
+
+        Returns
+        -------
+        :class:`str`
+            Index file path.
+        """
+
+        path = os.path.join(self._directory, FILENAME_INDEX_DIRECTORY)
+
+        # Creating the index file modifies the directory, its modification
+        # time is thus recorded after the index file exists, which is then
+        # written in place rather than atomically renamed.
+        if not os.path.exists(path):
+            open(path, "w").close()
+
+            if "" in self._directories:
+                self._directories[""] = os.stat(self._directory).st_mtime_ns
+
+        with open(path, "w") as index_file:
+            json.dump(
+                {
+                    "version": _VERSION_INDEX_DIRECTORY,
+                    "directories": self._directories,
+                    "files": self._files,
+                    "digests": self._digests,
+                },
+                index_file,
+            )
+
+        return path
+
+    def is_stale(self) -> bool:
+        """
+        Return whether the index is stale, i.e., whether any of the indexed
+        directories was modified or removed since it was indexed.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the index is stale.
+        """
+
+        try:
+            return any(
+                os.stat(os.path.join(self._directory, directory)).st_mtime_ns != mtime
+                for directory, mtime in self._directories.items()
+            )
+        except OSError:
+            return True
+
+    def member(self, path: str | Path) -> str:
+        """
+        Return the path relative to the directory of given path.
+
+        Parameters
+        ----------
+        path
+            Path, relative paths are resolved against the directory.
+
+        Returns
+        -------
+        :class:`str`
+            Path relative to the directory.
+        """
+
+        path = os.path.relpath(os.path.join(self._directory, path), self._directory)
+
+        return "" if path == "." else path
+
+    def exists(self, path: str | Path) -> bool:
+        """
+        Return whether the index stores a file or directory at given path.
+
+        Parameters
+        ----------
+        path
+            Path, relative paths are resolved against the directory.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the index stores a file or directory at given path.
+        """
+
+        path = self.member(path)
+
+        return path == "" or path in self._directories or path in self._files
+
+    def is_dir(self, path: str | Path) -> bool:
+        """
+        Return whether the index stores a directory at given path.
+
+        Parameters
+        ----------
+        path
+            Path, relative paths are resolved against the directory.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the index stores a directory at given path.
+        """
+
+        path = self.member(path)
+
+        return path == "" or path in self._directories
+
+    def iterdir(self, path: str | Path) -> List[Path]:
+        """
+        Return the paths of the files and directories the index stores
+        directly under given directory path, sorted, like :meth:`Path.iterdir`
+        method.
+
+        Parameters
+        ----------
+        path
+            Directory path, relative paths are resolved against the directory.
+
+        Returns
+        -------
+        :class:`list`
+            Paths of the files and directories under given directory path.
+        """
+
+        return [
+            Path(self._directory, child)
+            for child in self._children.get(self.member(path), [])
+        ]
+
+    def size(self, path: str | Path) -> int:
+        """
+        Return the size in bytes of the file at given path.
+
+        Parameters
+        ----------
+        path
+            File path, relative paths are resolved against the directory.
+
+        Returns
+        -------
+        :class:`int`
+            File size in bytes.
+        """
+
+        return self._files[self.member(path)][0]
+
+    def mtime(self, path: str | Path) -> int:
+        """
+        Return the modification time in nanoseconds of the file at given path.
+
+        Parameters
+        ----------
+        path
+            File path, relative paths are resolved against the directory.
+
+        Returns
+        -------
+        :class:`int`
+            File modification time in nanoseconds.
+        """
+
+        return self._files[self.member(path)][1]
+
+    def fingerprint(self, path: str | Path) -> Tuple[int, str]:
+        """
+        Return the fingerprint of the file at given path, i.e., its size and
+        the hash of its first and last 64 KiB, and retain it.
+
+        Files with different fingerprints have a different content, files
+        with the same fingerprint must be compared with their digest. The
+        uncompressed frames of a capture all have the same size, only their
+        start and end is read so that they are not all fully hashed.
+
+        Parameters
+        ----------
+        path
+            File path, relative paths are resolved against the directory.
+
+        Returns
+        -------
+        :class:`tuple`
+            File fingerprint.
+        """
+
+        path = self.member(path)
+        size = self.size(path)
+
+        if path not in self._fingerprints:
+            hasher = xxhash.xxh3_64()
+            with open(os.path.join(self._directory, path), "rb") as file:
+                hasher.update(file.read(_SIZE_FINGERPRINT_CONTENT))
+                file.seek(max(size - _SIZE_FINGERPRINT_CONTENT, file.tell()))
+                hasher.update(file.read(_SIZE_FINGERPRINT_CONTENT))
+
+            self._fingerprints[path] = (size, hasher.hexdigest())
+
+        return self._fingerprints[path]
+
+    def digest(self, path: str | Path) -> str:
+        """
+        Return the hash of the content of the file at given path, computed
+        with :func:`aces.idt.hash_file` definition, and retain it.
+
+        Parameters
+        ----------
+        path
+            File path, relative paths are resolved against the directory.
+
+        Returns
+        -------
+        :class:`str`
+            File content hash.
+        """
+
+        path = self.member(path)
+
+        if path not in self._files:
+            raise KeyError(path)
+
+        if path not in self._digests:
+            self._digests[path] = hash_file(os.path.join(self._directory, path))
+
+        return self._digests[path]
+
+
+def find_duplicate_frames(
+    paths: Sequence[Any], index: DirectoryIndex | ZipArchiveReader
+) -> Dict[Any, Any]:
+    """
+    Find the frames of given paths whose content is identical to that of a
+    preceding frame.
+
+    The frames are first grouped by their size read from given index, the
+    frames sharing a size are then grouped by their fingerprint, e.g., the
+    *CRC-32* of an archive member or the hash of the start and end of a file,
+    so that only the frames sharing a fingerprint are fully hashed.
+    The paths that given index does not store, e.g., references to the frames
+    of a video file, are ignored.
+
+    Parameters
+    ----------
+    paths
+        Frame paths, relative paths are resolved against the index directory.
+    index
+        Directory index or archive reader storing the frames.
+
+    Returns
+    -------
+    :class:`dict`
+        Path of the first frame with the same content keyed by the path of
+        each duplicate frame, the paths referenced several times are not
+        reported.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     for name, content in (("a.exr", b"A"), ("b.exr", b"B"), ("c.exr", b"A")):
+    ...         with open(os.path.join(directory, name), "wb") as file:
+    ...             _ = file.write(content)
+    ...     find_duplicate_frames(
+    ...         ["a.exr", "b.exr", "c.exr"], DirectoryIndex.scan(directory)
+    ...     )
+    {'c.exr': 'a.exr'}
+    """
+
+    sizes = defaultdict(list)
+    for path in dict.fromkeys(paths):
+        if not isinstance(path, str | Path):
+            continue
+
+        with contextlib.suppress(KeyError):
+            sizes[index.size(path)].append(path)
+
+    fingerprints = defaultdict(list)
+    for candidates in sizes.values():
+        if len(candidates) < 2:
+            continue
+
+        for path in candidates:
+            fingerprints[index.fingerprint(path)].append(path)
+
+    duplicates = {}
+    for candidates in fingerprints.values():
+        if len(candidates) < 2:
+            continue
+
+        firsts = {}
+        for path in candidates:
+            first = firsts.setdefault(index.digest(path), path)
+            if first != path:
+                duplicates[path] = first
+
+    LOGGER.debug("Found %s duplicate frames.", len(duplicates))
+
+    return duplicates
@@ -0,0 +1,255 @@
+"""
+Preflight
+=========
+
+Define the objects validating the frames of an *IDT* archive from their
+headers only, i.e., without decoding their pixels, before any heavy
+processing starts.
+"""
+
+from __future__ import annotations
+
+import logging
+import typing
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import OpenImageIO
+from OpenImageIO import ImageInput
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+    from colour.hints import Dict, List, Mapping, Sequence
+
+    from aces.idt.core.archive import ZipArchiveReader
+
+from aces.idt.core.archive import resolve_path
+from aces.idt.core.video import is_video, probe_video
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "THROUGHPUT_DECODING_ESTIMATE",
+    "read_frame_header",
+    "preflight_frames",
+]
+
+LOGGER = logging.getLogger(__name__)
+
+THROUGHPUT_DECODING_ESTIMATE: int = 2**27
+"""
+Estimated number of bytes of pixels a worker process decodes and samples per
+second, used to estimate the sampling runtime.
+"""
+
+_COUNT_FRAMES_REPORTED: int = 5
+"""Maximum number of frames listed per inconsistency."""
+
+
+def read_frame_header(
+    path: str | Path,
+    directory: str | Path | ZipArchiveReader = "",
+    video_frames: int = 1,
+) -> Dict:
+    """
+    Read the header of the frame at given path without decoding its pixels.
+
+    The header of a video file is read with :func:`aces.idt.probe_video`
+    definition, its frames being decoded as 16-bit *RGB*.
+
+    Parameters
+    ----------
+    path
+        Frame path, relative paths are resolved against given directory.
+    directory
+        Directory or archive reader relative paths are resolved against, an
+        archive member is materialised as the sampling would.
+    video_frames
+        Number of frames sampled from a video file, used to estimate its
+        decoded pixels size.
+
+    Returns
+    -------
+    :class:`dict`
+        Frame header, i.e., its path, format name, resolution, channels count,
+        pixel data type and decoded pixels size in bytes, or its path and the
+        error raised while reading it.
+    """
+
+    if is_video(path):
+        try:
+            properties = probe_video(path, directory, count_frames=False)
+        except Exception as error:  # noqa: BLE001
+            return {"path": str(path), "error": str(error)}
+
+        width, height = properties["resolution"]
+
+        return {
+            "path": str(path),
+            "format_name": properties["format_name"],
+            "resolution": [width, height],
+            "channels": 3,
+            "type": "uint16",
+            "size": width * height * 3 * 2 * max(video_frames, 1),
+        }
+
+    try:
+        image_input = ImageInput.open(resolve_path(path, directory))
+    except Exception as error:  # noqa: BLE001
+        return {"path": str(path), "error": str(error)}
+
+    if image_input is None:
+        return {"path": str(path), "error": OpenImageIO.geterror()}
+
+    try:
+        spec = image_input.spec()
+
+        return {
+            "path": str(path),
+            "format_name": image_input.format_name(),
+            "resolution": [spec.width, spec.height],
+            "channels": spec.nchannels,
+            "type": str(spec.format),
+            "size": int(spec.image_bytes()),
+        }
+    finally:
+        image_input.close()
+
+
+def preflight_frames(
+    frames: Mapping[str, Sequence[str | Path]],
+    directory: str | Path | ZipArchiveReader = "",
+    workers: int | None = None,
+    workers_sampling: int = 1,
+    video_frames: int = 1,
+) -> Dict:
+    """
+    Validate the frames of given groups from their headers, read in parallel,
+    and estimate the cost of sampling them.
+
+    The frames of a group, e.g., the colour checker frames, are expected to
+    share the same format, resolution, channels count and pixel data type, and
+    every frame to have at least three channels. Any unreadable frame or
+    mismatch is reported rather than raised so that all the issues are known
+    at once.
+
+    Parameters
+    ----------
+    frames
+        Frame paths per group name, relative paths are resolved against given
+        directory.
+    directory
+        Directory or archive reader relative paths are resolved against.
+    workers
+        Number of threads reading the headers, defaults to the
+        :class:`concurrent.futures.ThreadPoolExecutor` class default.
+    workers_sampling
+        Number of worker processes the frames will be sampled with, used to
+        estimate the sampling runtime.
+    video_frames
+        Number of frames sampled from each video file, used to estimate the
+        decoded pixels size.
+
+    Returns
+    -------
+    :class:`dict`
+        Preflight report, i.e., whether the frames are valid, their count, the
+        unreadable frames errors, the inconsistencies, the estimated decoded
+        pixels size in bytes and the estimated sampling runtime in seconds.
+
+    Examples
+    --------
+    >>> preflight_frames({})["valid"]
+    True
+    """
+
+    paths = [(group, path) for group, paths in frames.items() for path in paths]
+
+    with ThreadPoolExecutor(workers) as executor:
+        headers = list(
+            executor.map(
+                lambda path: read_frame_header(path[1], directory, video_frames),
+                paths,
+            )
+        )
+
+    errors = [header for header in headers if "error" in header]
+
+    inconsistencies = []
+    for group in frames:
+        headers_group = [
+            header
+            for (group_header, _path), header in zip(paths, headers, strict=True)
+            if group_header == group and "error" not in header
+        ]
+
+        for key in ("format_name", "resolution", "channels", "type"):
+            values = defaultdict(list)
+            for header in headers_group:
+                values[str(header[key])].append(header["path"])
+
+            if len(values) <= 1:
+                continue
+
+            values = sorted(values.items(), key=lambda item: -len(item[1]))
+            inconsistencies.append(
+                f'"{group}" frames have different "{key}" values: '
+                f'"{values[0][0]}" for {len(values[0][1])} frame(s), '
+                + ", ".join(
+                    f'"{value}" for {_format_frames(value_paths)}'
+                    for value, value_paths in values[1:]
+                )
+                + "."
+            )
+
+        paths_channels = [
+            header["path"] for header in headers_group if header["channels"] < 3
+        ]
+        if paths_channels:
+            inconsistencies.append(
+                f'"{group}" frames have fewer than 3 channels: '
+                f"{_format_frames(paths_channels)}."
+            )
+
+    size = sum(header.get("size", 0) for header in headers)
+    duration = size / (THROUGHPUT_DECODING_ESTIMATE * max(workers_sampling, 1))
+
+    for error in errors:
+        LOGGER.warning('"%s" frame cannot be read: %s', error["path"], error["error"])
+
+    for inconsistency in inconsistencies:
+        LOGGER.warning(inconsistency)
+
+    LOGGER.info(
+        "Preflight of %s frame(s): %.1f MiB of pixels to decode, estimated "
+        "sampling runtime of %.1f seconds.",
+        len(paths),
+        size / 2**20,
+        duration,
+    )
+
+    return {
+        "valid": not errors and not inconsistencies,
+        "frames": len(paths),
+        "errors": errors,
+        "inconsistencies": inconsistencies,
+        "size": size,
+        "duration": duration,
+    }
+
+
+def _format_frames(frames: List[str]) -> str:
+    """Format given frames for an inconsistency message."""
+
+    listed = ", ".join(f'"{frame}"' for frame in frames[:_COUNT_FRAMES_REPORTED])
+
+    if len(frames) > _COUNT_FRAMES_REPORTED:
+        listed += ", ..."
+
+    return f"{len(frames)} frame(s) ({listed})"
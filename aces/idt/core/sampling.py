@@ -0,0 +1,1312 @@
+"""
+Sampling
+========
+
+Define the objects sampling the colour checker, grey card and flatfield images
+of an *IDT* archive.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import logging
+import os
+import threading
+import typing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from queue import Full, Queue
+
+import cv2
+import numpy as np
+from colour import read_image
+from colour.utilities import Structure, as_float_array
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+    from colour.hints import (
+        ArrayLike,
+        Callable,
+        Dict,
+        Generator,
+        Iterable,
+        NDArrayFloat,
+        NDArrayInt,
+        Sequence,
+        Tuple,
+    )
+
+    from aces.idt.core.cache import SamplesCache
+    from aces.idt.core.index import DirectoryIndex
+
+from colour_checker_detection.detection import (
+    SETTINGS_DETECTION_COLORCHECKER_CLASSIC,
+    reformat_image,
+    sample_colour_checker,
+    swatch_masks,
+)
+from OpenImageIO import ImageInput
+
+from aces.idt.core.archive import ZipArchiveReader, resolve_path
+from aces.idt.core.common import SAMPLES_COUNT_DEFAULT, mask_outliers
+from aces.idt.core.constants import TOLERANCE_EARLY_STOP_DEFAULT
+from aces.idt.core.video import VideoFrame, read_video_frame
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "MARGIN_REGION_OF_INTEREST",
+    "HEIGHT_STRIP",
+    "FRAMES_COUNT_EARLY_STOP_MINIMUM",
+    "read_frame",
+    "read_frame_reduced",
+    "read_frame_region",
+    "prefetch_frames",
+    "swatch_index",
+    "sample_frame",
+    "sample_frames",
+    "sample_frames_until_stable",
+    "sample_stack",
+]
+
+LOGGER = logging.getLogger(__name__)
+
+MARGIN_REGION_OF_INTEREST: int = 8
+"""
+Margin in working pixels added around the colour checker quadrilateral
+bounding box when reading a frame region of interest.
+"""
+
+HEIGHT_STRIP: int = 64
+"""
+Height in scanlines of the strips the frames are decoded with when read at
+reduced resolution.
+"""
+
+FRAMES_COUNT_EARLY_STOP_MINIMUM: int = 3
+"""
+Minimum number of frames of an exposure sampled before the sampling can stop
+early.
+"""
+
+_END_FRAMES: object = object()
+"""Sentinel marking the end of the frames read by :func:`prefetch_frames`."""
+
+_SIZE_TABLE_INTERPOLATION: int = 32
+"""
+Size of the interpolation coefficients table of :func:`cv2.warpPerspective`
+definition, i.e., its sub-pixel precision.
+"""
+
+
+def read_frame(
+    path: str | Path | VideoFrame,
+    settings: Dict,
+    directory: str | Path | ZipArchiveReader = "",
+) -> NDArrayFloat:
+    """
+    Read the frame at given path and reformat it to the working width of given
+    segmentation settings.
+
+    Parameters
+    ----------
+    path
+        Frame path, relative paths are resolved against given directory, or
+        video frame decoded with :func:`aces.idt.read_video_frame` definition.
+    settings
+        Segmentation settings.
+    directory
+        Directory or archive reader relative paths are resolved against.
+
+    Returns
+    -------
+    :class:`np.ndarray`
+        Reformatted frame.
+    """
+
+    if isinstance(path, VideoFrame):
+        image = read_video_frame(path, directory)
+    else:
+        image = read_image(resolve_path(path, directory))
+
+    return reformat_image(
+        image,
+        settings["working_width"],
+        settings["interpolation_method"],
+    )
+
+
+def _read_region(
+    image_input: ImageInput,
+    miplevel: int,
+    window: Tuple[int, int, int, int],
+) -> NDArrayFloat:
+    """
+    Read the first three channels of given region, i.e., ``(x_0, y_0, x_1,
+    y_1)`` window, from given *OpenImageIO* image input MIP level, only
+    decoding the scanlines or tiles covering it.
+    """
+
+    x_0, y_0, x_1, y_1 = window
+    specification = image_input.spec(0, miplevel)
+    x, y, z = specification.x, specification.y, specification.z
+
+    if specification.tile_width > 0:
+        tile_width = specification.tile_width
+        tile_height = specification.tile_height
+        t_x_0 = x_0 - x_0 % tile_width
+        t_y_0 = y_0 - y_0 % tile_height
+        t_x_1 = min(-(-x_1 // tile_width) * tile_width, specification.width)
+        t_y_1 = min(-(-y_1 // tile_height) * tile_height, specification.height)
+
+        pixels = image_input.read_tiles(
+            0,
+            miplevel,
+            x + t_x_0,
+            x + t_x_1,
+            y + t_y_0,
+            y + t_y_1,
+            z,
+            z + max(specification.depth, 1),
+            0,
+            3,
+            "float",
+        )
+        shape = (t_y_1 - t_y_0, t_x_1 - t_x_0, 3)
+        o_x, o_y = x_0 - t_x_0, y_0 - t_y_0
+    else:
+        pixels = image_input.read_scanlines(
+            0, miplevel, y + y_0, y + y_1, z, 0, 3, "float"
+        )
+        shape = (y_1 - y_0, specification.width, 3)
+        o_x, o_y = x_0, 0
+
+    if pixels is None:
+        msg = f'Could not read region of interest: "{image_input.geterror()}"'
+
+        raise ValueError(msg)
+
+    pixels = np.reshape(pixels, shape)
+
+    return pixels[o_y : o_y + y_1 - y_0, o_x : o_x + x_1 - x_0]
+
+
+def _coefficients_cubic(
+    size_target: int, size_source: int, begin: int, end: int
+) -> Tuple[NDArrayInt, NDArrayFloat]:
+    """
+    Compute the source indexes and cubic interpolation coefficients of the
+    :func:`cv2.resize` definition for given target pixels range.
+    """
+
+    scale = 1 / (size_target / size_source)
+    f = ((np.arange(begin, end) + 0.5) * scale - 0.5).astype(np.float32)
+    s = np.floor(f)
+    x = f - s
+
+    indexes = np.clip(
+        s.astype(np.int64)[:, None] + np.arange(-1, 3)[None, :], 0, size_source - 1
+    )
+
+    return indexes, _kernel_cubic(x)
+
+
+def _kernel_cubic(x: NDArrayFloat) -> NDArrayFloat:
+    """
+    Compute the *OpenCV* cubic interpolation coefficients for given fractional
+    offsets.
+    """
+
+    A = np.float32(-0.75)
+    c_0 = ((A * (x + 1) - 5 * A) * (x + 1) + 8 * A) * (x + 1) - 4 * A
+    c_1 = ((A + 2) * x - (A + 3)) * x * x + 1
+    c_2 = ((A + 2) * (1 - x) - (A + 3)) * (1 - x) * (1 - x) + 1
+    c_3 = 1 - c_0 - c_1 - c_2
+
+    return np.stack([c_0, c_1, c_2, c_3], axis=-1)
+
+
+def _select_miplevel(image_input: ImageInput, working_width: int) -> int:
+    """
+    Select the smallest MIP level of given *OpenImageIO* image input whose width
+    is greater or equal to given working width.
+    """
+
+    miplevel = 0
+    while (
+        image_input.seek_subimage(0, miplevel + 1)
+        and image_input.spec().width >= working_width
+    ):
+        miplevel += 1
+
+    image_input.seek_subimage(0, 0)
+
+    return miplevel
+
+
+def _read_resampled(
+    image_input: ImageInput,
+    settings: Dict,
+    region: ArrayLike | None = None,
+    use_miplevels: bool = False,
+    strip_height: int = HEIGHT_STRIP,
+) -> Tuple[NDArrayFloat, NDArrayInt] | None:
+    """
+    Read given *OpenImageIO* image input and resample it onto the working pixel
+    grid of given segmentation settings with the mapping and cubic coefficients
+    of the :func:`cv2.resize` definition.
+
+    The frame is decoded in strips of scanlines that are resampled
+    horizontally as soon as they are read so that the peak memory scales with
+    the working width rather than the frame width. *None* is returned for
+    frames that :func:`read_frame` definition must handle, i.e., portrait
+    frames, frames with less than three channels and non-cubic interpolation
+    methods.
+    """
+
+    specification = image_input.spec()
+    width, height = specification.width, specification.height
+
+    if (
+        width < height
+        or specification.nchannels < 3
+        or settings["interpolation_method"] != cv2.INTER_CUBIC
+    ):
+        return None
+
+    working_width = settings["working_width"]
+    working_height = int(height / (width / working_width))
+
+    if region is None:
+        x_0, y_0, x_1, y_1 = 0, 0, working_width, working_height
+    else:
+        x_0, y_0, x_1, y_1 = region
+        x_0, y_0 = max(x_0, 0), max(y_0, 0)
+        x_1, y_1 = min(x_1, working_width), min(y_1, working_height)
+
+    miplevel = _select_miplevel(image_input, working_width) if use_miplevels else 0
+    if miplevel:
+        specification = image_input.spec(0, miplevel)
+        width, height = specification.width, specification.height
+
+    indexes_x, coefficients_x = _coefficients_cubic(working_width, width, x_0, x_1)
+    indexes_y, coefficients_y = _coefficients_cubic(working_height, height, y_0, y_1)
+
+    f_x_0, f_x_1 = np.min(indexes_x), np.max(indexes_x) + 1
+    f_y_0, f_y_1 = np.min(indexes_y), np.max(indexes_y) + 1
+    indexes_x, indexes_y = indexes_x - f_x_0, indexes_y - f_y_0
+
+    LOGGER.debug(
+        'Reading MIP level "%s" region [%s:%s, %s:%s]...',
+        miplevel,
+        f_y_0,
+        f_y_1,
+        f_x_0,
+        f_x_1,
+    )
+
+    if specification.tile_height > 0:
+        strip_height = max(
+            strip_height - strip_height % specification.tile_height,
+            specification.tile_height,
+        )
+
+    # Horizontal then vertical passes, matching "cv2.resize" definition order.
+    image = np.empty((f_y_1 - f_y_0, x_1 - x_0, 3), dtype=np.float32)
+    for s_y_0 in range(f_y_0, f_y_1, strip_height):
+        s_y_1 = min(s_y_0 + strip_height, f_y_1)
+        strip = _read_region(image_input, miplevel, (f_x_0, s_y_0, f_x_1, s_y_1))
+        strip = np.asarray(strip, dtype=np.float32)
+
+        rows = image[s_y_0 - f_y_0 : s_y_1 - f_y_0]
+        np.multiply(
+            strip[:, indexes_x[:, 0]], coefficients_x[None, :, 0, None], out=rows
+        )
+        for i in range(1, 4):
+            rows += strip[:, indexes_x[:, i]] * coefficients_x[None, :, i, None]
+
+    rows = image
+    image = rows[indexes_y[:, 0]] * coefficients_y[:, 0, None, None]
+    for i in range(1, 4):
+        image += rows[indexes_y[:, i]] * coefficients_y[:, i, None, None]
+
+    return image, np.array([x_0, y_0])
+
+
+def read_frame_reduced(
+    path: str | Path,
+    settings: Dict,
+    directory: str | Path | ZipArchiveReader = "",
+    use_miplevels: bool = True,
+) -> NDArrayFloat:
+    """
+    Read the frame at given path directly at the working resolution of given
+    segmentation settings.
+
+    The smallest embedded MIP level wider than the working width is used when
+    present. The frame is otherwise decoded in strips of scanlines resampled as
+    soon as they are read, so that a full resolution buffer is never
+    allocated. The resampling uses the mapping and cubic coefficients of the
+    :func:`cv2.resize` definition. Portrait frames, frames with less than
+    three channels and non-cubic interpolation methods fall back to
+    :func:`read_frame` definition.
+
+    Parameters
+    ----------
+    path
+        Frame path, relative paths are resolved against given directory.
+    settings
+        Segmentation settings.
+    directory
+        Directory or archive reader relative paths are resolved against.
+    use_miplevels
+        Whether to read from the embedded MIP levels when present.
+
+    Returns
+    -------
+    :class:`np.ndarray`
+        Reformatted frame.
+    """
+
+    image_input = ImageInput.open(resolve_path(path, directory))
+
+    if image_input is None:
+        return read_frame(path, settings, directory)
+
+    try:
+        LOGGER.info('Reading "%s" frame at working resolution...', path)
+
+        resampled = _read_resampled(image_input, settings, None, use_miplevels)
+    finally:
+        image_input.close()
+
+    if resampled is None:
+        return read_frame(path, settings, directory)
+
+    return resampled[0]
+
+
+def read_frame_region(
+    path: str | Path,
+    settings: Dict,
+    quadrilateral: ArrayLike,
+    directory: str | Path | ZipArchiveReader = "",
+    *,
+    margin: int = MARGIN_REGION_OF_INTEREST,
+    use_miplevels: bool = False,
+) -> Tuple[NDArrayFloat, NDArrayFloat]:
+    """
+    Read the region of the frame at given path covering given quadrilateral
+    and reformat it as :func:`read_frame` definition would.
+
+    The quadrilateral bounding box is mapped back to the frame pixel
+    coordinates and only the scanlines or tiles covering it are decoded by
+    *OpenImageIO*. The region is then resampled onto the working pixel grid
+    with the same mapping and cubic coefficients than :func:`cv2.resize`
+    definition. Portrait frames, frames with less than three channels and
+    non-cubic interpolation methods fall back to :func:`read_frame`
+    definition.
+
+    Parameters
+    ----------
+    path
+        Frame path, relative paths are resolved against given directory.
+    settings
+        Segmentation settings.
+    quadrilateral
+        Quadrilateral of the colour checker in working pixel coordinates.
+    directory
+        Directory or archive reader relative paths are resolved against.
+    margin
+        Margin in working pixels added around the quadrilateral bounding box.
+    use_miplevels
+        Whether to read from the embedded MIP levels when present.
+
+    Returns
+    -------
+    :class:`tuple`
+        Reformatted frame region and quadrilateral in the region coordinates.
+    """
+
+    image_input = ImageInput.open(resolve_path(path, directory))
+
+    if image_input is None:
+        return read_frame(path, settings, directory), quadrilateral
+
+    quadrilateral = as_float_array(quadrilateral)
+    x_0, y_0 = np.floor(np.min(quadrilateral, axis=0)).astype(int) - margin
+    x_1, y_1 = np.ceil(np.max(quadrilateral, axis=0)).astype(int) + margin + 1
+
+    try:
+        LOGGER.info('Reading "%s" frame region of interest...', path)
+
+        resampled = _read_resampled(
+            image_input, settings, (x_0, y_0, x_1, y_1), use_miplevels
+        )
+    finally:
+        image_input.close()
+
+    if resampled is None:
+        return read_frame(path, settings, directory), quadrilateral
+
+    image, origin = resampled
+
+    return image, quadrilateral - origin
+
+
+def _read_frame(
+    path: str | Path | VideoFrame,
+    settings: Dict,
+    directory: str | Path | ZipArchiveReader,
+    quadrilateral: ArrayLike,
+    *,
+    region_of_interest: bool,
+    reduced_resolution: bool,
+) -> Tuple[NDArrayFloat, ArrayLike]:
+    """
+    Read the frame, or its region of interest, at given path and return it
+    along the quadrilateral in its coordinates.
+    """
+
+    # Video frames are always decoded at full resolution by *ffmpeg*.
+    if isinstance(path, VideoFrame):
+        return read_frame(path, settings, directory), quadrilateral
+
+    if region_of_interest:
+        return read_frame_region(
+            path,
+            settings,
+            quadrilateral,
+            directory,
+            use_miplevels=reduced_resolution,
+        )
+
+    if reduced_resolution:
+        return read_frame_reduced(path, settings, directory), quadrilateral
+
+    return read_frame(path, settings, directory), quadrilateral
+
+
+def prefetch_frames(
+    frames: Iterable[Tuple],
+    depth: int = 2,
+    reader: Callable = read_frame,
+) -> Generator[typing.Any, None, None]:
+    """
+    Read given frames in a background thread with given reader, yielding them
+    in order while the next frames are being read.
+
+    The frames are put into a bounded queue whose depth caps the number of
+    decoded frames held in memory.
+
+    Parameters
+    ----------
+    frames
+        Frames to read as an iterable of reader arguments, e.g., path,
+        segmentation settings and directory for :func:`read_frame` definition.
+    depth
+        Number of frames read ahead of the consumer.
+    reader
+        Callable reading a frame.
+
+    Yields
+    ------
+    :class:`object`
+        Frames returned by the reader.
+    """
+
+    queue = Queue(maxsize=max(depth, 1))
+    stop = threading.Event()
+
+    def _put(item: typing.Any) -> None:
+        """Put given item into the queue unless the consumer stopped."""
+
+        # The queue is polled so that the reader thread notices the consumer
+        # stopping while it waits for a free slot, "Full" is the expected
+        # outcome of a poll rather than an error.
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+            except Full:  # noqa: PERF203
+                continue
+            else:
+                return
+
+    def _reader() -> None:
+        """Read the frames and put them into the queue."""
+
+        try:
+            for arguments in frames:
+                if stop.is_set():
+                    return
+
+                LOGGER.info('Reading "%s" frame...', arguments[0])
+
+                _put(reader(*arguments))
+        except Exception as error:  # noqa: BLE001
+            _put(error)
+        finally:
+            _put(_END_FRAMES)
+
+    thread = threading.Thread(target=_reader, daemon=True)
+    thread.start()
+
+    try:
+        while (item := queue.get()) is not _END_FRAMES:
+            if isinstance(item, Exception):
+                raise item
+
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _table_warp(interpolation_method: int) -> Tuple[int, NDArrayFloat] | None:
+    """
+    Return the first tap offset and the interpolation coefficients table of the
+    :func:`cv2.warpPerspective` definition for given interpolation method, or
+    *None* if the method is not supported.
+    """
+
+    x = np.arange(_SIZE_TABLE_INTERPOLATION, dtype=np.float32) / np.float32(
+        _SIZE_TABLE_INTERPOLATION
+    )
+
+    if interpolation_method == cv2.INTER_LINEAR:
+        return 0, np.stack([1 - x, x], axis=-1)
+
+    if interpolation_method == cv2.INTER_CUBIC:
+        return -1, _kernel_cubic(x)
+
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _swatch_index(
+    quadrilateral: Tuple[float, ...],
+    rectangle: Tuple[float, ...],
+    shape: Tuple[int, int],
+    *,
+    swatches_horizontal: int,
+    swatches_vertical: int,
+    working_width: int,
+    working_height: int,
+    interpolation_method: int,
+    samples: int,
+) -> Tuple[NDArrayInt, NDArrayFloat] | None:
+    """
+    Compute the swatch index for given hashable arguments, see
+    :func:`swatch_index` definition.
+    """
+
+    table = _table_warp(interpolation_method)
+    if table is None:
+        return None
+
+    offset, coefficients = table
+    taps = np.arange(coefficients.shape[-1]) + offset
+    height, width = shape
+
+    # The mapping from the warped image to the image mirrors the fixed-point
+    # arithmetic of "cv2.warpPerspective" so that the same source pixels and
+    # coefficients are selected.
+    transform = np.linalg.inv(
+        cv2.getPerspectiveTransform(
+            np.reshape(np.asarray(quadrilateral, dtype=np.float32), (4, 2)),
+            np.reshape(np.asarray(rectangle, dtype=np.float32), (4, 2)),
+        )
+    )
+
+    masks = swatch_masks(
+        working_width, working_height, swatches_horizontal, swatches_vertical, samples
+    )
+
+    rows, columns, weights = [], [], []
+    for i, (y_0, y_1, x_0, x_1) in enumerate(masks):
+        y, x = np.mgrid[
+            max(y_0, 0) : min(y_1, working_height),
+            max(x_0, 0) : min(x_1, working_width),
+        ]
+        y, x = np.ravel(y).astype(np.float64), np.ravel(x).astype(np.float64)
+
+        w = transform[2, 1] * y + transform[2, 2] + transform[2, 0] * x
+        w = np.divide(_SIZE_TABLE_INTERPOLATION, w, out=np.zeros_like(w), where=w != 0)
+        x_s, y_s = (
+            np.rint(
+                np.clip(
+                    (transform[j, 1] * y + transform[j, 2] + transform[j, 0] * x) * w,
+                    np.iinfo(np.int32).min,
+                    np.iinfo(np.int32).max,
+                )
+            ).astype(np.int64)
+            for j in (0, 1)
+        )
+
+        b = int(np.log2(_SIZE_TABLE_INTERPOLATION))
+        i_x = (x_s >> b)[:, None] + taps
+        i_y = (y_s >> b)[:, None] + taps
+        c_x = coefficients[x_s & (_SIZE_TABLE_INTERPOLATION - 1)]
+        c_y = coefficients[y_s & (_SIZE_TABLE_INTERPOLATION - 1)]
+
+        # Taps outside the image sample the zero constant border.
+        valid = ((i_y >= 0) & (i_y < height))[:, :, None] & (
+            (i_x >= 0) & (i_x < width)
+        )[:, None, :]
+        indexes = (i_y[:, :, None] * width + i_x[:, None, :])[valid]
+        coefficient = (c_y[:, :, None] * c_x[:, None, :])[valid]
+
+        rows.append(np.full(indexes.size, i))
+        columns.append(indexes)
+        weights.append(coefficient.astype(np.float64) / max(x.size, 1))
+
+    indexes, columns = np.unique(np.concatenate(columns), return_inverse=True)
+
+    matrix = np.zeros((len(masks), indexes.size))
+    np.add.at(matrix, (np.concatenate(rows), columns), np.concatenate(weights))
+
+    indexes.setflags(write=False)
+    matrix.setflags(write=False)
+
+    return indexes, matrix
+
+
+def swatch_index(
+    quadrilateral: ArrayLike,
+    rectangle: ArrayLike,
+    shape: Sequence[int],
+    settings: Dict,
+    samples: int = SAMPLES_COUNT_DEFAULT,
+) -> Tuple[NDArrayInt, NDArrayFloat] | None:
+    """
+    Compute the index sampling the swatches colours of an image of given shape
+    within given quadrilateral.
+
+    The index composes the perspective warp of the quadrilateral onto given
+    rectangle with the averaging of the swatch masks pixels: the swatches
+    colours of any image of given shape are the product of the index matrix
+    with the image pixels gathered at the index pixel indexes, instead of
+    warping the whole image. The indexes are cached as the quadrilateral is
+    fixed once the baseline exposure frame is segmented.
+
+    Parameters
+    ----------
+    quadrilateral
+        Quadrilateral of the colour checker in the image.
+    rectangle
+        Rectangle the quadrilateral is warped onto.
+    shape
+        Image shape.
+    settings
+        Segmentation settings.
+    samples
+        Sample count used to sample the swatches colours.
+
+    Returns
+    -------
+    :class:`tuple` or :py:data:`None`
+        Flat pixel indexes and matrix of shape (swatches, indexes) or *None*
+        if given settings require warping the image, i.e., if they define an
+        image transform, reference values to orient the colour checker with or
+        an unsupported interpolation method.
+
+    Examples
+    --------
+    >>> from aces.idt.core import SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC
+    >>> settings = dict(SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC)
+    >>> settings["reference_values"] = None
+    >>> quadrilateral = np.array([[1200, 100], [1200, 900], [200, 900], [200, 100]])
+    >>> rectangle = np.array([[1600, 0], [1600, 1066], [0, 1066], [0, 0]])
+    >>> image = np.ones([1066, 1600, 3])
+    >>> indexes, matrix = swatch_index(quadrilateral, rectangle, image.shape, settings)
+    >>> matrix.shape[0]
+    24
+    >>> (matrix @ np.reshape(image, (-1, 3))[indexes])[0]
+    array([ 1.,  1.,  1.])
+    """
+
+    settings_detection = Structure(**SETTINGS_DETECTION_COLORCHECKER_CLASSIC)
+    settings_detection.update(**settings)
+
+    if settings_detection.transform or settings_detection.reference_values is not None:
+        return None
+
+    return _swatch_index(
+        tuple(np.ravel(np.asarray(quadrilateral, dtype=np.float32)).tolist()),
+        tuple(np.ravel(np.asarray(rectangle, dtype=np.float32)).tolist()),
+        (int(shape[0]), int(shape[1])),
+        swatches_horizontal=int(settings_detection.swatches_horizontal),
+        swatches_vertical=int(settings_detection.swatches_vertical),
+        working_width=int(settings_detection.working_width),
+        working_height=int(settings_detection.working_height),
+        interpolation_method=int(settings_detection.interpolation_method),
+        samples=int(samples),
+    )
+
+
+def _sample_image(
+    image: ArrayLike,
+    quadrilateral: ArrayLike,
+    rectangle: ArrayLike,
+    settings: Dict,
+    use_swatch_index: bool = False,
+) -> NDArrayFloat:
+    """
+    Sample the swatches colours of given image within given quadrilateral,
+    optionally gathering them with a swatch index instead of warping the image.
+    """
+
+    image = np.asarray(image)
+
+    if use_swatch_index:
+        index = swatch_index(quadrilateral, rectangle, image.shape, settings)
+
+        if index is not None:
+            indexes, matrix = index
+            pixels = np.reshape(image, (image.shape[0] * image.shape[1], -1))
+
+            return np.reshape(
+                matrix @ pixels[indexes], (matrix.shape[0], *image.shape[2:])
+            ).astype(np.float32)
+
+    return sample_colour_checker(
+        image, quadrilateral, rectangle, SAMPLES_COUNT_DEFAULT, **settings
+    ).swatch_colours
+
+
+def sample_frame(
+    path: str | Path,
+    quadrilateral: ArrayLike,
+    rectangle: ArrayLike,
+    settings: Dict,
+    directory: str | Path | ZipArchiveReader = "",
+    *,
+    keep_image: bool = False,
+    region_of_interest: bool = False,
+    reduced_resolution: bool = False,
+    use_swatch_index: bool = False,
+) -> Tuple[NDArrayFloat, NDArrayFloat | None]:
+    """
+    Read the frame at given path and sample the swatches colours within given
+    quadrilateral.
+
+    Parameters
+    ----------
+    path
+        Frame path, relative paths are resolved against given directory.
+    quadrilateral
+        Quadrilateral of the colour checker detected in the baseline exposure
+        frame.
+    rectangle
+        Rectangle the quadrilateral is warped onto.
+    settings
+        Segmentation settings.
+    directory
+        Directory or archive reader relative paths are resolved against.
+    keep_image
+        Whether to return the reformatted frame along the swatches colours.
+    region_of_interest
+        Whether to only read the frame region covering the quadrilateral, the
+        whole frame is always read if ``keep_image`` is *True*.
+    reduced_resolution
+        Whether to decode the frame directly at the working resolution.
+    use_swatch_index
+        Whether to gather the swatches colours with a swatch index instead of
+        warping the frame, see :func:`swatch_index` definition.
+
+    Returns
+    -------
+    :class:`tuple`
+        Swatches colours and reformatted frame if ``keep_image`` is *True*.
+    """
+
+    LOGGER.info('Sampling "%s" frame...', path)
+
+    image, quadrilateral = _read_frame(
+        path,
+        settings,
+        directory,
+        quadrilateral,
+        region_of_interest=region_of_interest and not keep_image,
+        reduced_resolution=reduced_resolution,
+    )
+
+    swatch_colours = _sample_image(
+        image, quadrilateral, rectangle, settings, use_swatch_index
+    )
+
+    return swatch_colours, image if keep_image else None
+
+
+def sample_stack(
+    images: ArrayLike,
+    quadrilateral: ArrayLike,
+    rectangle: ArrayLike,
+    settings: Dict,
+    use_swatch_index: bool = False,
+) -> NDArrayFloat:
+    """
+    Sample the swatches colours of given stack of same exposure frames within
+    given quadrilateral.
+
+    With a swatch index, the swatches colours of all the frames are computed
+    in a single vectorised pass, only the indexed pixels of the frames are read
+    so that a memory-mapped stack is not loaded entirely.
+
+    Parameters
+    ----------
+    images
+        Stack of reformatted frames of shape (N, height, width, channels),
+        e.g., a :class:`numpy.memmap` class instance.
+    quadrilateral
+        Quadrilateral of the colour checker detected in the baseline exposure
+        frame.
+    rectangle
+        Rectangle the quadrilateral is warped onto.
+    settings
+        Segmentation settings.
+    use_swatch_index
+        Whether to gather the swatches colours with a swatch index instead of
+        warping the frames, see :func:`swatch_index` definition.
+
+    Returns
+    -------
+    :class:`np.ndarray`
+        Swatches colours of shape (N, swatches, channels).
+
+    Examples
+    --------
+    >>> from aces.idt.core import SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC
+    >>> settings = dict(SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC)
+    >>> settings["reference_values"] = None
+    >>> quadrilateral = np.array([[1200, 100], [1200, 900], [200, 900], [200, 100]])
+    >>> rectangle = np.array([[1600, 0], [1600, 1066], [0, 1066], [0, 0]])
+    >>> images = np.ones([2, 1066, 1600, 3], dtype=np.float32)
+    >>> sample_stack(images, quadrilateral, rectangle, settings, True).shape
+    (2, 24, 3)
+    """
+
+    images = np.asarray(images)
+
+    index = (
+        swatch_index(quadrilateral, rectangle, images.shape[1:], settings)
+        if use_swatch_index
+        else None
+    )
+
+    if index is None:
+        return np.stack(
+            [
+                _sample_image(image, quadrilateral, rectangle, settings)
+                for image in images
+            ]
+        )
+
+    indexes, matrix = index
+    count, height, width = images.shape[:3]
+    pixels = np.reshape(images, (count, height * width, -1))[:, indexes]
+
+    return np.einsum("sk,nkc->nsc", matrix, pixels).astype(np.float32)
+
+
+def _initialise_worker() -> None:
+    """
+    Initialise a sampling worker process.
+
+    *OpenCV* is constrained to a single thread so that the worker processes do
+    not oversubscribe the CPU cores.
+    """
+
+    cv2.setNumThreads(1)
+
+
+def sample_frames(
+    frames: Iterable[Tuple[str | Path, Dict, bool]],
+    quadrilateral: ArrayLike,
+    rectangle: ArrayLike,
+    directory: str | Path | ZipArchiveReader = "",
+    *,
+    workers: int = 1,
+    prefetch: int = 0,
+    region_of_interest: bool = False,
+    reduced_resolution: bool = False,
+    use_swatch_index: bool = False,
+    cache: SamplesCache | None = None,
+    memo: Dict | None = None,
+    index: DirectoryIndex | None = None,
+) -> Generator[Tuple[NDArrayFloat, NDArrayFloat | None], None, None]:
+    """
+    Sample given frames, optionally fanning them out across a pool of worker
+    processes.
+
+    The results are yielded in the order of given frames irrespective of the
+    number of worker processes, and are identical to those of the serial
+    path. When sampling serially, the frames can be read and decoded by a
+    background thread so that the disk I/O overlaps with the sampling. When a
+    cache is given, only the frames whose samples it does not store are
+    sampled. When a memo is given, a frame referenced several times with the
+    same segmentation settings is only sampled once, its swatches colours are
+    fanned out to every reference.
+
+    The frames are sampled lazily: only a bounded number of frames are read
+    ahead of the consumer, and closing the generator stops reading the
+    remaining frames.
+
+    Parameters
+    ----------
+    frames
+        Frames to sample as an iterable of path, segmentation settings and
+        whether to keep the reformatted frame.
+    quadrilateral
+        Quadrilateral of the colour checker detected in the baseline exposure
+        frame.
+    rectangle
+        Rectangle the quadrilateral is warped onto.
+    directory
+        Directory or archive reader relative paths are resolved against.
+    workers
+        Number of worker processes, a value lower than 1 uses all the
+        available CPU cores.
+    prefetch
+        Number of frames read ahead of the sampling when sampling serially, a
+        value lower than 1 disables the prefetching.
+    region_of_interest
+        Whether to only read the frame regions covering the quadrilateral.
+    reduced_resolution
+        Whether to decode the frames directly at the working resolution.
+    use_swatch_index
+        Whether to gather the swatches colours with a swatch index instead of
+        warping the frames, see :func:`swatch_index` definition.
+    cache
+        Persistent cache storing the frames swatches colours, the frames whose
+        reformatted frame is kept are always sampled.
+    memo
+        Swatches colours of the frames sampled so far keyed by their path and
+        segmentation settings, updated with the frames sampled, so that it can
+        be shared by several calls. The frames whose reformatted frame is kept
+        are always sampled.
+    index
+        Index of the directory the frames belong to, the content hashes of
+        the frames keying the cache are retained by it rather than computed
+        for every call. The content hashes of the frames of an archive are
+        retained by the archive reader.
+
+    Yields
+    ------
+    :class:`tuple`
+        Swatches colours and reformatted frame for each given frame.
+    """
+
+    # Cache keys, hits and memo keys of the frames in order, the pending
+    # misses are matched with the sampling results as they are yielded. The
+    # references to a frame that is pending are resolved once it is sampled.
+    pending = deque()
+    scheduled = set()
+    hits = references = 0
+
+    def _digest(path: str | Path) -> str:
+        """Return the content hash of given frame, computed once per file."""
+
+        if isinstance(directory, ZipArchiveReader):
+            return directory.digest(path)
+
+        path = resolve_path(path, directory)
+        if index is not None:
+            with contextlib.suppress(KeyError):
+                return index.digest(os.path.abspath(path))
+
+        return cache.digest(path)
+
+    def _frames_missing() -> Generator[Tuple, None, None]:
+        """Yield the frames whose samples are not stored in the cache."""
+
+        nonlocal hits, references
+
+        for path, settings, keep_image in frames:
+            key = swatch_colours = key_memo = None
+            if memo is not None and not keep_image:
+                key_memo = (str(path), repr(sorted(dict(settings).items())))
+                if key_memo in memo or key_memo in scheduled:
+                    pending.append((None, None, key_memo, True))
+                    references += 1
+                    continue
+
+            if cache is not None and not keep_image:
+                # The frames of a video file are keyed by their index, the video
+                # file being only hashed once.
+                kwargs_key = (
+                    {"index": path.index} if isinstance(path, VideoFrame) else {}
+                )
+                path_file = path.path if isinstance(path, VideoFrame) else path
+                key = cache.key(
+                    path_file,
+                    settings,
+                    quadrilateral,
+                    _digest(path_file),
+                    region_of_interest=region_of_interest,
+                    reduced_resolution=reduced_resolution,
+                    use_swatch_index=use_swatch_index,
+                    **kwargs_key,
+                )
+                swatch_colours = cache.get(key)
+
+            pending.append((key, swatch_colours, key_memo, False))
+
+            if swatch_colours is None:
+                if key_memo is not None:
+                    scheduled.add(key_memo)
+
+                yield path, settings, keep_image
+            else:
+                hits += 1
+
+                if key_memo is not None:
+                    memo[key_memo] = swatch_colours
+
+    def _pending_resolved() -> Generator[Tuple, None, None]:
+        """Yield the pending frames samples that are known."""
+
+        while pending:
+            _key, swatch_colours, key_memo, reference = pending[0]
+            # The referenced frame precedes the reference and is sampled.
+            if reference:
+                swatch_colours = memo[key_memo]
+            elif swatch_colours is None:
+                return
+
+            pending.popleft()
+
+            yield swatch_colours, None
+
+    results = _sample_frames(
+        _frames_missing(),
+        quadrilateral,
+        rectangle,
+        directory,
+        workers=workers,
+        prefetch=prefetch,
+        region_of_interest=region_of_interest,
+        reduced_resolution=reduced_resolution,
+        use_swatch_index=use_swatch_index,
+    )
+
+    stored = False
+    try:
+        for result in results:
+            yield from _pending_resolved()
+
+            key, _swatch_colours, key_memo, _reference = pending.popleft()
+            if key is not None:
+                cache.set(key, result[0], evict=False)
+                stored = True
+
+            if key_memo is not None:
+                memo[key_memo] = result[0]
+
+            yield result
+
+        yield from _pending_resolved()
+    finally:
+        results.close()
+
+        if cache is not None:
+            LOGGER.info("Found %s frames samples in the cache.", hits)
+
+        if references:
+            LOGGER.info("Reused the samples of %s frames references.", references)
+
+        if stored:
+            cache.evict()
+
+
+def sample_frames_until_stable(
+    frames: Sequence[Tuple[str | Path, Dict, bool]],
+    quadrilateral: ArrayLike,
+    rectangle: ArrayLike,
+    tolerance: float = TOLERANCE_EARLY_STOP_DEFAULT,
+    swatch: int = 21,
+    **kwargs: typing.Any,
+) -> NDArrayFloat:
+    """
+    Sample given frames of a single exposure in order, stopping once the
+    robust estimate of the swatches colours is stable.
+
+    The robust estimate is the median of the frames swatches colours whose
+    given swatch is not an outlier according to :func:`mask_outliers`
+    definition, i.e., the same estimate the samples analysis uses. The
+    sampling stops once adding a frame changes the estimate of every swatch
+    by less than given relative tolerance, after at least
+    :attr:`FRAMES_COUNT_EARLY_STOP_MINIMUM` frames.
+
+    The frames are sampled serially and without prefetching, irrespective of
+    the worker processes and prefetch depth given to the :func:`sample_frames`
+    definition, so that no frame is read past the one the sampling stops at.
+
+    Parameters
+    ----------
+    frames
+        Frames to sample as a sequence of path, segmentation settings and
+        whether to keep the reformatted frame.
+    quadrilateral
+        Quadrilateral of the colour checker detected in the baseline exposure
+        frame.
+    rectangle
+        Rectangle the quadrilateral is warped onto.
+    tolerance
+        Relative tolerance the estimate must be stable within.
+    swatch
+        Index of the swatch the outliers are detected with, default to the
+        *neutral 5 (.70 D)* swatch of the *ColorChecker Classic*.
+
+    Other Parameters
+    ----------------
+    kwargs
+        Keywords arguments for the :func:`sample_frames` definition.
+
+    Returns
+    -------
+    :class:`np.ndarray`
+        Swatches colours of the sampled frames, the frames after the last
+        sampled one were skipped.
+    """
+
+    samples_sequence = []
+    samples_median = None
+
+    kwargs.update({"workers": 1, "prefetch": 0})
+
+    results = sample_frames(frames, quadrilateral, rectangle, **kwargs)
+    try:
+        for swatch_colours, _image in results:
+            samples_sequence.append(swatch_colours)
+
+            # The estimate of the previous frame is required so that the first
+            # comparison happens once the minimum number of frames is sampled.
+            if len(samples_sequence) < FRAMES_COUNT_EARLY_STOP_MINIMUM - 1:
+                continue
+
+            sequence = as_float_array(samples_sequence)
+            mask = np.all(~mask_outliers(sequence[:, swatch]), axis=-1)
+            samples_median, samples_median_previous = (
+                np.median(sequence[mask], 0),
+                samples_median,
+            )
+
+            if samples_median_previous is not None and np.allclose(
+                samples_median, samples_median_previous, rtol=tolerance, atol=0
+            ):
+                break
+    finally:
+        results.close()
+
+    return as_float_array(samples_sequence)
+
+
+def _sample_frames(
+    frames: Iterable[Tuple[str | Path, Dict, bool]],
+    quadrilateral: ArrayLike,
+    rectangle: ArrayLike,
+    directory: str | Path | ZipArchiveReader,
+    *,
+    workers: int,
+    prefetch: int,
+    region_of_interest: bool,
+    reduced_resolution: bool,
+    use_swatch_index: bool,
+) -> Generator[Tuple[NDArrayFloat, NDArrayFloat | None], None, None]:
+    """
+    Sample given frames, optionally fanning them out across a pool of worker
+    processes, see :func:`sample_frames` definition.
+    """
+
+    if workers < 1:
+        workers = os.cpu_count() or 1
+
+    options = {
+        "region_of_interest": region_of_interest,
+        "reduced_resolution": reduced_resolution,
+        "use_swatch_index": use_swatch_index,
+    }
+
+    if workers == 1:
+        if prefetch < 1:
+            for path, settings, keep_image in frames:
+                yield sample_frame(
+                    path,
+                    quadrilateral,
+                    rectangle,
+                    dict(settings),
+                    directory,
+                    keep_image=keep_image,
+                    **options,
+                )
+
+            return
+
+        def reader(path: str | Path, settings: Dict, keep_image: bool) -> Tuple:
+            """Read given frame along the arguments required to sample it."""
+
+            image, quadrilateral_image = _read_frame(
+                path,
+                settings,
+                directory,
+                quadrilateral,
+                region_of_interest=region_of_interest and not keep_image,
+                reduced_resolution=reduced_resolution,
+            )
+
+            return image, quadrilateral_image, settings, keep_image
+
+        images = prefetch_frames(frames, prefetch, reader)
+        try:
+            for image, quadrilateral_image, settings, keep_image in images:
+                yield (
+                    _sample_image(
+                        image,
+                        quadrilateral_image,
+                        rectangle,
+                        settings,
+                        use_swatch_index,
+                    ),
+                    image if keep_image else None,
+                )
+        finally:
+            images.close()
+
+        return
+
+    LOGGER.info("Sampling frames with %s worker processes...", workers)
+
+    # The frames are submitted as the results are consumed so that at most a
+    # few frames per worker process are in flight.
+    executor = ProcessPoolExecutor(workers, initializer=_initialise_worker)
+    futures = deque()
+    try:
+        for path, settings, keep_image in frames:
+            futures.append(
+                executor.submit(
+                    sample_frame,
+                    path,
+                    quadrilateral,
+                    rectangle,
+                    dict(settings),
+                    directory,
+                    keep_image=keep_image,
+                    **options,
+                )
+            )
+
+            if len(futures) > workers * 2:
+                yield futures.popleft().result()
+
+        while futures:
+            yield futures.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
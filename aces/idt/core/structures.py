@@ -16,7 +16,18 @@ from typing import TYPE_CHECKING
 import numpy as np
 
 if TYPE_CHECKING:
-    from colour.hints import Any, Callable, Tuple
+    from colour.hints import (
+        Any,
+        ArrayLike,
+        Callable,
+        Dict,
+        List,
+        Mapping,
+        NDArray,
+        NDArrayFloat,
+        Sequence,
+        Tuple,
+    )
 
 __author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
 __copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
@@ -32,6 +43,7 @@ __all__ = [
     "MetadataProperty",
     "metadata_property",
     "MixinSerializableProperties",
+    "SamplesAnalysis",
 ]
 
 
@@ -250,3 +262,499 @@ class MixinSerializableProperties:
             data = json.load(f)
 
         return cls.from_json(data)
+
+
+class SamplesAnalysis:
+    """
+    Store the samples of the frames of an *IDT* archive as contiguous arrays.
+
+    The samples sequences of the colour checker frames of every exposure are
+    stored in a single *float32* array indexed by exposure and frame, the
+    samples medians are stored as *float64* arrays, the added samples being
+    only concatenated into those arrays when they are read. A *JSON* view with
+    the nested :class:`dict` and :class:`list` layout of the *IDT* archive data
+    is only built for serialization.
+
+    Attributes
+    ----------
+    -   :attr:`~aces.idt.SamplesAnalysis.EVs`
+    -   :attr:`~aces.idt.SamplesAnalysis.colour_checker_medians`
+    -   :attr:`~aces.idt.SamplesAnalysis.flatfield_sequence`
+    -   :attr:`~aces.idt.SamplesAnalysis.flatfield_median`
+    -   :attr:`~aces.idt.SamplesAnalysis.grey_card_sequence`
+    -   :attr:`~aces.idt.SamplesAnalysis.grey_card_median`
+
+    Methods
+    -------
+    -   :meth:`~aces.idt.SamplesAnalysis.colour_checker_sequence`
+    -   :meth:`~aces.idt.SamplesAnalysis.colour_checker_median`
+    -   :meth:`~aces.idt.SamplesAnalysis.colour_checker_frames_skipped`
+    -   :meth:`~aces.idt.SamplesAnalysis.add_colour_checker`
+    -   :meth:`~aces.idt.SamplesAnalysis.set_flatfield`
+    -   :meth:`~aces.idt.SamplesAnalysis.set_grey_card`
+    -   :meth:`~aces.idt.SamplesAnalysis.to_dict`
+    -   :meth:`~aces.idt.SamplesAnalysis.to_json`
+    -   :meth:`~aces.idt.SamplesAnalysis.from_json`
+    -   :meth:`~aces.idt.SamplesAnalysis.to_arrays`
+    -   :meth:`~aces.idt.SamplesAnalysis.from_arrays`
+
+    Examples
+    --------
+    >>> samples_analysis = SamplesAnalysis()
+    >>> samples_analysis.add_colour_checker(0.0, np.ones([3, 24, 3]), np.ones([24, 3]))
+    >>> samples_analysis.EVs
+    (0.0,)
+    >>> samples_analysis.colour_checker_sequence(0.0).shape
+    (3, 24, 3)
+    """
+
+    __slots__ = (
+        "_EVs",
+        "_colour_checker_medians",
+        "_colour_checker_offsets",
+        "_colour_checker_pending",
+        "_colour_checker_sequences",
+        "_colour_checker_skipped",
+        "_flatfield_median",
+        "_flatfield_sequence",
+        "_grey_card_median",
+        "_grey_card_sequence",
+    )
+
+    def __init__(self) -> None:
+        self._EVs: Dict[float, int] = {}
+        self._colour_checker_sequences: NDArrayFloat | None = None
+        self._colour_checker_offsets: List[int] = [0]
+        self._colour_checker_medians: NDArrayFloat | None = None
+        self._colour_checker_pending: List[Tuple[NDArrayFloat, NDArrayFloat]] = []
+        self._colour_checker_skipped: Dict[float, Tuple[str, ...]] = {}
+        self._flatfield_sequence: NDArrayFloat | None = None
+        self._flatfield_median: NDArrayFloat | None = None
+        self._grey_card_sequence: NDArrayFloat | None = None
+        self._grey_card_median: NDArrayFloat | None = None
+
+    @property
+    def EVs(self) -> Tuple[float, ...]:
+        """
+        Getter property for the exposure values of the colour checker frames.
+
+        Returns
+        -------
+        :class:`tuple`
+            Exposure values in the order they were added.
+        """
+
+        return tuple(self._EVs)
+
+    @property
+    def colour_checker_medians(self) -> NDArrayFloat | None:
+        """
+        Getter property for the colour checker samples medians of every
+        exposure.
+
+        Returns
+        -------
+        :class:`np.ndarray` or :py:data:`None`
+            Samples medians of shape (EVs, swatches, channels).
+        """
+
+        self._concatenate_colour_checker()
+
+        return self._colour_checker_medians
+
+    @property
+    def flatfield_sequence(self) -> NDArrayFloat | None:
+        """
+        Getter property for the flatfield samples sequence.
+
+        Returns
+        -------
+        :class:`np.ndarray` or :py:data:`None`
+            Flatfield samples sequence of shape (frames, swatches, channels).
+        """
+
+        return self._flatfield_sequence
+
+    @property
+    def flatfield_median(self) -> NDArrayFloat | None:
+        """
+        Getter property for the flatfield samples median.
+
+        Returns
+        -------
+        :class:`np.ndarray` or :py:data:`None`
+            Flatfield samples median.
+        """
+
+        return self._flatfield_median
+
+    @property
+    def grey_card_sequence(self) -> NDArrayFloat | None:
+        """
+        Getter property for the grey card samples sequence.
+
+        Returns
+        -------
+        :class:`np.ndarray` or :py:data:`None`
+            Grey card samples sequence of shape (frames, channels).
+        """
+
+        return self._grey_card_sequence
+
+    @property
+    def grey_card_median(self) -> NDArrayFloat | None:
+        """
+        Getter property for the grey card samples median.
+
+        Returns
+        -------
+        :class:`np.ndarray` or :py:data:`None`
+            Grey card samples median.
+        """
+
+        return self._grey_card_median
+
+    def colour_checker_sequence(self, EV: float) -> NDArrayFloat:
+        """
+        Return the colour checker samples sequence of given exposure value.
+
+        Parameters
+        ----------
+        EV
+            Exposure value.
+
+        Returns
+        -------
+        :class:`np.ndarray`
+            Samples sequence of shape (frames, swatches, channels).
+        """
+
+        index = self._EVs[EV]
+
+        self._concatenate_colour_checker()
+
+        return self._colour_checker_sequences[
+            self._colour_checker_offsets[index] : self._colour_checker_offsets[
+                index + 1
+            ]
+        ]
+
+    def colour_checker_median(self, EV: float) -> NDArrayFloat:
+        """
+        Return the colour checker samples median of given exposure value.
+
+        Parameters
+        ----------
+        EV
+            Exposure value.
+
+        Returns
+        -------
+        :class:`np.ndarray`
+            Samples median of shape (swatches, channels).
+        """
+
+        index = self._EVs[EV]
+
+        self._concatenate_colour_checker()
+
+        return self._colour_checker_medians[index]
+
+    def colour_checker_frames_skipped(self, EV: float) -> Tuple[str, ...]:
+        """
+        Return the colour checker frames of given exposure value that were not
+        sampled because the sampling stopped early.
+
+        Parameters
+        ----------
+        EV
+            Exposure value.
+
+        Returns
+        -------
+        :class:`tuple`
+            Skipped frames paths.
+        """
+
+        return self._colour_checker_skipped.get(EV, ())
+
+    def add_colour_checker(
+        self,
+        EV: float,
+        samples_sequence: ArrayLike,
+        samples_median: ArrayLike,
+        frames_skipped: Sequence[str | Path] = (),
+    ) -> None:
+        """
+        Add the colour checker samples sequence and median of given exposure
+        value.
+
+        Parameters
+        ----------
+        EV
+            Exposure value.
+        samples_sequence
+            Samples sequence of shape (frames, swatches, channels).
+        samples_median
+            Samples median of shape (swatches, channels).
+        frames_skipped
+            Frames that were not sampled because the sampling stopped early.
+        """
+
+        if EV in self._EVs:
+            msg = f'"{EV}" exposure value samples were already added!'
+
+            raise ValueError(msg)
+
+        samples_sequence = np.asarray(samples_sequence, dtype=np.float32)
+        samples_median = np.asarray(samples_median, dtype=np.float64)[None]
+
+        self._EVs[EV] = len(self._EVs)
+        if frames_skipped:
+            self._colour_checker_skipped[EV] = tuple(map(str, frames_skipped))
+        self._colour_checker_offsets.append(
+            self._colour_checker_offsets[-1] + len(samples_sequence)
+        )
+
+        self._colour_checker_pending.append((samples_sequence, samples_median))
+
+    def _concatenate_colour_checker(self) -> None:
+        """
+        Concatenate the pending colour checker samples sequences and medians
+        with the contiguous arrays, only once for all the exposure values added
+        since the last read so that adding them is not quadratic.
+        """
+
+        if not self._colour_checker_pending:
+            return
+
+        sequences, medians = zip(*self._colour_checker_pending, strict=True)
+        self._colour_checker_pending = []
+
+        if self._colour_checker_sequences is not None:
+            sequences = (self._colour_checker_sequences, *sequences)
+            medians = (self._colour_checker_medians, *medians)
+
+        self._colour_checker_sequences = np.concatenate(sequences)
+        self._colour_checker_medians = np.concatenate(medians)
+
+    def set_flatfield(
+        self, samples_sequence: ArrayLike, samples_median: ArrayLike
+    ) -> None:
+        """
+        Set the flatfield samples sequence and median.
+
+        Parameters
+        ----------
+        samples_sequence
+            Samples sequence of shape (frames, swatches, channels).
+        samples_median
+            Samples median.
+        """
+
+        self._flatfield_sequence = np.asarray(samples_sequence, dtype=np.float32)
+        self._flatfield_median = np.asarray(samples_median, dtype=np.float64)
+
+    def set_grey_card(
+        self, samples_sequence: ArrayLike, samples_median: ArrayLike
+    ) -> None:
+        """
+        Set the grey card samples sequence and median.
+
+        Parameters
+        ----------
+        samples_sequence
+            Samples sequence of shape (frames, channels).
+        samples_median
+            Samples median.
+        """
+
+        self._grey_card_sequence = np.asarray(samples_sequence, dtype=np.float32)
+        self._grey_card_median = np.asarray(samples_median, dtype=np.float64)
+
+    def to_dict(self) -> Dict:
+        """
+        Convert the samples analysis to its *JSON* view, i.e., nested
+        :class:`dict` and :class:`list` class instances.
+
+        Returns
+        -------
+        :class:`dict`
+            *JSON* view of the samples analysis, the flatfield and grey card
+            entries are empty lists if they were not sampled and the skipped
+            colour checker frames are only listed if any.
+        """
+
+        def view(sequence: NDArrayFloat | None, median: NDArrayFloat | None) -> Any:
+            """Return the *JSON* view of given samples sequence and median."""
+
+            if sequence is None:
+                return []
+
+            return {
+                "samples_sequence": sequence.tolist(),
+                "samples_median": median.tolist(),
+            }
+
+        colour_checker = {}
+        for EV in self._EVs:
+            colour_checker[EV] = view(
+                self.colour_checker_sequence(EV), self.colour_checker_median(EV)
+            )
+
+            if EV in self._colour_checker_skipped:
+                colour_checker[EV]["frames_skipped"] = list(
+                    self._colour_checker_skipped[EV]
+                )
+
+        return {
+            "colour_checker": colour_checker,
+            "grey_card": view(self._grey_card_sequence, self._grey_card_median),
+            "flatfield": view(self._flatfield_sequence, self._flatfield_median),
+        }
+
+    def to_json(self) -> str:
+        """
+        Convert the samples analysis to a *JSON* string representation.
+
+        Returns
+        -------
+        :class:`str`:
+            *JSON* string representation.
+        """
+
+        return json.dumps(self.to_dict(), indent=4)
+
+    @classmethod
+    def from_json(cls, data: Any) -> SamplesAnalysis:
+        """
+        Create a new samples analysis from given *JSON* view or string.
+
+        Parameters
+        ----------
+        data:
+            *JSON* view or string to load the samples analysis from.
+
+        Returns
+        -------
+        :class:`SamplesAnalysis`
+            Loaded samples analysis.
+        """
+
+        if isinstance(data, str):
+            data = json.loads(data)
+
+        samples_analysis = cls()
+        for EV, samples in data.get("colour_checker", {}).items():
+            samples_analysis.add_colour_checker(
+                float(EV),
+                samples["samples_sequence"],
+                samples["samples_median"],
+                samples.get("frames_skipped", ()),
+            )
+
+        if data.get("flatfield"):
+            samples_analysis.set_flatfield(
+                data["flatfield"]["samples_sequence"],
+                data["flatfield"]["samples_median"],
+            )
+
+        if data.get("grey_card"):
+            samples_analysis.set_grey_card(
+                data["grey_card"]["samples_sequence"],
+                data["grey_card"]["samples_median"],
+            )
+
+        return samples_analysis
+
+    def to_arrays(self) -> Dict[str, NDArray]:
+        """
+        Convert the samples analysis to a :class:`dict` of arrays, e.g., to be
+        stored in a *NPZ* file, the samples are not converted to text.
+
+        Returns
+        -------
+        :class:`dict`
+            Arrays of the samples analysis, the skipped colour checker frames
+            are stored as a *JSON* string array.
+        """
+
+        self._concatenate_colour_checker()
+
+        arrays = {
+            "EVs": np.array(list(self._EVs), dtype=np.float64),
+            "colour_checker_offsets": np.array(
+                self._colour_checker_offsets, dtype=np.int64
+            ),
+        }
+
+        for name in (
+            "colour_checker_sequences",
+            "colour_checker_medians",
+            "flatfield_sequence",
+            "flatfield_median",
+            "grey_card_sequence",
+            "grey_card_median",
+        ):
+            value = getattr(self, f"_{name}")
+            if value is not None:
+                arrays[name] = value
+
+        if self._colour_checker_skipped:
+            arrays["colour_checker_skipped"] = np.array(
+                json.dumps(
+                    [
+                        [EV, list(frames_skipped)]
+                        for EV, frames_skipped in self._colour_checker_skipped.items()
+                    ]
+                )
+            )
+
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: Mapping[str, NDArray]) -> SamplesAnalysis:
+        """
+        Create a new samples analysis from given arrays as returned by the
+        :meth:`SamplesAnalysis.to_arrays` method.
+
+        Parameters
+        ----------
+        arrays
+            Arrays to load the samples analysis from.
+
+        Returns
+        -------
+        :class:`SamplesAnalysis`
+            Loaded samples analysis.
+        """
+
+        samples_analysis = cls()
+
+        samples_analysis._EVs = {
+            EV: i for i, EV in enumerate(np.asarray(arrays["EVs"]).tolist())
+        }
+        samples_analysis._colour_checker_offsets = np.asarray(
+            arrays["colour_checker_offsets"]
+        ).tolist()
+
+        for name in (
+            "colour_checker_sequences",
+            "colour_checker_medians",
+            "flatfield_sequence",
+            "flatfield_median",
+            "grey_card_sequence",
+            "grey_card_median",
+        ):
+            if name in arrays:
+                setattr(samples_analysis, f"_{name}", np.asarray(arrays[name]))
+
+        if "colour_checker_skipped" in arrays:
+            samples_analysis._colour_checker_skipped = {
+                EV: tuple(frames_skipped)
+                for EV, frames_skipped in json.loads(
+                    str(arrays["colour_checker_skipped"])
+                )
+            }
+
+        return samples_analysis
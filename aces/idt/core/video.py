@@ -0,0 +1,497 @@
+"""
+Video
+=====
+
+Define the objects reading the frames of the video files, e.g., *ProRes*
+*QuickTime* clips, of an *IDT* archive through *ffmpeg* so that they do not
+have to be exported as still images beforehand.
+
+Only the selected frames are decoded, they are piped as raw pixels by
+*ffmpeg* straight into :class:`np.ndarray` class instances.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import subprocess
+import typing
+from fractions import Fraction
+
+import numpy as np
+from colour.utilities import as_float_array
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+    from colour.hints import Any, Dict, List, NDArrayFloat, Sequence, Tuple
+
+    from aces.idt.core.archive import ZipArchiveReader
+
+from aces.idt.core.archive import resolve_path
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "EXECUTABLE_FFMPEG",
+    "EXECUTABLE_FFPROBE",
+    "EXTENSIONS_VIDEO",
+    "VideoFrame",
+    "is_video",
+    "probe_video",
+    "select_video_frames",
+    "expand_video_frames",
+    "read_video_frame",
+]
+
+LOGGER = logging.getLogger(__name__)
+
+EXECUTABLE_FFMPEG: str = os.environ.get("IDT_FFMPEG", "ffmpeg")
+"""
+*ffmpeg* executable decoding the video frames, can be set with the
+``IDT_FFMPEG`` environment variable.
+"""
+
+EXECUTABLE_FFPROBE: str = os.environ.get("IDT_FFPROBE", "ffprobe")
+"""
+*ffprobe* executable reading the video files properties, can be set with the
+``IDT_FFPROBE`` environment variable.
+"""
+
+EXTENSIONS_VIDEO: tuple = (".avi", ".m4v", ".mkv", ".mov", ".mp4", ".mxf")
+"""Extensions of the files read as video files."""
+
+
+class VideoFrame:
+    """
+    Define a reference to a frame of a video file, used in place of a frame
+    path by the sampling definitions.
+
+    Parameters
+    ----------
+    path
+        Video file path.
+    index
+        Index of the frame in the video file.
+    resolution
+        Resolution of the video file, probed when the frame is decoded if not
+        given.
+    frame_rate
+        Frame rate of the video file, probed when the frame is decoded if not
+        given.
+
+    Attributes
+    ----------
+    -   :attr:`~aces.idt.VideoFrame.path`
+    -   :attr:`~aces.idt.VideoFrame.index`
+    -   :attr:`~aces.idt.VideoFrame.resolution`
+    -   :attr:`~aces.idt.VideoFrame.frame_rate`
+
+    Examples
+    --------
+    >>> VideoFrame("data/colour_checker/0/clip.mov", 12)
+    VideoFrame('data/colour_checker/0/clip.mov', 12)
+    >>> print(VideoFrame("data/colour_checker/0/clip.mov", 12))
+    data/colour_checker/0/clip.mov[12]
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        index: int,
+        resolution: Sequence[int] | None = None,
+        frame_rate: Fraction | None = None,
+    ) -> None:
+        self._path = str(path)
+        self._index = int(index)
+        self._resolution = None if resolution is None else list(resolution)
+        self._frame_rate = frame_rate
+
+    @property
+    def path(self) -> str:
+        """
+        Getter property for the video file path.
+
+        Returns
+        -------
+        :class:`str`
+            Video file path.
+        """
+
+        return self._path
+
+    @property
+    def index(self) -> int:
+        """
+        Getter property for the index of the frame in the video file.
+
+        Returns
+        -------
+        :class:`int`
+            Index of the frame in the video file.
+        """
+
+        return self._index
+
+    @property
+    def resolution(self) -> List[int] | None:
+        """
+        Getter property for the resolution of the video file.
+
+        Returns
+        -------
+        :class:`list` or None
+            Resolution of the video file.
+        """
+
+        return self._resolution
+
+    @property
+    def frame_rate(self) -> Fraction | None:
+        """
+        Getter property for the frame rate of the video file.
+
+        Returns
+        -------
+        :class:`fractions.Fraction` or None
+            Frame rate of the video file.
+        """
+
+        return self._frame_rate
+
+    def __str__(self) -> str:
+        """Return a formatted string representation of the video frame."""
+
+        return f"{self._path}[{self._index}]"
+
+    def __repr__(self) -> str:
+        """Return an evaluable string representation of the video frame."""
+
+        return f"{self.__class__.__name__}({self._path!r}, {self._index})"
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the video frame is equal to given other object."""
+
+        if not isinstance(other, VideoFrame):
+            return NotImplemented
+
+        return (self._path, self._index) == (other.path, other.index)
+
+    def __hash__(self) -> int:
+        """Return the video frame hash."""
+
+        return hash((self._path, self._index))
+
+
+def is_video(path: Any) -> bool:
+    """
+    Return whether given path is a video file path, according to its
+    extension.
+
+    Parameters
+    ----------
+    path
+        Path to test.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether given path is a video file path.
+
+    Examples
+    --------
+    >>> is_video("clip.MOV")
+    True
+    >>> is_video("frame.exr")
+    False
+    """
+
+    if isinstance(path, VideoFrame):
+        return False
+
+    return os.path.splitext(str(path))[1].lower() in EXTENSIONS_VIDEO
+
+
+def _frame_count(stream: Dict, format_: Dict) -> int | None:
+    """
+    Return the frame count of given *ffprobe* stream from its container
+    metadata, i.e., its frame count or its duration and frame rate, or *None*
+    if the container does not store them.
+    """
+
+    with contextlib.suppress(KeyError, ValueError):
+        frames = int(stream["nb_frames"])
+        if frames > 0:
+            return frames
+
+    for properties in (stream, format_):
+        with contextlib.suppress(KeyError, ValueError, ZeroDivisionError):
+            frames = round(
+                float(properties["duration"]) * Fraction(stream["r_frame_rate"])
+            )
+            if frames > 0:
+                return frames
+
+    return None
+
+
+def probe_video(
+    path: str | Path,
+    directory: str | Path | ZipArchiveReader = "",
+    count_frames: bool = True,
+) -> Dict:
+    """
+    Read the resolution, frame count and frame rate of the first video stream
+    of the video file at given path with *ffprobe*.
+
+    The frame count is read from the container metadata, i.e., the stream
+    frame count or its duration and frame rate, so that only the file headers
+    are read. The frames are only counted from the container packets if the
+    container does not store them, the whole file is then read.
+
+    Parameters
+    ----------
+    path
+        Video file path, relative paths are resolved against given directory.
+    directory
+        Directory or archive reader relative paths are resolved against.
+    count_frames
+        Whether to count the frames, the frame count is *None* otherwise.
+
+    Returns
+    -------
+    :class:`dict`
+        Video file format name, resolution, frame count and frame rate.
+
+    Raises
+    ------
+    ValueError
+        If the video file cannot be read.
+    """
+
+    path = resolve_path(path, directory)
+
+    def _probe(count_packets: bool) -> Tuple[Dict, Dict]:
+        """Probe the video file and return its first video stream and format."""
+
+        process = subprocess.run(  # noqa: S603
+            [
+                EXECUTABLE_FFPROBE,
+                "-v",
+                "error",
+                "-select_streams",
+                "v:0",
+                *(["-count_packets"] if count_packets else []),
+                "-show_entries",
+                (
+                    "stream=width,height,nb_frames,nb_read_packets,duration,"
+                    "r_frame_rate:format=format_name,duration"
+                ),
+                "-of",
+                "json",
+                path,
+            ],
+            capture_output=True,
+            check=False,
+        )
+
+        try:
+            properties = json.loads(process.stdout)
+
+            return properties["streams"][0], properties["format"]
+        except (ValueError, KeyError, IndexError) as error:
+            exception = (
+                f'"{path}" video file cannot be probed: '
+                f"{process.stderr.decode(errors='replace').strip() or error}"
+            )
+
+            raise ValueError(exception) from error
+
+    stream, format_ = _probe(False)
+
+    try:
+        frames = None
+        if count_frames:
+            frames = _frame_count(stream, format_)
+            if frames is None:
+                LOGGER.debug('Counting "%s" video file packets...', path)
+
+                stream, format_ = _probe(True)
+                frames = int(stream["nb_read_packets"])
+
+        return {
+            "format_name": format_["format_name"],
+            "resolution": [int(stream["width"]), int(stream["height"])],
+            "frames": frames,
+            "frame_rate": Fraction(stream["r_frame_rate"]),
+        }
+    except (ValueError, KeyError, ZeroDivisionError) as error:
+        exception = f'"{path}" video file cannot be probed: {error}'
+
+        raise ValueError(exception) from error
+
+
+def select_video_frames(frames: int, count: int) -> List[int]:
+    """
+    Select the indices of given count of frames evenly spaced across given
+    frame count.
+
+    Parameters
+    ----------
+    frames
+        Frame count of the video file.
+    count
+        Count of frames to select, a value lower than 1 selects every frame.
+
+    Returns
+    -------
+    :class:`list`
+        Selected frame indices.
+
+    Examples
+    --------
+    >>> select_video_frames(100, 4)
+    [12, 37, 62, 87]
+    >>> select_video_frames(3, 10)
+    [0, 1, 2]
+    """
+
+    if count < 1 or count >= frames:
+        return list(range(frames))
+
+    # The frames are selected at the middle of equal length intervals so that
+    # the first and last frames, possibly affected by a transition, are
+    # avoided.
+    return [int((i + 0.5) * frames / count) for i in range(count)]
+
+
+def expand_video_frames(
+    paths: Sequence[Any],
+    count: int,
+    directory: str | Path | ZipArchiveReader = "",
+) -> List[Any]:
+    """
+    Expand the video file paths of given paths with references to given count
+    of their frames, the other paths are kept as they are.
+
+    Parameters
+    ----------
+    paths
+        Frame and video file paths.
+    count
+        Count of frames selected per video file, a value lower than 1 selects
+        every frame.
+    directory
+        Directory or archive reader relative paths are resolved against.
+
+    Returns
+    -------
+    :class:`list`
+        Frame paths and video frames references.
+    """
+
+    expanded = []
+    for path in paths:
+        if not is_video(path):
+            expanded.append(path)
+            continue
+
+        properties = probe_video(path, directory)
+        indices = select_video_frames(properties["frames"], count)
+
+        LOGGER.info('Selected %s frames of "%s" video file.', len(indices), path)
+
+        expanded.extend(
+            VideoFrame(path, index, properties["resolution"], properties["frame_rate"])
+            for index in indices
+        )
+
+    return expanded
+
+
+def read_video_frame(
+    frame: VideoFrame, directory: str | Path | ZipArchiveReader = ""
+) -> NDArrayFloat:
+    """
+    Decode given video frame with *ffmpeg*.
+
+    *ffmpeg* seeks to the frame, decodes it and converts it to 16-bit *RGB*,
+    the conversion using the matrix and range tagged in the video stream, the
+    raw pixels are then read from its standard output.
+
+    Parameters
+    ----------
+    frame
+        Video frame to decode.
+    directory
+        Directory or archive reader relative paths are resolved against.
+
+    Returns
+    -------
+    :class:`np.ndarray`
+        Decoded frame in domain [0, 1].
+
+    Raises
+    ------
+    ValueError
+        If the video frame cannot be decoded.
+    """
+
+    path = resolve_path(frame.path, directory)
+
+    resolution, frame_rate = frame.resolution, frame.frame_rate
+    if resolution is None or frame_rate is None:
+        properties = probe_video(path, count_frames=False)
+        resolution, frame_rate = properties["resolution"], properties["frame_rate"]
+
+    width, height = resolution
+
+    # Seeking half a frame before the frame timestamp guarantees that the
+    # first frame decoded is the requested one irrespective of the rounding
+    # of the seek time.
+    time = max(frame.index - Fraction(1, 2), 0) / frame_rate
+
+    LOGGER.info('Decoding "%s" video frame...', frame)
+
+    process = subprocess.run(  # noqa: S603
+        [
+            EXECUTABLE_FFMPEG,
+            "-v",
+            "error",
+            "-nostdin",
+            "-ss",
+            f"{float(time):.6f}",
+            "-i",
+            path,
+            "-map",
+            "0:v:0",
+            "-frames:v",
+            "1",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb48le",
+            "-",
+        ],
+        capture_output=True,
+        check=False,
+    )
+
+    if process.returncode != 0 or len(process.stdout) != width * height * 3 * 2:
+        exception = (
+            f'"{frame}" video frame cannot be decoded: '
+            f"{process.stderr.decode(errors='replace').strip()}"
+        )
+
+        raise ValueError(exception)
+
+    image = np.frombuffer(process.stdout, dtype="<u2").reshape(height, width, 3)
+
+    return as_float_array(image) / 65535
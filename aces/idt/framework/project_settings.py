@@ -17,6 +17,7 @@ from colour.utilities import as_float_array, multiline_str
 
 from aces.idt.core import (
     OPTIMISATION_FACTORIES,
+    DirectoryIndex,
     DirectoryStructure,
     MixinSerializableProperties,
 )
@@ -196,6 +197,50 @@ class IDTProjectSettings(MixinSerializableProperties):
             IDTProjectSettings.include_exposure_factor_in_clf.metadata.name,
             IDTProjectSettings.include_exposure_factor_in_clf.metadata.default_value,
         )
+        self._sampling_workers = kwargs.get(
+            IDTProjectSettings.sampling_workers.metadata.name,
+            IDTProjectSettings.sampling_workers.metadata.default_value,
+        )
+        self._sampling_prefetch = kwargs.get(
+            IDTProjectSettings.sampling_prefetch.metadata.name,
+            IDTProjectSettings.sampling_prefetch.metadata.default_value,
+        )
+        self._sampling_region_of_interest = kwargs.get(
+            IDTProjectSettings.sampling_region_of_interest.metadata.name,
+            IDTProjectSettings.sampling_region_of_interest.metadata.default_value,
+        )
+        self._sampling_reduced_resolution = kwargs.get(
+            IDTProjectSettings.sampling_reduced_resolution.metadata.name,
+            IDTProjectSettings.sampling_reduced_resolution.metadata.default_value,
+        )
+        self._sampling_cache_directory = kwargs.get(
+            IDTProjectSettings.sampling_cache_directory.metadata.name,
+            IDTProjectSettings.sampling_cache_directory.metadata.default_value,
+        )
+        self._sampling_cache_size = kwargs.get(
+            IDTProjectSettings.sampling_cache_size.metadata.name,
+            IDTProjectSettings.sampling_cache_size.metadata.default_value,
+        )
+        self._sampling_swatch_index = kwargs.get(
+            IDTProjectSettings.sampling_swatch_index.metadata.name,
+            IDTProjectSettings.sampling_swatch_index.metadata.default_value,
+        )
+        self._sampling_early_stop = kwargs.get(
+            IDTProjectSettings.sampling_early_stop.metadata.name,
+            IDTProjectSettings.sampling_early_stop.metadata.default_value,
+        )
+        self._sampling_early_stop_tolerance = kwargs.get(
+            IDTProjectSettings.sampling_early_stop_tolerance.metadata.name,
+            IDTProjectSettings.sampling_early_stop_tolerance.metadata.default_value,
+        )
+        self._sampling_video_frames = kwargs.get(
+            IDTProjectSettings.sampling_video_frames.metadata.name,
+            IDTProjectSettings.sampling_video_frames.metadata.default_value,
+        )
+        self._sampling_duplicate_frames = kwargs.get(
+            IDTProjectSettings.sampling_duplicate_frames.metadata.name,
+            IDTProjectSettings.sampling_duplicate_frames.metadata.default_value,
+        )
 
     @metadata_property(metadata=MetadataConstants.SCHEMA_VERSION)
     def schema_version(self) -> str:
@@ -628,6 +673,162 @@ class IDTProjectSettings(MixinSerializableProperties):
 
         return self._include_exposure_factor_in_clf
 
+    @metadata_property(metadata=MetadataConstants.SAMPLING_WORKERS)
+    def sampling_workers(self) -> int:
+        """
+        Getter property for the number of worker processes used to sample the
+        images.
+
+        Returns
+        -------
+        :class:`int`
+            Number of worker processes used to sample the images.
+        """
+
+        return self._sampling_workers
+
+    @metadata_property(metadata=MetadataConstants.SAMPLING_PREFETCH)
+    def sampling_prefetch(self) -> int:
+        """
+        Getter property for the number of frames read and decoded ahead of the
+        sampling.
+
+        Returns
+        -------
+        :class:`int`
+            Number of frames read and decoded ahead of the sampling.
+        """
+
+        return self._sampling_prefetch
+
+    @metadata_property(metadata=MetadataConstants.SAMPLING_REGION_OF_INTEREST)
+    def sampling_region_of_interest(self) -> bool:
+        """
+        Getter property for whether to only decode the frames region covering the
+        colour checker.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether to only decode the frames region covering the colour checker.
+        """
+
+        return self._sampling_region_of_interest
+
+    @metadata_property(metadata=MetadataConstants.SAMPLING_REDUCED_RESOLUTION)
+    def sampling_reduced_resolution(self) -> bool:
+        """
+        Getter property for whether to decode the frames directly at the working
+        resolution.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether to decode the frames directly at the working resolution.
+        """
+
+        return self._sampling_reduced_resolution
+
+    @metadata_property(metadata=MetadataConstants.SAMPLING_CACHE_DIRECTORY)
+    def sampling_cache_directory(self) -> str:
+        """
+        Getter property for the directory of the persistent frame samples cache.
+
+        Returns
+        -------
+        :class:`str`
+            The directory of the persistent frame samples cache.
+        """
+
+        return self._sampling_cache_directory
+
+    @metadata_property(metadata=MetadataConstants.SAMPLING_CACHE_SIZE)
+    def sampling_cache_size(self) -> int:
+        """
+        Getter property for the maximum size in bytes of the persistent frame
+        samples cache.
+
+        Returns
+        -------
+        :class:`int`
+            The maximum size in bytes of the persistent frame samples cache.
+        """
+
+        return self._sampling_cache_size
+
+    @metadata_property(metadata=MetadataConstants.SAMPLING_SWATCH_INDEX)
+    def sampling_swatch_index(self) -> bool:
+        """
+        Getter property for whether to gather the swatches colours of the frames
+        with a swatch index instead of warping each frame.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether to gather the swatches colours of the frames with a swatch
+            index instead of warping each frame.
+        """
+
+        return self._sampling_swatch_index
+
+    @metadata_property(metadata=MetadataConstants.SAMPLING_EARLY_STOP)
+    def sampling_early_stop(self) -> bool:
+        """
+        Getter property for whether to stop sampling the frames of an exposure once
+        the robust estimate of the swatches colours is stable.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether to stop sampling the frames of an exposure once the robust
+            estimate of the swatches colours is stable.
+        """
+
+        return self._sampling_early_stop
+
+    @metadata_property(metadata=MetadataConstants.SAMPLING_EARLY_STOP_TOLERANCE)
+    def sampling_early_stop_tolerance(self) -> float:
+        """
+        Getter property for the relative tolerance the robust estimate of the
+        swatches colours must be stable within to stop sampling early.
+
+        Returns
+        -------
+        :class:`float`
+            The relative tolerance the robust estimate of the swatches colours must
+            be stable within to stop sampling early.
+        """
+
+        return self._sampling_early_stop_tolerance
+
+    @metadata_property(metadata=MetadataConstants.SAMPLING_VIDEO_FRAMES)
+    def sampling_video_frames(self) -> int:
+        """
+        Getter property for the number of frames sampled from each video file.
+
+        Returns
+        -------
+        :class:`int`
+            The number of frames sampled from each video file.
+        """
+
+        return self._sampling_video_frames
+
+    @metadata_property(metadata=MetadataConstants.SAMPLING_DUPLICATE_FRAMES)
+    def sampling_duplicate_frames(self) -> bool:
+        """
+        Getter property for whether to detect the frames with the same content
+        so that they are only sampled once.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether to detect the frames with the same content so that they are
+            only sampled once.
+        """
+
+        return self._sampling_duplicate_frames
+
     def get_reference_colour_checker_samples(self) -> NDArrayFloat:
         """
         Return the reference colour checker samples.
@@ -681,16 +882,24 @@ class IDTProjectSettings(MixinSerializableProperties):
             setattr(self, name, prop.getter(value))
 
     @classmethod
-    def from_directory(cls, directory: str) -> IDTProjectSettings:
+    def from_directory(
+        cls, directory: str, persist_index: bool = False
+    ) -> IDTProjectSettings:
         """
         Create a new project settings for a given directory on disk and build
         the data structure based on the files on disk.
 
+        The directory is indexed in a single pass, an index persisted in the
+        directory is used instead if it is not stale.
+
         Parameters
         ----------
         directory
             The directory to the project root containing the image sequence
             directories.
+        persist_index
+            Whether to persist the index in the directory so that it does not
+            have to be walked again when re-opened.
         """
 
         instance = cls()
@@ -699,35 +908,34 @@ class IDTProjectSettings(MixinSerializableProperties):
             DirectoryStructure.GREY_CARD: [],
         }
 
+        index = DirectoryIndex.from_directory(directory, persist_index)
+
         # Validate folder paths for colour_checker and grey_card exist
         colour_checker_path = os.path.join(
-            directory, DirectoryStructure.DATA, DirectoryStructure.COLOUR_CHECKER
+            DirectoryStructure.DATA, DirectoryStructure.COLOUR_CHECKER
         )
         grey_card_path = os.path.join(
-            directory, DirectoryStructure.DATA, DirectoryStructure.GREY_CARD
+            DirectoryStructure.DATA, DirectoryStructure.GREY_CARD
         )
 
-        if not os.path.exists(colour_checker_path) or not os.path.exists(
-            grey_card_path
-        ):
+        if not index.is_dir(colour_checker_path) or not index.is_dir(grey_card_path):
             msg = 'Required "colour_checker" or "grey_card" folder does not exist.'
             raise ValueError(msg)
 
-        # Populate colour_checker data
-        for root, _, files in os.walk(colour_checker_path):
-            for file in files:
-                exposure_value = os.path.basename(
-                    root
-                )  # Assuming folder names are the exposure values
-                if os.path.basename(file).startswith("."):
-                    continue
-
-                if exposure_value not in data[DirectoryStructure.COLOUR_CHECKER]:
-                    data[DirectoryStructure.COLOUR_CHECKER][exposure_value] = []
-                absolute_file_path = os.path.join(root, file)
-                data[DirectoryStructure.COLOUR_CHECKER][exposure_value].append(
-                    os.path.relpath(absolute_file_path, start=directory)
-                )
+        for path in sorted(index.files):
+            if os.path.basename(path).startswith("."):
+                continue
+
+            # Populate colour_checker data
+            if path.startswith(colour_checker_path + os.sep):
+                # Assuming folder names are the exposure values
+                exposure_value = os.path.basename(os.path.dirname(path))
+                data[DirectoryStructure.COLOUR_CHECKER].setdefault(
+                    exposure_value, []
+                ).append(path)
+            # Populate grey_card data
+            elif path.startswith(grey_card_path + os.sep):
+                data[DirectoryStructure.GREY_CARD].append(path)
 
         sorted_keys = sorted(
             data[DirectoryStructure.COLOUR_CHECKER], key=sort_exposure_keys
@@ -740,17 +948,6 @@ class IDTProjectSettings(MixinSerializableProperties):
 
         data[DirectoryStructure.COLOUR_CHECKER] = sorted_colour_checker
 
-        # Populate grey_card data
-        for root, _, files in os.walk(grey_card_path):
-            files.sort()
-            for file in files:
-                if os.path.basename(file).startswith("."):
-                    continue
-                absolute_file_path = os.path.join(root, file)
-                data[DirectoryStructure.GREY_CARD].append(
-                    os.path.relpath(absolute_file_path, start=directory)
-                )
-
         instance.data = data
         return instance
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import base64
 import io
+import json
 import logging
 import os
 import re
@@ -16,18 +17,27 @@ import shutil
 import typing
 import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
-from copy import deepcopy
+from collections import defaultdict
 from pathlib import Path
 from zipfile import ZipFile
 
 import colour
 import cv2
-import jsonpickle
 import numpy as np
 from colour import LUT1D, LUT3x1D, read_image
 
 if typing.TYPE_CHECKING:
-    from colour.hints import ArrayLike, NDArray, NDArrayFloat, NDArrayInt
+    from colour.hints import (
+        IO,
+        Any,
+        ArrayLike,
+        Dict,
+        List,
+        NDArray,
+        NDArrayFloat,
+        NDArrayInt,
+        Sequence,
+    )
 
 from colour.utilities import Structure, as_float_array, optional, zeros
 from colour_checker_detection.detection import (
@@ -35,24 +45,36 @@ from colour_checker_detection.detection import (
     reformat_image,
     sample_colour_checker,
     segmenter_default,
+    swatch_masks,
 )
 from matplotlib import pyplot as plt
 
 from aces.idt import ProjectSettingsMetadataConstants
 
 if typing.TYPE_CHECKING:
-    from aces.idt import IDTProjectSettings
+    from aces.idt.core.archive import ZipArchiveReader
 
 from aces.idt.core import (
     EXPOSURE_CLIPPING_THRESHOLD,
     SAMPLES_COUNT_DEFAULT,
     SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC,
     DirectoryStructure,
+    SamplesAnalysis,
     clf_processing_elements,
     find_similar_rows,
     mask_outliers,
-    working_directory,
 )
+from aces.idt.core.archive import resolve_path
+from aces.idt.core.cache import SamplesCache
+from aces.idt.core.index import DirectoryIndex, find_duplicate_frames
+from aces.idt.core.sampling import (
+    read_frame,
+    read_frame_reduced,
+    sample_frames,
+    sample_frames_until_stable,
+)
+from aces.idt.core.video import VideoFrame, expand_video_frames
+from aces.idt.framework import IDTProjectSettings
 
 __author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
 __copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
@@ -68,6 +90,113 @@ __all__ = [
 
 LOGGER = logging.getLogger(__name__)
 
+_CLASSES_LUT: Dict = {"LUT1D": LUT1D, "LUT3x1D": LUT3x1D}
+"""*LUT* classes the generator state can store."""
+
+
+def _state_entry(  # noqa: PLR0911
+    value: Any, name: str, arrays: Dict[str, NDArray]
+) -> Dict:
+    """
+    Return the manifest entry of given generator attribute value, storing its
+    arrays in given :class:`dict` of arrays.
+    """
+
+    if value is None:
+        return {"type": "none"}
+
+    if isinstance(value, (LUT1D, LUT3x1D)):
+        arrays[f"{name}.table"] = value.table
+        arrays[f"{name}.domain"] = value.domain
+
+        return {"type": value.__class__.__name__, "name": value.name}
+
+    if isinstance(value, SamplesAnalysis):
+        for key, array in value.to_arrays().items():
+            arrays[f"{name}.{key}"] = array
+
+        return {"type": "SamplesAnalysis"}
+
+    if isinstance(value, (np.ndarray, np.generic)):
+        arrays[name] = np.asarray(value)
+
+        return {"type": "ndarray", "scalar": isinstance(value, np.generic)}
+
+    if isinstance(value, dict):
+        return {
+            "type": "dict",
+            "keys": list(value),
+            "values": [
+                _state_entry(item, f"{name}.{i}", arrays)
+                for i, item in enumerate(value.values())
+            ],
+        }
+
+    if isinstance(value, (list, tuple)):
+        return {
+            "type": "list",
+            "values": [
+                _state_entry(item, f"{name}.{i}", arrays)
+                for i, item in enumerate(value)
+            ],
+        }
+
+    if isinstance(value, (bool, int, float, str)):
+        return {"type": "json", "value": value}
+
+    msg = (
+        f'"{name}" attribute of "{value.__class__.__name__}" type cannot be '
+        f"stored in the generator state!"
+    )
+    raise TypeError(msg)
+
+
+def _state_value(entry: Dict, name: str, arrays: Any) -> Any:  # noqa: PLR0911
+    """
+    Return the generator attribute value of given manifest entry, reading its
+    arrays from given *NPZ* file.
+    """
+
+    type_ = entry["type"]
+
+    if type_ == "none":
+        return None
+
+    if type_ in _CLASSES_LUT:
+        return _CLASSES_LUT[type_](
+            arrays[f"{name}.table"], entry["name"], arrays[f"{name}.domain"]
+        )
+
+    if type_ == "SamplesAnalysis":
+        prefix = f"{name}."
+
+        return SamplesAnalysis.from_arrays(
+            {
+                key[len(prefix) :]: arrays[key]
+                for key in arrays.files
+                if key.startswith(prefix)
+            }
+        )
+
+    if type_ == "ndarray":
+        return arrays[name][()] if entry["scalar"] else arrays[name]
+
+    if type_ == "dict":
+        return {
+            key: _state_value(item, f"{name}.{i}", arrays)
+            for i, (key, item) in enumerate(
+                zip(entry["keys"], entry["values"], strict=True)
+            )
+        }
+
+    if type_ == "list":
+        return [
+            _state_value(item, f"{name}.{i}", arrays)
+            for i, item in enumerate(entry["values"])
+        ]
+
+    return entry["value"]
+
 
 class IDTBaseGenerator(ABC):
     """
@@ -81,6 +210,8 @@ class IDTBaseGenerator(ABC):
     Attributes
     ----------
     -   :attr:`~aces.idt.IDTBaseGenerator.project_settings`
+    -   :attr:`~aces.idt.IDTBaseGenerator.archive`
+    -   :attr:`~aces.idt.IDTBaseGenerator.index`
     -   :attr:`~aces.idt.IDTBaseGenerator.image_colour_checker_segmentation`
     -   :attr:`~aces.idt.IDTBaseGenerator.baseline_exposure`
     -   :attr:`~aces.idt.IDTBaseGenerator.image_grey_card_sampling`
@@ -93,6 +224,7 @@ class IDTBaseGenerator(ABC):
     -   :attr:`~aces.idt.IDTBaseGenerator.RGB_w`
     -   :attr:`~aces.idt.IDTBaseGenerator.k`
     -   :attr:`~aces.idt.IDTBaseGenerator.samples_analysis`
+    -   :attr:`~aces.idt.IDTBaseGenerator.zip_filename`
 
     Methods
     -------
@@ -103,6 +235,9 @@ class IDTBaseGenerator(ABC):
     -   :meth:`~aces.idt.IDTBaseGenerator.decode`
     -   :meth:`~aces.idt.IDTBaseGenerator.optimise`
     -   :meth:`~aces.idt.IDTBaseGenerator.to_clf`
+    -   :meth:`~aces.idt.IDTBaseGenerator.to_npz`
+    -   :meth:`~aces.idt.IDTBaseGenerator.from_npz`
+    -   :meth:`~aces.idt.IDTBaseGenerator.zip_bytes`
     -   :meth:`~aces.idt.IDTBaseGenerator.zip`
     -   :meth:`~aces.idt.IDTBaseGenerator.png_colour_checker_segmentation`
     -   :meth:`~aces.idt.IDTBaseGenerator.png_grey_card_sampling`
@@ -111,8 +246,13 @@ class IDTBaseGenerator(ABC):
     GENERATOR_NAME = "IDTBaseGenerator"
     """*IDT* generator name."""
 
+    STATE_VERSION = 1
+    """Version of the *IDT* generator state format."""
+
     def __init__(self, project_settings: IDTProjectSettings) -> None:
         self._project_settings = project_settings
+        self._archive = None
+        self._index = None
         self._samples_analysis = None
 
         self._samples_camera = None
@@ -146,6 +286,47 @@ class IDTBaseGenerator(ABC):
 
         return self._project_settings
 
+    @property
+    def archive(self) -> ZipArchiveReader | None:
+        """
+        Getter and setter property for the archive reader the frames are read
+        from, the frames are otherwise read from the working directory.
+
+        Returns
+        -------
+        :class:`ZipArchiveReader` or :py:data:`None`
+            Archive reader the frames are read from.
+        """
+
+        return self._archive
+
+    @archive.setter
+    def archive(self, value: ZipArchiveReader | None) -> None:
+        """Setter for the **self.archive** property."""
+
+        self._archive = value
+
+    @property
+    def index(self) -> DirectoryIndex | None:
+        """
+        Getter and setter property for the index of the working directory,
+        e.g., built when the archive was extracted, it is otherwise loaded or
+        built when required.
+
+        Returns
+        -------
+        :class:`DirectoryIndex` or :py:data:`None`
+            Index of the working directory.
+        """
+
+        return self._index
+
+    @index.setter
+    def index(self, value: DirectoryIndex | None) -> None:
+        """Setter for the **self.index** property."""
+
+        self._index = value
+
     @property
     def image_colour_checker_segmentation(self) -> NDArrayFloat | None:
         """
@@ -335,14 +516,14 @@ class IDTBaseGenerator(ABC):
         return self._whitepoint
 
     @property
-    def samples_analysis(self) -> NDArrayFloat | None:
+    def samples_analysis(self) -> SamplesAnalysis | None:
         """
         Getter property for the samples produced by the colour checker sampling
         process.
 
         Returns
         -------
-        :class:`NDArray` or :py:data:`None`
+        :class:`SamplesAnalysis` or :py:data:`None`
             Samples produced by the colour checker sampling process.
         """
 
@@ -375,7 +556,7 @@ class IDTBaseGenerator(ABC):
             ]
         )
 
-        self._samples_analysis = deepcopy(self.project_settings.data)
+        self._samples_analysis = SamplesAnalysis()
         # Baseline exposure value, it can be different from zero.
         if 0 not in self.project_settings.data[DirectoryStructure.COLOUR_CHECKER]:
             EVs = sorted(
@@ -386,17 +567,47 @@ class IDTBaseGenerator(ABC):
                 "Baseline exposure is different from zero: %s", self._baseline_exposure
             )
 
-        paths = self.project_settings.data[DirectoryStructure.COLOUR_CHECKER][
-            self._baseline_exposure
-        ]
+        # Relative paths are resolved explicitly against the working directory
+        # rather than by changing the process current working directory so
+        # that several generators can sample concurrently. The frames of an
+        # archive read on demand are materialised as they are resolved.
+        directory = optional(self._archive, self.project_settings.working_directory)
 
-        with working_directory(self.project_settings.working_directory):
-            LOGGER.info(
-                'Reading EV "%s" baseline exposure "ColourChecker" from "%s"...',
-                self._baseline_exposure,
-                paths[0],
+        # The video files are expanded with references to their selected
+        # frames, which are then sampled as any other frame.
+        def _expand_video_frames(paths: Sequence[str | Path]) -> List:
+            """Expand the video files of given paths with their frames."""
+
+            return expand_video_frames(
+                paths, self.project_settings.sampling_video_frames, directory
             )
-            image = _reformat_image(read_image(str(paths[0])))
+
+        paths_flatfield = _expand_video_frames(
+            self.project_settings.data.get(DirectoryStructure.FLATFIELD, [])
+        )
+        paths_grey_card = _expand_video_frames(
+            self.project_settings.data.get(DirectoryStructure.GREY_CARD, [])
+        )
+        paths_colour_checker = {
+            EV: _expand_video_frames(paths)
+            for EV, paths in self.project_settings.data[
+                DirectoryStructure.COLOUR_CHECKER
+            ].items()
+        }
+
+        path = paths_colour_checker[self._baseline_exposure][0]
+
+        LOGGER.info(
+            'Reading EV "%s" baseline exposure "ColourChecker" from "%s"...',
+            self._baseline_exposure,
+            path,
+        )
+        if isinstance(path, VideoFrame):
+            image = read_frame(path, settings, directory)
+        elif self.project_settings.sampling_reduced_resolution:
+            image = read_frame_reduced(resolve_path(path, directory), settings)
+        else:
+            image = _reformat_image(read_image(resolve_path(path, directory)))
 
         (
             rectangles,
@@ -426,114 +637,117 @@ class IDTBaseGenerator(ABC):
         # Disabling orientation as we now have an oriented quadrilateral
         settings.reference_values = None
 
-        # Flatfield
-        if self.project_settings.data.get(DirectoryStructure.FLATFIELD):
-            self._samples_analysis[DirectoryStructure.FLATFIELD] = {
-                "samples_sequence": []
-            }
-            for path in self.project_settings.data.get(
-                DirectoryStructure.FLATFIELD, []
-            ):
-                with working_directory(self.project_settings.working_directory):
-                    LOGGER.info('Reading flatfield image from "%s"...', path)
-                    image = _reformat_image(read_image(path))
-
-                data_detection_flatfield = sample_colour_checker(
-                    image,
-                    data_detection_colour_checker_EV0.quadrilateral,
-                    rectangle,
-                    SAMPLES_COUNT_DEFAULT,
-                    **settings,
-                )
-
-                self._samples_analysis[DirectoryStructure.FLATFIELD][
-                    "samples_sequence"
-                ].append(data_detection_flatfield.swatch_colours.tolist())
+        settings_grey_card = Structure(**settings)
+        settings_grey_card.swatches_horizontal = 1
+        settings_grey_card.swatches_vertical = 1
+
+        # The index retains the content hashes of the frames, it is only
+        # required to find the duplicate frames or to key the samples cache.
+        index = (
+            self._index_working_directory()
+            if self.project_settings.sampling_duplicate_frames
+            or self.project_settings.sampling_cache_directory
+            else None
+        )
 
-            samples_sequence = as_float_array(
-                [
-                    samples[0]
-                    for samples in self._samples_analysis[DirectoryStructure.FLATFIELD][
-                        "samples_sequence"
-                    ]
-                ]
+        # The frames with the same content are only sampled once, through
+        # the path of their first occurrence, their samples being reused for
+        # every reference. The duplicate frames of an exposure are dropped so
+        # that they do not weigh on its statistics.
+        duplicates = (
+            self._find_duplicate_frames(
+                paths_flatfield, paths_grey_card, paths_colour_checker, index
             )
-            mask = np.all(~mask_outliers(samples_sequence), axis=-1)
-
-            self._samples_analysis[DirectoryStructure.FLATFIELD]["samples_median"] = (
-                np.median(
-                    as_float_array(
-                        self._samples_analysis[DirectoryStructure.FLATFIELD][
-                            "samples_sequence"
-                        ]
-                    )[mask],
-                    (0, 1),
-                ).tolist()
+            if self.project_settings.sampling_duplicate_frames
+            else {}
+        )
+        paths_colour_checker_sampled = {
+            EV: list(dict.fromkeys(duplicates.get(path, path) for path in paths_EV))
+            for EV, paths_EV in paths_colour_checker.items()
+        }
+
+        # Every remaining frame is fanned out at once, the results are then
+        # reassembled in the same deterministic order. When the sampling can
+        # stop early, the colour checker frames are sampled serially per
+        # exposure so that the frames past the stop are not read.
+        frames = [
+            (duplicates.get(path, path), settings, False) for path in paths_flatfield
+        ]
+        frames += [
+            (
+                duplicates.get(path, path),
+                settings_grey_card,
+                i == len(paths_grey_card) - 1,
             )
+            for i, path in enumerate(paths_grey_card)
+        ]
+        early_stop = self.project_settings.sampling_early_stop
+        if not early_stop:
+            for paths_EV in paths_colour_checker_sampled.values():
+                frames += [(path, settings, False) for path in paths_EV]
+
+        cache = (
+            SamplesCache(
+                self.project_settings.sampling_cache_directory,
+                self.project_settings.sampling_cache_size,
+            )
+            if self.project_settings.sampling_cache_directory
+            else None
+        )
 
-        # Grey Card
-        if self.project_settings.data.get(DirectoryStructure.GREY_CARD, []):
-            self._samples_analysis[DirectoryStructure.GREY_CARD] = {
-                "samples_sequence": []
-            }
+        kwargs = {
+            "directory": directory,
+            "workers": self.project_settings.sampling_workers,
+            "prefetch": self.project_settings.sampling_prefetch,
+            "region_of_interest": self.project_settings.sampling_region_of_interest,
+            "reduced_resolution": self.project_settings.sampling_reduced_resolution,
+            "use_swatch_index": self.project_settings.sampling_swatch_index,
+            "cache": cache,
+            "memo": {},
+            "index": index if isinstance(index, DirectoryIndex) else None,
+        }
+
+        results = sample_frames(
+            frames, data_detection_colour_checker_EV0.quadrilateral, rectangle, **kwargs
+        )
 
-            settings_grey_card = Structure(**settings)
-            settings_grey_card.swatches_horizontal = 1
-            settings_grey_card.swatches_vertical = 1
+        # Flatfield
+        if paths_flatfield:
+            samples_sequence = as_float_array(
+                [next(results)[0] for _path in paths_flatfield]
+            )
+            mask = np.all(~mask_outliers(samples_sequence[:, 0]), axis=-1)
 
-            for path in self.project_settings.data.get(
-                DirectoryStructure.GREY_CARD, []
-            ):
-                with working_directory(self.project_settings.working_directory):
-                    LOGGER.info('Reading grey card image from "%s"...', path)
-                    image = _reformat_image(read_image(path))
+            self._samples_analysis.set_flatfield(
+                samples_sequence, np.median(samples_sequence[mask], (0, 1))
+            )
 
-                data_detection_grey_card = sample_colour_checker(
-                    image,
-                    data_detection_colour_checker_EV0.quadrilateral,
-                    rectangle,
-                    SAMPLES_COUNT_DEFAULT,
-                    **settings_grey_card,
-                )
+        # Grey Card
+        if paths_grey_card:
+            samples_sequence = []
+            for _path in paths_grey_card:
+                swatch_colours, image = next(results)
 
-                grey_card_colour = np.ravel(data_detection_grey_card.swatch_colours)
+                samples_sequence.append(np.ravel(swatch_colours))
 
-                self._samples_analysis[DirectoryStructure.GREY_CARD][
-                    "samples_sequence"
-                ].append(grey_card_colour.tolist())
+            samples_sequence = as_float_array(samples_sequence)
+            mask = np.all(~mask_outliers(samples_sequence[:, 0]), axis=-1)
 
-            samples_sequence = as_float_array(
-                [
-                    samples[0]
-                    for samples in self._samples_analysis[DirectoryStructure.GREY_CARD][
-                        "samples_sequence"
-                    ]
-                ]
-            )
-            mask = np.all(~mask_outliers(samples_sequence), axis=-1)
-
-            self._samples_analysis[DirectoryStructure.GREY_CARD]["samples_median"] = (
-                np.median(
-                    as_float_array(
-                        self._samples_analysis[DirectoryStructure.GREY_CARD][
-                            "samples_sequence"
-                        ]
-                    )[mask],
-                    (0, 1),
-                ).tolist()
+            self._samples_analysis.set_grey_card(
+                samples_sequence, np.median(samples_sequence[mask], (0, 1))
             )
 
+            grey_card_swatch_mask = swatch_masks(
+                working_width, working_height, 1, 1, SAMPLES_COUNT_DEFAULT
+            )[0]
+
             self._image_grey_card_sampling = np.copy(image)
             image_grey_card_contour = zeros(
                 (working_height, working_width), dtype=np.uint8
             )
             image_grey_card_contour[
-                data_detection_grey_card.swatch_masks[0][
-                    0
-                ] : data_detection_grey_card.swatch_masks[0][1],
-                data_detection_grey_card.swatch_masks[0][
-                    2
-                ] : data_detection_grey_card.swatch_masks[0][3],
+                grey_card_swatch_mask[0] : grey_card_swatch_mask[1],
+                grey_card_swatch_mask[2] : grey_card_swatch_mask[3],
                 ...,
             ] = 255
             contours, _hierarchy = cv2.findContours(
@@ -548,60 +762,144 @@ class IDTBaseGenerator(ABC):
             )
 
         # ColourChecker Classic Samples per EV
-        self._samples_analysis[DirectoryStructure.COLOUR_CHECKER] = {}
-        for EV in self.project_settings.data[DirectoryStructure.COLOUR_CHECKER]:
-            self._samples_analysis[DirectoryStructure.COLOUR_CHECKER][EV] = {}
-            self._samples_analysis[DirectoryStructure.COLOUR_CHECKER][EV][
-                "samples_sequence"
-            ] = []
-            for path in self.project_settings.data[DirectoryStructure.COLOUR_CHECKER][
-                EV
-            ]:
-                with working_directory(self.project_settings.working_directory):
-                    LOGGER.info(
-                        'Reading EV "%s" "ColourChecker" from "%s"...',
-                        EV,
-                        path,
-                    )
-
-                    image = _reformat_image(read_image(path))
-
-                data_detection_colour_checker = sample_colour_checker(
-                    image,
+        if early_stop:
+            # The flatfield and grey card frames sampling is completed, its
+            # worker processes are released before sampling every exposure.
+            results.close()
+
+        for EV, paths_EV in paths_colour_checker_sampled.items():
+            frames_duplicate = len(paths_colour_checker[EV]) - len(paths_EV)
+            if frames_duplicate:
+                LOGGER.info(
+                    'Dropped %s duplicate "ColourChecker" frames of EV "%s".',
+                    frames_duplicate,
+                    EV,
+                )
+
+            # The samples of the EV frames are reduced as a single
+            # (frames, swatches, channels) array.
+            if early_stop:
+                samples_sequence = sample_frames_until_stable(
+                    [(path, settings, False) for path in paths_EV],
                     data_detection_colour_checker_EV0.quadrilateral,
                     rectangle,
-                    SAMPLES_COUNT_DEFAULT,
-                    **settings,
+                    self.project_settings.sampling_early_stop_tolerance,
+                    **kwargs,
                 )
+            else:
+                samples_sequence = as_float_array(
+                    [next(results)[0] for _path in paths_EV]
+                )
+
+            frames_skipped = paths_EV[len(samples_sequence) :]
+            if frames_skipped:
+                LOGGER.info(
+                    'Skipped %s "ColourChecker" frames of EV "%s" as the samples '
+                    "are stable.",
+                    len(frames_skipped),
+                    EV,
+                )
+
+            mask = np.all(~mask_outliers(samples_sequence[:, 21]), axis=-1)
 
-                self._samples_analysis[DirectoryStructure.COLOUR_CHECKER][EV][
-                    "samples_sequence"
-                ].append(data_detection_colour_checker.swatch_colours.tolist())
-
-            sequence_neutral_5 = as_float_array(
-                [
-                    samples[21]
-                    for samples in self._samples_analysis[
-                        DirectoryStructure.COLOUR_CHECKER
-                    ][EV]["samples_sequence"]
-                ]
+            self._samples_analysis.add_colour_checker(
+                EV,
+                samples_sequence,
+                np.median(samples_sequence[mask], 0),
+                frames_skipped,
             )
-            mask = np.all(~mask_outliers(sequence_neutral_5), axis=-1)
-
-            self._samples_analysis[DirectoryStructure.COLOUR_CHECKER][EV][
-                "samples_median"
-            ] = np.median(
-                as_float_array(
-                    self._samples_analysis[DirectoryStructure.COLOUR_CHECKER][EV][
-                        "samples_sequence"
-                    ]
-                )[mask],
-                0,
-            ).tolist()
+
+        results.close()
 
         if self.project_settings.cleanup:
             shutil.rmtree(self.project_settings.working_directory)
 
+    def _index_working_directory(self) -> ZipArchiveReader | DirectoryIndex:
+        """
+        Return the reader of the archive or the index of the working
+        directory the frames are fingerprinted and hashed with.
+
+        The archive reader fingerprints its members from its central
+        directory, the index of the directory the archive was extracted to is
+        reused if the working directory is within it, the index is otherwise
+        loaded if it was persisted.
+
+        Returns
+        -------
+        :class:`ZipArchiveReader` or :class:`DirectoryIndex`
+            Reader of the archive or index of the working directory.
+        """
+
+        if self._archive is not None:
+            return self._archive
+
+        working_directory = os.path.abspath(self.project_settings.working_directory)
+        if self._index is not None:
+            directory = os.path.abspath(self._index.directory)
+            if os.path.commonpath([directory, working_directory]) == directory:
+                return self._index
+
+        return DirectoryIndex.from_directory(working_directory)
+
+    def _find_duplicate_frames(
+        self,
+        paths_flatfield: Sequence[str | Path],
+        paths_grey_card: Sequence[str | Path],
+        paths_colour_checker: Dict[float, Sequence[str | Path]],
+        index: ZipArchiveReader | DirectoryIndex,
+    ) -> Dict:
+        """
+        Find the duplicate frames of given frames, see
+        :func:`aces.idt.find_duplicate_frames` definition, and warn about the
+        *ColourChecker* frames shared by several exposures.
+
+        Parameters
+        ----------
+        paths_flatfield
+            Flatfield frame paths.
+        paths_grey_card
+            Grey card frame paths.
+        paths_colour_checker
+            *ColourChecker* frame paths per exposure.
+        index
+            Reader of the archive or index of the working directory, see
+            :meth:`IDTBaseGenerator._index_working_directory` method.
+
+        Returns
+        -------
+        :class:`dict`
+            Path of the first frame with the same content keyed by the path of
+            each duplicate frame.
+        """
+
+        paths = [*paths_flatfield, *paths_grey_card]
+        for paths_EV in paths_colour_checker.values():
+            paths.extend(paths_EV)
+
+        duplicates = find_duplicate_frames(paths, index)
+
+        if duplicates:
+            LOGGER.info(
+                "Found %s duplicate frames, they are only sampled once.",
+                len(duplicates),
+            )
+
+        EVs = defaultdict(set)
+        for EV, paths_EV in paths_colour_checker.items():
+            for path in paths_EV:
+                EVs[duplicates.get(path, path)].add(EV)
+
+        for path, EVs_path in EVs.items():
+            if len(EVs_path) > 1:
+                LOGGER.warning(
+                    '"ColourChecker" frame "%s" is shared by the %s exposures, '
+                    "the exposure bracket is likely broken!",
+                    path,
+                    ", ".join(f'"{EV}"' for EV in sorted(EVs_path)),
+                )
+
+        return duplicates
+
     def sort(self, start_index: int | None = None) -> NDArrayInt:
         """
         Sort the samples produced by the image sampling process.
@@ -632,13 +930,13 @@ class IDTBaseGenerator(ABC):
 
         samples_camera = []
         samples_reference = []
-        for EV, images in self._samples_analysis[
-            DirectoryStructure.COLOUR_CHECKER
-        ].items():
+        for EV in self._samples_analysis.EVs:
             samples_reference.append(
                 reference_colour_checker_samples[start_index:, ...] * pow(2, EV)
             )
-            samples_EV = as_float_array(images["samples_median"])[start_index:, ...]
+            samples_EV = self._samples_analysis.colour_checker_median(EV)[
+                start_index:, ...
+            ]
             samples_camera.append(samples_EV)
 
         self._samples_camera = np.vstack(samples_camera)
@@ -693,27 +991,12 @@ class IDTBaseGenerator(ABC):
     def optimise(self) -> None:
         """Implement any optimisation of the lut that is required"""
 
-    def to_clf(self, output_directory: Path | str) -> Path:
+    def _clf(self) -> str:
         """
-        Convert the *IDT* generation process data to *Common LUT Format* (CLF).
-
-        Parameters
-        ----------
-        output_directory : str
-            Output directory for the zip file.
-
-        Returns
-        -------
-        :class:`str`
-            *CLF* file path.
+        Convert the *IDT* generation process data to a *Common LUT Format*
+        (CLF) document.
         """
 
-        LOGGER.info(
-            'Converting "IDT" generation process data to "CLF" in "%s"'
-            "output directory.",
-            output_directory,
-        )
-
         project_settings = self.project_settings
 
         aces_transform_id = project_settings.aces_transform_id
@@ -748,6 +1031,17 @@ class IDTBaseGenerator(ABC):
         exclusions = [
             ProjectSettingsMetadataConstants.SCHEMA_VERSION.name,
             ProjectSettingsMetadataConstants.DATA.name,
+            ProjectSettingsMetadataConstants.SAMPLING_WORKERS.name,
+            ProjectSettingsMetadataConstants.SAMPLING_PREFETCH.name,
+            ProjectSettingsMetadataConstants.SAMPLING_REGION_OF_INTEREST.name,
+            ProjectSettingsMetadataConstants.SAMPLING_REDUCED_RESOLUTION.name,
+            ProjectSettingsMetadataConstants.SAMPLING_CACHE_DIRECTORY.name,
+            ProjectSettingsMetadataConstants.SAMPLING_CACHE_SIZE.name,
+            ProjectSettingsMetadataConstants.SAMPLING_SWATCH_INDEX.name,
+            ProjectSettingsMetadataConstants.SAMPLING_EARLY_STOP.name,
+            ProjectSettingsMetadataConstants.SAMPLING_EARLY_STOP_TOLERANCE.name,
+            ProjectSettingsMetadataConstants.SAMPLING_VIDEO_FRAMES.name,
+            ProjectSettingsMetadataConstants.SAMPLING_DUPLICATE_FRAMES.name,
         ]
         for key, prop in project_settings.properties:
             value = prop.getter(project_settings)
@@ -788,19 +1082,193 @@ class IDTBaseGenerator(ABC):
             self.project_settings.include_exposure_factor_in_clf,
         )
 
-        clf_path = (
-            Path(output_directory)
-            / f"{camera_make}.Input.{camera_model}_to_ACES2065-1.clf"
+        ET.indent(root)
+
+        return '<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(
+            root, encoding="UTF-8"
+        ).decode("utf8")
+
+    def _clf_filename(self) -> str:
+        """Return the file name of the *Common LUT Format* (CLF) file."""
+
+        return (
+            f"{self.project_settings.camera_make}.Input."
+            f"{self.project_settings.camera_model}_to_ACES2065-1.clf"
         )
 
-        ET.indent(root)
+    def _npz_filename(self) -> str:
+        """Return the file name of the serialised *IDT* generator file."""
+
+        aces_transform_id = self.project_settings.aces_transform_id
+
+        return f"IDT_{aces_transform_id.replace(':', '_')}.npz"
+
+    @property
+    def zip_filename(self) -> str:
+        """
+        Getter property for the file name of the *zip* file of the *IDT*
+        generation process output.
+
+        Returns
+        -------
+        :class:`str`
+            File name of the *zip* file.
+        """
+
+        aces_transform_id = self.project_settings.aces_transform_id
+
+        return f"IDT_{aces_transform_id.replace(':', '_')}.zip"
+
+    def to_clf(self, output_directory: Path | str) -> Path:
+        """
+        Convert the *IDT* generation process data to *Common LUT Format* (CLF).
+
+        Parameters
+        ----------
+        output_directory : str
+            Output directory for the zip file.
+
+        Returns
+        -------
+        :class:`str`
+            *CLF* file path.
+        """
+
+        LOGGER.info(
+            'Converting "IDT" generation process data to "CLF" in "%s"'
+            "output directory.",
+            output_directory,
+        )
+
+        clf_path = Path(output_directory) / self._clf_filename()
 
         with open(clf_path, "w") as clf_file:
-            clf_file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-            clf_file.write(ET.tostring(root, encoding="UTF-8").decode("utf8"))
+            clf_file.write(self._clf())
 
         return clf_path
 
+    def to_npz(self, file: str | Path | IO, include_images: bool = False) -> None:
+        """
+        Serialise the *IDT* generator state to a *NPZ* file.
+
+        The arrays, e.g., the samples and *LUTs*, are stored in binary while
+        the remaining state, e.g., the project settings, is stored in a small
+        *JSON* manifest. The generator can be rehydrated with the
+        :meth:`IDTBaseGenerator.from_npz` method without recomputation.
+
+        Parameters
+        ----------
+        file
+            *NPZ* file path or file object.
+        include_images
+            Whether to store the colour checker segmentation and grey card
+            sampling images, they are only used for debugging.
+        """
+
+        LOGGER.info('Serialising the "IDT" generator state to "NPZ".')
+
+        arrays = {}
+        attributes = {}
+        for name, value in vars(self).items():
+            if name in ("_project_settings", "_archive", "_index"):
+                continue
+
+            if name.startswith("_image_") and not include_images:
+                continue
+
+            attributes[name] = _state_entry(value, name, arrays)
+
+        manifest = {
+            "version": self.STATE_VERSION,
+            "generator": self.GENERATOR_NAME,
+            "project_settings": json.loads(self._project_settings.to_json()),
+            "attributes": attributes,
+        }
+
+        np.savez_compressed(file, manifest=np.array(json.dumps(manifest)), **arrays)
+
+    @classmethod
+    def from_npz(cls, file: str | Path | IO) -> IDTBaseGenerator:
+        """
+        Load an *IDT* generator from given *NPZ* file as written by the
+        :meth:`IDTBaseGenerator.to_npz` method.
+
+        Parameters
+        ----------
+        file
+            *NPZ* file path or file object.
+
+        Returns
+        -------
+        :class:`IDTBaseGenerator`
+            Loaded *IDT* generator.
+
+        Raises
+        ------
+        ValueError
+            If the state format version is not supported.
+        """
+
+        # The registry imports the generators, it is resolved lazily.
+        from aces.idt.generators import GENERATORS  # noqa: PLC0415
+
+        with np.load(file, allow_pickle=False) as arrays:
+            manifest = json.loads(str(arrays["manifest"]))
+
+            if manifest["version"] > cls.STATE_VERSION:
+                msg = (
+                    f'"{manifest["version"]}" generator state version is not '
+                    f'supported, the latest version is "{cls.STATE_VERSION}"!'
+                )
+                raise ValueError(msg)
+
+            project_settings = IDTProjectSettings.from_json(
+                manifest["project_settings"]
+            )
+            # The *JSON* object keys are strings, the exposure values are
+            # restored as floats like when processing an archive.
+            data = project_settings.data
+            data[DirectoryStructure.COLOUR_CHECKER] = {
+                float(EV): paths
+                for EV, paths in data.get(DirectoryStructure.COLOUR_CHECKER, {}).items()
+            }
+
+            generator = GENERATORS[manifest["generator"]](project_settings)
+            for name, entry in manifest["attributes"].items():
+                setattr(generator, name, _state_value(entry, name, arrays))
+
+        return generator
+
+    def zip_bytes(self, archive_serialised_generator: bool = False) -> bytes:
+        """
+        Zip the *Common LUT Format* (CLF) resulting from the *IDT* generation
+        process in memory, without writing any file.
+
+        Parameters
+        ----------
+        archive_serialised_generator : bool
+            Whether to serialise and archive the *IDT* generator.
+
+        Returns
+        -------
+        :class:`bytes`
+            *Zip* file content, e.g., to be sent by a web server or cached.
+        """
+
+        LOGGER.info(
+            'Zipping the "CLF" resulting from the "IDT" generation process in memory.'
+        )
+
+        buffer = io.BytesIO()
+        with ZipFile(buffer, "w") as zip_archive:
+            zip_archive.writestr(self._clf_filename(), self._clf())
+            if archive_serialised_generator:
+                buffer_npz = io.BytesIO()
+                self.to_npz(buffer_npz)
+                zip_archive.writestr(self._npz_filename(), buffer_npz.getvalue())
+
+        return buffer.getvalue()
+
     def zip(
         self,
         output_directory: Path | str,
@@ -818,7 +1286,8 @@ class IDTBaseGenerator(ABC):
         archive_serialised_generator : bool
             Whether to serialise and archive the *IDT* generator.
         cleanup
-            Whether to remove the clf and json file after the zip is completed
+            Whether to only write the *zip* file, the *CLF* and serialised
+            *IDT* generator files are otherwise also written alongside it.
 
         Returns
         -------
@@ -837,30 +1306,14 @@ class IDTBaseGenerator(ABC):
 
         output_directory.mkdir(parents=True, exist_ok=True)
 
-        aces_transform_id = self.project_settings.aces_transform_id
-        aces_transform_id_clean = aces_transform_id.replace(":", "_")
-        clf_path = self.to_clf(output_directory)
-
-        json_path = f"{output_directory}/IDT_{aces_transform_id_clean}.json"
-        with open(json_path, "w") as json_file:
-            json_file.write(jsonpickle.encode(self, indent=2))
-
-        zip_file = Path(output_directory) / f"IDT_{aces_transform_id_clean}.zip"
-        current_working_directory = os.getcwd()
-
-        output_directory = str(output_directory)
-        try:
-            os.chdir(output_directory)
-            with ZipFile(zip_file, "w") as zip_archive:
-                zip_archive.write(str(clf_path).replace(output_directory, "")[1:])
-                if archive_serialised_generator:
-                    zip_archive.write(json_path.replace(output_directory, "")[1:])
-        finally:
-            os.chdir(current_working_directory)
-
-        if cleanup:
-            os.remove(clf_path)
-            os.remove(json_path)
+        zip_file = output_directory / self.zip_filename
+        with open(zip_file, "wb") as output_file:
+            output_file.write(self.zip_bytes(archive_serialised_generator))
+
+        if not cleanup:
+            self.to_clf(output_directory)
+
+            self.to_npz(output_directory / self._npz_filename())
 
         return zip_file
 
@@ -8,6 +8,7 @@ Define the *IDT* generator class for a *Log Camera*.
 from __future__ import annotations
 
 import base64
+import inspect
 import io
 import logging
 import typing
@@ -15,17 +16,8 @@ import typing
 import colour
 import matplotlib.pyplot as plt
 import numpy as np
-import scipy.misc
-import scipy.ndimage
-import scipy.optimize
-import scipy.stats
-from colour import (
-    LUT1D,
-    Extrapolator,
-    LinearInterpolator,
-    LUT3x1D,
-)
-from colour.algebra import smoothstep_function, vecmul
+from colour import LUT1D, LUT3x1D
+from colour.algebra import smoothstep_function
 
 if typing.TYPE_CHECKING:
     from colour.hints import NDArrayFloat, Tuple
@@ -39,7 +31,7 @@ from colour.utilities import (
 )
 from scipy.optimize import minimize
 
-from aces.idt.core import DecodingMethods, DirectoryStructure, common
+from aces.idt.core import DecodingMethods, common
 from aces.idt.core.constants import EXPOSURE_CLIPPING_THRESHOLD
 
 if typing.TYPE_CHECKING:
@@ -141,13 +133,11 @@ class IDTGeneratorLogCamera(IDTBaseGenerator):
         samples_analysis = None
         if (
             self._samples_analysis is not None
-            and self._samples_analysis.get("data") is not None
+            and self._baseline_exposure in self._samples_analysis.EVs
         ):
-            samples_analysis = self._samples_analysis["data"]["colour_checker"].get(
+            samples_analysis = self._samples_analysis.colour_checker_median(
                 self._baseline_exposure
             )
-            if samples_analysis is not None:
-                samples_analysis = as_float_array(samples_analysis["samples_median"])
 
         return multiline_str(
             self,
@@ -207,56 +197,57 @@ class IDTGeneratorLogCamera(IDTBaseGenerator):
 
         self._LUT_unfiltered = LUT3x1D(size=size, name="LUT - Unfiltered")
 
-        for i in range(3):
-            x = self._samples_camera[..., i] * (size - 1)
-            y = self._samples_reference[..., i]
-
-            samples = np.arange(0, size, 1)
+        samples = np.arange(0, size, 1)
 
-            samples_linear = Extrapolator(LinearInterpolator(x, y))(samples)
-            samples_constant = Extrapolator(
-                LinearInterpolator(x, y), method="Constant"
-            )(samples)
-
-            # Searching for the index of ~middle camera code value * 125%
-            # We are trying to find the logarithmic slope of the camera middle
-            # range.
-            index_middle = np.searchsorted(
-                samples / size, np.max(self._samples_camera) / 2 * 1.25
+        # The channels are processed as rows so that the operations are
+        # performed on contiguous memory.
+        samples_linear, samples_constant = (
+            np.transpose(samples_extrapolated)
+            for samples_extrapolated in common.extrapolate_channels(
+                self._samples_camera * (size - 1), self._samples_reference, samples
             )
-            padding = index_middle // 2
-            samples_middle = np.log(np.copy(samples_linear))
-            samples_middle[: index_middle - padding] = samples_middle[
-                index_middle - padding
-            ]
-            samples_middle[index_middle + padding :] = samples_middle[
-                index_middle + padding
-            ]
+        )
 
-            a, b = np.polyfit(
-                samples[index_middle - padding : index_middle + padding],
-                samples_middle[index_middle - padding : index_middle + padding],
-                1,
-            )
+        # Searching for the index of ~middle camera code value * 125%
+        # We are trying to find the logarithmic slope of the camera middle
+        # range.
+        index_middle = np.searchsorted(
+            samples / size, np.max(self._samples_camera) / 2 * 1.25
+        )
+        padding = index_middle // 2
+        edge_left = index_middle - padding
+
+        # The slopes of the three channels are fitted at once with the closed
+        # form of the least squares linear regression.
+        samples_fit = samples[edge_left : index_middle + padding]
+        samples_fit_log = np.log(
+            samples_linear[..., edge_left : index_middle + padding]
+        )
+        samples_fit_centered = samples_fit - np.mean(samples_fit)
+        a = np.dot(
+            samples_fit_log - np.mean(samples_fit_log, axis=-1, keepdims=True),
+            samples_fit_centered,
+        ) / np.dot(samples_fit_centered, samples_fit_centered)
+        b = np.mean(samples_fit_log, axis=-1) - a * np.mean(samples_fit)
+
+        # Preparing the mask to blend the logarithmic slope with the
+        # extrapolated data, only the samples from the left edge are blended.
+        edge_right = np.searchsorted(samples / size, np.max(self._samples_camera))
+        samples_blend = samples[edge_left:]
+        mask_samples = smoothstep_function(
+            samples_blend, edge_left, edge_right, clip=True
+        )
 
-            # Preparing the mask to blend the logarithmic slope with the
-            # extrapolated data.
-            edge_left = index_middle - padding
-            edge_right = np.searchsorted(samples / size, np.max(self._samples_camera))
-            mask_samples = smoothstep_function(
-                samples, edge_left, edge_right, clip=True
-            )
+        samples_linear[..., edge_left:] = np.exp(
+            a[..., None] * samples_blend + b[..., None]
+        ) * mask_samples + samples_constant[..., edge_left:] * (1 - mask_samples)
 
-            self._LUT_unfiltered.table[..., i] = samples_linear
-            self._LUT_unfiltered.table[index_middle - padding :, i] = (
-                np.exp(a * samples + b) * mask_samples
-                + samples_constant * (1 - mask_samples)
-            )[index_middle - padding :]
+        self._LUT_unfiltered.table[...] = np.transpose(samples_linear)
 
-            self._lut_blending_edge_left, self._lut_blending_edge_right = (
-                edge_left / size,
-                edge_right / size,
-            )
+        self._lut_blending_edge_left, self._lut_blending_edge_right = (
+            edge_left / size,
+            edge_right / size,
+        )
 
         return self._LUT_unfiltered
 
@@ -269,7 +260,9 @@ class IDTGeneratorLogCamera(IDTBaseGenerator):
         *LUT* are affected by the convolution, the *LUT* is extended, i.e.
         extrapolated at a safe two sigmas in both directions. The left edge is
         linearly extrapolated while the right edge is logarithmically
-        extrapolated.
+        extrapolated. The channels are filtered at once with
+        :func:`aces.idt.core.filter_gaussian` definition, i.e., in the
+        frequency domain for large sigma values.
 
         Returns
         -------
@@ -282,35 +275,62 @@ class IDTGeneratorLogCamera(IDTBaseGenerator):
         sigma = self.project_settings.lut_smoothing
         LOGGER.info('Filtering unfiltered "LUT3x1D" with "%s" sigma...', sigma)
 
-        filter = scipy.ndimage.gaussian_filter1d  # noqa: A001
-        filter_kwargs = {"sigma": sigma}
-
         self._LUT_filtered = self._LUT_unfiltered.copy()
         self._LUT_filtered.name = "LUT - Filtered"
 
         sigma_x2 = int(sigma * 2)
         x, step = np.linspace(0, 1, self._LUT_unfiltered.size, retstep=True)
         padding = np.arange(step, sigma_x2 * step + step, step)
-        for i in range(3):
-            y = self._LUT_filtered.table[..., i]
-            x_extended = np.concatenate([-padding[::-1], x, padding + 1])
-
-            # Filtering is performed on extrapolated data.
-            y_linear_extended = Extrapolator(LinearInterpolator(x, y))(x_extended)
-            y_log_extended = np.exp(
-                Extrapolator(LinearInterpolator(x, np.log(y)))(x_extended)
-            )
+        x_padding = np.concatenate([-padding[::-1], padding + 1])
+
+        # Filtering is performed on extrapolated data. Only the padding needs
+        # to be extrapolated, the channels are then processed as rows so that
+        # the operations are performed on contiguous memory.
+        y = self._LUT_filtered.table
+        y_log = np.log(y)
+        x = np.broadcast_to(x[..., None], y.shape)
+        y_linear_padding = np.transpose(common.extrapolate_channels(x, y, x_padding)[0])
+        y_log_padding = np.exp(
+            np.transpose(common.extrapolate_channels(x, y_log, x_padding)[0])
+        )
 
-            y_linear_filtered = filter(y_linear_extended, **filter_kwargs)
-            y_log_filtered = filter(y_log_extended, **filter_kwargs)
+        y_linear_extended = np.concatenate(
+            [
+                y_linear_padding[..., : len(padding)],
+                np.transpose(y),
+                y_linear_padding[..., len(padding) :],
+            ],
+            axis=-1,
+        )
+        y_log_extended = np.concatenate(
+            [
+                y_log_padding[..., : len(padding)],
+                np.exp(np.transpose(y_log)),
+                y_log_padding[..., len(padding) :],
+            ],
+            axis=-1,
+        )
+
+        # Only the samples within the kernel radius of the kept halves are
+        # filtered so that both halves are filtered at once.
+        size_extended = y_linear_extended.shape[-1]
+        index_middle = size_extended // 2
+        length = min(size_extended, size_extended - index_middle + int(4 * sigma + 0.5))
+        offset = size_extended - length
+
+        y_linear_filtered, y_log_filtered = common.filter_gaussian(
+            [y_linear_extended[..., :length], y_log_extended[..., offset:]], sigma
+        )
 
-            index_middle = len(x_extended) // 2
-            self._LUT_filtered.table[..., i] = np.concatenate(
+        self._LUT_filtered.table = np.transpose(
+            np.concatenate(
                 [
-                    y_linear_filtered[sigma_x2:index_middle],
-                    y_log_filtered[index_middle:-sigma_x2],
-                ]
+                    y_linear_filtered[..., sigma_x2:index_middle],
+                    y_log_filtered[..., index_middle - offset : length - sigma_x2],
+                ],
+                axis=-1,
             )
+        )
 
         return self._LUT_filtered
 
@@ -353,13 +373,11 @@ class IDTGeneratorLogCamera(IDTBaseGenerator):
             )
 
         self._LUT_decoding.name = "LUT - Decoding"
-        if self._samples_analysis[DirectoryStructure.GREY_CARD]:
-            sampled_grey_card_reflectance = self._samples_analysis[
-                DirectoryStructure.GREY_CARD
-            ]["samples_median"]
+        if self._samples_analysis.grey_card_median is not None:
+            sampled_grey_card_reflectance = self._samples_analysis.grey_card_median
 
-            linear_gain = grey_card_reflectance / self._LUT_decoding.apply(
-                sampled_grey_card_reflectance
+            linear_gain = grey_card_reflectance / common.apply_LUT_uniform(
+                self._LUT_decoding, sampled_grey_card_reflectance
             )
             if decoding_method.title() == DecodingMethods.MEDIAN:
                 linear_gain = np.median(linear_gain)
@@ -382,13 +400,9 @@ class IDTGeneratorLogCamera(IDTBaseGenerator):
             self._LUT_decoding.table *= linear_gain
 
         self._samples_decoded = {}
-        for EV in sorted(self._samples_analysis[DirectoryStructure.COLOUR_CHECKER]):
-            self._samples_decoded[EV] = self._LUT_decoding.apply(
-                as_float_array(
-                    self._samples_analysis[DirectoryStructure.COLOUR_CHECKER][EV][
-                        "samples_median"
-                    ]
-                )
+        for EV in sorted(self._samples_analysis.EVs):
+            self._samples_decoded[EV] = common.apply_LUT_uniform(
+                self._LUT_decoding, self._samples_analysis.colour_checker_median(EV)
             )
 
     def optimise(self) -> Tuple[NDArrayFloat]:
@@ -474,18 +488,29 @@ class IDTGeneratorLogCamera(IDTBaseGenerator):
         self._k = np.mean(training_data[21]) / np.mean(self._samples_weighted[21])
         self._samples_weighted *= self._k
 
-        XYZ = vecmul(RGB_COLOURSPACE_ACES2065_1.matrix_RGB_to_XYZ, training_data)
-
-        (
-            x_0,
-            objective_function,
-            XYZ_to_optimization_colour_model,
-            finaliser_function,
-        ) = optimisation_factory()
+        # The factories able to produce the analytic Jacobian of their objective
+        # function are requested to, the other ones are differentiated with
+        # finite differences.
+        if "jacobian" in inspect.signature(optimisation_factory).parameters:
+            (
+                x_0,
+                objective_function,
+                _XYZ_to_optimization_colour_model,
+                finaliser_function,
+                jacobian_function,
+            ) = optimisation_factory(jacobian=True)
+        else:
+            (
+                x_0,
+                objective_function,
+                _XYZ_to_optimization_colour_model,
+                finaliser_function,
+            ) = optimisation_factory()
+            jacobian_function = "2-point"
 
         optimisation_settings = {
             "method": "BFGS",
-            "jac": "2-point",
+            "jac": jacobian_function,
         }
         if not optimisation_kwargs:
             optimisation_settings.update(optimisation_kwargs)
@@ -493,7 +518,12 @@ class IDTGeneratorLogCamera(IDTBaseGenerator):
         self._M = minimize(
             objective_function,
             x_0,
-            (self._samples_weighted, XYZ_to_optimization_colour_model(XYZ)),
+            (
+                self._samples_weighted,
+                common.generate_optimisation_targets(
+                    training_data, optimisation_factory
+                ),
+            ),
             **optimisation_settings,
         ).x
 
@@ -17,10 +17,9 @@ from colour import LUT3x1D
 if typing.TYPE_CHECKING:
     from colour.hints import List, NDArrayFloat, NDArrayInt
 
-from colour.utilities import as_float_array, as_int_array, optional
+from colour.utilities import as_int_array, optional
 from scipy.interpolate import CubicHermiteSpline
 
-from aces.idt import DirectoryStructure
 from aces.idt.core.common import create_colour_checker_image, interpolate_nan_values
 from aces.idt.core.constants import EXPOSURE_CLIPPING_THRESHOLD
 
@@ -109,16 +108,16 @@ class IDTGeneratorToneMappedCamera(IDTGeneratorLogCamera):
         samples_camera = []
         samples_reference = []
         exposure_times = []
-        for EV, images in self._samples_analysis[
-            DirectoryStructure.COLOUR_CHECKER
-        ].items():
+        for EV in self._samples_analysis.EVs:
             samples_reference.append(
                 reference_colour_checker_samples[start_index:, ...] * pow(2, EV)
             )
-            samples_EV = as_float_array(images["samples_median"])[start_index:, ...]
+            samples_EV = self._samples_analysis.colour_checker_median(EV)[
+                start_index:, ...
+            ]
             samples_camera.append(samples_EV)
 
-            num_samples = len(images["samples_median"][start_index:])
+            num_samples = len(samples_EV)
             shutter = 100 / (2**EV) if EV >= 0 else 100 * (2 ** abs(EV))
             emulated_shutter_time = np.full((num_samples, 3), shutter)
             exposure_times.append(emulated_shutter_time)
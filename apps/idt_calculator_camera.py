@@ -6,8 +6,11 @@ Input Device Transform (IDT) Calculator - Camera
 import logging
 import os
 import tempfile
+import threading
+import time
 import urllib.parse
 import uuid
+from collections import OrderedDict
 
 import colour
 import numpy as np
@@ -25,7 +28,7 @@ from colour.temperature import CCT_to_xy_CIE_D
 from colour.utilities import CACHE_REGISTRY, as_float
 from dash.dash_table import DataTable
 from dash.dash_table.Format import Format, Scheme
-from dash.dcc import Download, Link, Location, Markdown, Tab, Tabs, send_file
+from dash.dcc import Download, Link, Location, Markdown, Tab, Tabs, send_bytes
 from dash.dependencies import Input, Output, State
 from dash.html import (
     H2,
@@ -65,14 +68,18 @@ from dash_bootstrap_components import (
     Spinner,
     Tooltip,
 )
-from dash_uploader import Upload, callback, configure_upload
+from dash_uploader import HttpRequestHandler, Upload, callback, configure_upload
+from flask import request
 
 from aces.idt import (
     GENERATORS,
-    DirectoryStructure,
+    SIZE_CACHE_EXTRACTION_DEFAULT,
+    ExtractionCache,
     IDTGeneratorApplication,
     IDTGeneratorLogCamera,
     IDTProjectSettings,
+    StreamingHasher,
+    apply_LUT_uniform,
     error_delta_E,
     generate_reference_colour_checker,
     hash_file,
@@ -159,12 +166,110 @@ APP_UID : str
 
 _ROOT_UPLOADED_IDT_ARCHIVE = tempfile.gettempdir()
 
-configure_upload(APP, _ROOT_UPLOADED_IDT_ARCHIVE)
+_DIRECTORY_CACHE_SAMPLES = os.environ.get(
+    "AMPAS_APPS_CACHE_SAMPLES",
+    os.path.join(tempfile.gettempdir(), "idt-calculator-samples"),
+)
+
+_EXTRACTION_CACHE = ExtractionCache(
+    os.environ.get(
+        "AMPAS_APPS_CACHE_EXTRACTION",
+        os.path.join(tempfile.gettempdir(), "idt-calculator-extraction"),
+    ),
+    int(
+        os.environ.get(
+            "AMPAS_APPS_CACHE_EXTRACTION_SIZE", SIZE_CACHE_EXTRACTION_DEFAULT
+        )
+    ),
+)
+
+_HASHERS_UPLOADED_IDT_ARCHIVE = OrderedDict()
+"""
+Streaming hashers of the *IDT* archives being uploaded and the time they were
+last updated, keyed by the archive path relative to the upload folder.
+"""
+
+_COUNT_HASHERS_UPLOADED_IDT_ARCHIVE = 4
+"""Maximum count of *IDT* archives hashed while being uploaded."""
+
+_AGE_HASHER_UPLOADED_IDT_ARCHIVE = 900
+"""
+Time in seconds after which the hasher of an *IDT* archive that did not
+receive any chunk is dropped, e.g., the upload was abandoned or failed.
+"""
+
+_LOCK_HASHERS_UPLOADED_IDT_ARCHIVE = threading.Lock()
+"""Lock guarding the hashers of the *IDT* archives being uploaded."""
+
+
+class _HttpRequestHandlerHashing(HttpRequestHandler):
+    """
+    Define a request handler feeding the chunks of the uploaded *IDT* archives
+    to a streaming hasher as they are received, so that the archive hash is
+    available as soon as the upload completes.
+    """
+
+    def post_before(self):
+        """Feed the received chunk to the hasher of its archive."""
+
+        chunk = request.files.get("file")
+        if chunk is None:
+            return
+
+        path = os.path.relpath(
+            os.path.join(
+                self.get_temp_root(request.form.get("upload_id", default="", type=str)),
+                request.form.get("resumableFilename", default="error", type=str),
+            ),
+            self.upload_folder,
+        )
+        chunk_number = request.form.get("resumableChunkNumber", default=1, type=int)
+        chunk_size = request.form.get("resumableChunkSize", default=0, type=int)
+
+        with _LOCK_HASHERS_UPLOADED_IDT_ARCHIVE:
+            # The hashers of the abandoned or failed uploads, and the least
+            # recently updated ones beyond the maximum count, are dropped with
+            # the chunks they retain.
+            now = time.monotonic()
+            for path_hasher, (_hasher, updated) in list(
+                _HASHERS_UPLOADED_IDT_ARCHIVE.items()
+            ):
+                if now - updated > _AGE_HASHER_UPLOADED_IDT_ARCHIVE:
+                    del _HASHERS_UPLOADED_IDT_ARCHIVE[path_hasher]
+
+            # A new upload of the archive starts with its first chunk, should
+            # it be re-sent, the digest is incomplete and the archive hashed
+            # again. A hasher that was dropped is not re-created as it could
+            # not hash the preceding chunks anyway.
+            if chunk_number == 1:
+                _HASHERS_UPLOADED_IDT_ARCHIVE.pop(path, None)
+                _HASHERS_UPLOADED_IDT_ARCHIVE[path] = (StreamingHasher(), now)
+            elif path not in _HASHERS_UPLOADED_IDT_ARCHIVE:
+                return
+
+            hasher = _HASHERS_UPLOADED_IDT_ARCHIVE[path][0]
+            _HASHERS_UPLOADED_IDT_ARCHIVE[path] = (hasher, now)
+            _HASHERS_UPLOADED_IDT_ARCHIVE.move_to_end(path)
+
+            while (
+                len(_HASHERS_UPLOADED_IDT_ARCHIVE) > _COUNT_HASHERS_UPLOADED_IDT_ARCHIVE
+            ):
+                _HASHERS_UPLOADED_IDT_ARCHIVE.popitem(last=False)
+
+        hasher.update(chunk.stream.read(), (chunk_number - 1) * chunk_size)
+        chunk.stream.seek(0)
+
+
+configure_upload(
+    APP,
+    _ROOT_UPLOADED_IDT_ARCHIVE,
+    http_request_handler=_HttpRequestHandlerHashing,
+)
 
 _PATH_UPLOADED_IDT_ARCHIVE = None
 _HASH_IDT_ARCHIVE = None
 _IDT_GENERATOR_APPLICATION = None
-_PATH_IDT_ZIP = None
+_ZIP_IDT = None
 
 _CACHE_DATA_ARCHIVE_TO_SAMPLES = CACHE_REGISTRY.register_cache(
     f"{__name__}._CACHE_DATA_ARCHIVE_TO_SAMPLES"
@@ -792,7 +897,19 @@ def set_uploaded_idt_archive_location(filename):
     global _HASH_IDT_ARCHIVE  # noqa: PLW0603
 
     _PATH_UPLOADED_IDT_ARCHIVE = filename[0]
-    _HASH_IDT_ARCHIVE = None
+
+    # The archive hash is computed while uploading, it is only computed again
+    # from the archive if some chunks could not be hashed in order.
+    with _LOCK_HASHERS_UPLOADED_IDT_ARCHIVE:
+        hasher, _updated = _HASHERS_UPLOADED_IDT_ARCHIVE.pop(
+            os.path.relpath(_PATH_UPLOADED_IDT_ARCHIVE, _ROOT_UPLOADED_IDT_ARCHIVE),
+            (None, None),
+        )
+    _HASH_IDT_ARCHIVE = (
+        None
+        if hasher is None
+        else hasher.hexdigest(os.path.getsize(_PATH_UPLOADED_IDT_ARCHIVE))
+    )
 
     return {"display": "block"}
 
@@ -1082,13 +1199,24 @@ def download_idt_zip(
 
     logging.info('Sending "IDT" archive...')
 
-    global _PATH_IDT_ZIP  # noqa: PLW0603
+    global _ZIP_IDT  # noqa: PLW0603
 
-    _PATH_IDT_ZIP = _IDT_GENERATOR_APPLICATION.zip(
-        os.path.dirname(_PATH_UPLOADED_IDT_ARCHIVE),
-    )
+    # The archive is built in memory and only built again if the generator or
+    # the project settings changed since the last download.
+    generator = _IDT_GENERATOR_APPLICATION.generator
+    project_settings = _IDT_GENERATOR_APPLICATION.project_settings.to_json()
+    if (
+        _ZIP_IDT is None
+        or _ZIP_IDT[0] is not generator
+        or _ZIP_IDT[1] != project_settings
+    ):
+        _ZIP_IDT = (
+            generator,
+            project_settings,
+            _IDT_GENERATOR_APPLICATION.zip_bytes(),
+        )
 
-    return send_file(_PATH_IDT_ZIP)
+    return send_bytes(_ZIP_IDT[2], generator.zip_filename)
 
 
 @APP.callback(
@@ -1353,7 +1481,7 @@ def compute_idt_camera(
         illuminant=illuminant_name,
     )
     _IDT_GENERATOR_APPLICATION = IDTGeneratorApplication(
-        generator_name, project_settings
+        generator_name, project_settings, _EXTRACTION_CACHE
     )
 
     if _HASH_IDT_ARCHIVE is None:
@@ -1361,9 +1489,27 @@ def compute_idt_camera(
         LOGGER.debug('"Archive hash: "%s"', _HASH_IDT_ARCHIVE)
 
     if _CACHE_DATA_ARCHIVE_TO_SAMPLES.get(_HASH_IDT_ARCHIVE) is None:
-        _IDT_GENERATOR_APPLICATION.extract(_PATH_UPLOADED_IDT_ARCHIVE)
-        os.remove(_PATH_UPLOADED_IDT_ARCHIVE)
-        _IDT_GENERATOR_APPLICATION.generator.sample()
+        # The frames are read from the uploaded archive as they are sampled
+        # rather than extracting it upfront, the reader is closed and the
+        # uploaded archive removed even if the sampling fails.
+        try:
+            _IDT_GENERATOR_APPLICATION.extract(
+                _PATH_UPLOADED_IDT_ARCHIVE,
+                stream=True,
+                archive_hash=_HASH_IDT_ARCHIVE,
+            )
+            # The persistent cache only re-samples the frames that changed when
+            # an archive is re-submitted.
+            _IDT_GENERATOR_APPLICATION.project_settings.sampling_cache_directory = (
+                _DIRECTORY_CACHE_SAMPLES
+            )
+            _IDT_GENERATOR_APPLICATION.generator.sample()
+        finally:
+            if _IDT_GENERATOR_APPLICATION.archive is not None:
+                _IDT_GENERATOR_APPLICATION.archive.close()
+
+            if os.path.exists(_PATH_UPLOADED_IDT_ARCHIVE):
+                os.remove(_PATH_UPLOADED_IDT_ARCHIVE)
         _CACHE_DATA_ARCHIVE_TO_SAMPLES[_HASH_IDT_ARCHIVE] = (
             _IDT_GENERATOR_APPLICATION.project_settings.data,
             _IDT_GENERATOR_APPLICATION.generator.samples_analysis,
@@ -1404,15 +1550,16 @@ def compute_idt_camera(
             apply_cctf_encoding=True,
         )
 
-    samples_median = _IDT_GENERATOR_APPLICATION.generator.samples_analysis[
-        DirectoryStructure.COLOUR_CHECKER
-    ][generator.baseline_exposure]["samples_median"]
+    samples_median = generator.samples_analysis.colour_checker_median(
+        generator.baseline_exposure
+    )
 
     samples_idt = camera_RGB_to_ACES2065_1(
         # "camera_RGB_to_ACES2065_1" divides RGB by "min(RGB_w)" for highlights
         # recovery, this is not required here as the images are expected to be
         # fully processed, thus we pre-emptively multiply by "min(RGB_w)".
-        generator.LUT_decoding.apply(samples_median) * np.min(generator.RGB_w),
+        apply_LUT_uniform(generator.LUT_decoding, samples_median)
+        * np.min(generator.RGB_w),
         generator.M,
         generator.RGB_w,
         generator.k,
@@ -1431,7 +1578,7 @@ def compute_idt_camera(
         RGB_working_to_RGB_display(reference_colour_checker),
     )
 
-    samples_decoded = generator.LUT_decoding.apply(samples_median)
+    samples_decoded = apply_LUT_uniform(generator.LUT_decoding, samples_median)
     compare_colour_checkers_LUT_correction = png_compare_colour_checkers(
         RGB_working_to_RGB_display(samples_decoded),
         RGB_working_to_RGB_display(reference_colour_checker),
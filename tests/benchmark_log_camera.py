@@ -0,0 +1,300 @@
+"""
+Benchmark - Log Camera LUT
+==========================
+
+Benchmark the vectorised
+:meth:`aces.idt.IDTGeneratorLogCamera.generate_LUT` and
+:meth:`aces.idt.IDTGeneratorLogCamera.filter_LUT` methods against the
+reference per-channel implementations for all the *LUT* sizes::
+
+    python -m tests.benchmark_log_camera
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import timeit
+import typing
+
+import numpy as np
+import scipy.ndimage
+from colour import LUT3x1D, Extrapolator, LinearInterpolator
+from colour.algebra import smoothstep_function
+
+if typing.TYPE_CHECKING:
+    from colour.hints import ArrayLike, NDArrayFloat
+
+from aces.idt.core.constants import LUTSize
+from aces.idt.framework import IDTProjectSettings
+from aces.idt.generators import IDTGeneratorLogCamera
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "ROOT_RESOURCES",
+    "generate_LUT_per_channel",
+    "filter_LUT_per_channel",
+    "benchmark_generate_LUT",
+    "benchmark_filter_LUT",
+]
+
+ROOT_RESOURCES: str = os.path.join(os.path.dirname(__file__), "resources")
+"""Unit tests resources directory."""
+
+
+def generate_LUT_per_channel(
+    samples_camera: ArrayLike, samples_reference: ArrayLike, size: int
+) -> NDArrayFloat:
+    """
+    Generate the unfiltered linearisation *LUT* table for given camera and
+    reference samples one channel at a time, as the
+    :meth:`aces.idt.IDTGeneratorLogCamera.generate_LUT` method originally did.
+
+    Parameters
+    ----------
+    samples_camera
+        Sorted camera samples.
+    samples_reference
+        Sorted reference samples.
+    size
+        *LUT* size.
+
+    Returns
+    -------
+    :class:`np.ndarray`
+        Unfiltered linearisation *LUT* table.
+    """
+
+    samples_camera = np.asarray(samples_camera)
+    samples_reference = np.asarray(samples_reference)
+
+    table = LUT3x1D(size=size).table
+
+    for i in range(3):
+        x = samples_camera[..., i] * (size - 1)
+        y = samples_reference[..., i]
+
+        samples = np.arange(0, size, 1)
+
+        samples_linear = Extrapolator(LinearInterpolator(x, y))(samples)
+        samples_constant = Extrapolator(LinearInterpolator(x, y), method="Constant")(
+            samples
+        )
+
+        index_middle = np.searchsorted(
+            samples / size, np.max(samples_camera) / 2 * 1.25
+        )
+        padding = index_middle // 2
+        with np.errstate(invalid="ignore"):
+            samples_middle = np.log(np.copy(samples_linear))
+        samples_middle[: index_middle - padding] = samples_middle[
+            index_middle - padding
+        ]
+        samples_middle[index_middle + padding :] = samples_middle[
+            index_middle + padding
+        ]
+
+        a, b = np.polyfit(
+            samples[index_middle - padding : index_middle + padding],
+            samples_middle[index_middle - padding : index_middle + padding],
+            1,
+        )
+
+        edge_left = index_middle - padding
+        edge_right = np.searchsorted(samples / size, np.max(samples_camera))
+        mask_samples = smoothstep_function(samples, edge_left, edge_right, clip=True)
+
+        table[..., i] = samples_linear
+        table[index_middle - padding :, i] = (
+            np.exp(a * samples + b) * mask_samples
+            + samples_constant * (1 - mask_samples)
+        )[index_middle - padding :]
+
+    return table
+
+
+def filter_LUT_per_channel(table: ArrayLike, sigma: float) -> NDArrayFloat:
+    """
+    Filter given linearisation *LUT* table one channel at a time, as the
+    :meth:`aces.idt.IDTGeneratorLogCamera.filter_LUT` method originally did.
+
+    Parameters
+    ----------
+    table
+        Unfiltered linearisation *LUT* table.
+    sigma
+        Standard deviation of the gaussian convolution kernel.
+
+    Returns
+    -------
+    :class:`np.ndarray`
+        Filtered linearisation *LUT* table.
+    """
+
+    table = np.copy(table)
+
+    sigma_x2 = int(sigma * 2)
+    x, step = np.linspace(0, 1, table.shape[0], retstep=True)
+    padding = np.arange(step, sigma_x2 * step + step, step)
+    for i in range(3):
+        y = table[..., i]
+        x_extended = np.concatenate([-padding[::-1], x, padding + 1])
+
+        y_linear_extended = Extrapolator(LinearInterpolator(x, y))(x_extended)
+        with np.errstate(invalid="ignore"):
+            y_log_extended = np.exp(
+                Extrapolator(LinearInterpolator(x, np.log(y)))(x_extended)
+            )
+
+        y_linear_filtered = scipy.ndimage.gaussian_filter1d(y_linear_extended, sigma)
+        y_log_filtered = scipy.ndimage.gaussian_filter1d(y_log_extended, sigma)
+
+        index_middle = len(x_extended) // 2
+        table[..., i] = np.concatenate(
+            [
+                y_linear_filtered[sigma_x2:index_middle],
+                y_log_filtered[index_middle:-sigma_x2],
+            ]
+        )
+
+    return table
+
+
+def benchmark_generate_LUT(repeat: int = 7, number: int = 10) -> None:
+    """
+    Benchmark the :meth:`aces.idt.IDTGeneratorLogCamera.generate_LUT` method
+    against the per-channel implementation for all the *LUT* sizes and print
+    the best timings and the largest absolute difference between the tables.
+
+    Parameters
+    ----------
+    repeat
+        Number of timing repetitions, the best one is reported.
+    number
+        Number of executions per timing repetition.
+    """
+
+    with open(os.path.join(ROOT_RESOURCES, "samples_camera.json")) as file:
+        samples_camera = np.array(json.load(file))
+
+    with open(os.path.join(ROOT_RESOURCES, "samples_reference.json")) as file:
+        samples_reference = np.array(json.load(file))
+
+    print(  # noqa: T201
+        f"{'Size':>8} {'Per-Channel (ms)':>18} {'Vectorised (ms)':>17} "
+        f"{'Speedup':>9} {'Difference':>12}"
+    )
+
+    for size in LUTSize.ALL:
+        project_settings = IDTProjectSettings()
+        project_settings.lut_size = size
+
+        generator = IDTGeneratorLogCamera(project_settings)
+        generator._samples_camera = samples_camera  # noqa: SLF001
+        generator._samples_reference = samples_reference  # noqa: SLF001
+
+        time_per_channel = min(
+            timeit.repeat(
+                lambda size=size: generate_LUT_per_channel(
+                    samples_camera, samples_reference, size
+                ),
+                repeat=repeat,
+                number=number,
+            )
+        )
+        time_vectorised = min(
+            timeit.repeat(generator.generate_LUT, repeat=repeat, number=number)
+        )
+
+        difference = np.max(
+            np.abs(
+                generator.generate_LUT().table
+                - generate_LUT_per_channel(samples_camera, samples_reference, size)
+            )
+        )
+
+        print(  # noqa: T201
+            f"{size:>8} {time_per_channel / number * 1000:>18.3f} "
+            f"{time_vectorised / number * 1000:>17.3f} "
+            f"{time_per_channel / time_vectorised:>8.2f}x {difference:>12.3e}"
+        )
+
+
+def benchmark_filter_LUT(
+    sigmas: tuple = (4, 16, 64, 256), repeat: int = 5, number: int = 3
+) -> None:
+    """
+    Benchmark the :meth:`aces.idt.IDTGeneratorLogCamera.filter_LUT` method
+    against the per-channel implementation for all the *LUT* sizes and given
+    smoothing values and print the best timings and the largest absolute
+    difference between the tables.
+
+    Parameters
+    ----------
+    sigmas
+        Smoothing values, i.e., standard deviations of the gaussian kernel.
+    repeat
+        Number of timing repetitions, the best one is reported.
+    number
+        Number of executions per timing repetition.
+    """
+
+    with open(os.path.join(ROOT_RESOURCES, "samples_camera.json")) as file:
+        samples_camera = np.array(json.load(file))
+
+    with open(os.path.join(ROOT_RESOURCES, "samples_reference.json")) as file:
+        samples_reference = np.array(json.load(file))
+
+    print(  # noqa: T201
+        f"{'Size':>8} {'Sigma':>6} {'Per-Channel (ms)':>18} "
+        f"{'Vectorised (ms)':>17} {'Speedup':>9} {'Difference':>12}"
+    )
+
+    for size in LUTSize.ALL:
+        for sigma in sigmas:
+            project_settings = IDTProjectSettings()
+            project_settings.lut_size = size
+            project_settings.lut_smoothing = sigma
+
+            generator = IDTGeneratorLogCamera(project_settings)
+            generator._samples_camera = samples_camera  # noqa: SLF001
+            generator._samples_reference = samples_reference  # noqa: SLF001
+            table = generator.generate_LUT().table
+
+            time_per_channel = min(
+                timeit.repeat(
+                    lambda sigma=sigma, table=table: filter_LUT_per_channel(
+                        table, sigma
+                    ),
+                    repeat=repeat,
+                    number=number,
+                )
+            )
+            time_vectorised = min(
+                timeit.repeat(generator.filter_LUT, repeat=repeat, number=number)
+            )
+
+            # The tables have *NaN* values when the smoothing is too large for
+            # the *LUT* size.
+            difference = np.nanmax(
+                np.abs(
+                    generator.filter_LUT().table - filter_LUT_per_channel(table, sigma)
+                )
+            )
+
+            print(  # noqa: T201
+                f"{size:>8} {sigma:>6} {time_per_channel / number * 1000:>18.3f} "
+                f"{time_vectorised / number * 1000:>17.3f} "
+                f"{time_per_channel / time_vectorised:>8.2f}x {difference:>12.3e}"
+            )
+
+
+if __name__ == "__main__":
+    benchmark_generate_LUT()
+    benchmark_filter_LUT()
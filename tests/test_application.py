@@ -5,16 +5,27 @@ class and its generators.
 
 from __future__ import annotations
 
+import io
 import json
 import os
 import re
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from colour.constants import TOLERANCE_ABSOLUTE_TESTS
 
 from aces.idt.application import IDTGeneratorApplication
-from aces.idt.core.constants import DirectoryStructure
+from aces.idt.core.cache import ExtractionCache
+from aces.idt.core.constants import DirectoryStructure, LUTSize
+from aces.idt.core.index import FILENAME_INDEX_DIRECTORY
 from aces.idt.framework.project_settings import IDTProjectSettings
+from aces.idt.generators import IDTBaseGenerator, IDTGeneratorLogCamera
+from tests.benchmark_log_camera import (
+    filter_LUT_per_channel,
+    generate_LUT_per_channel,
+)
 from tests.test_utils import TestIDTBase
 
 __author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
@@ -113,6 +124,17 @@ Optimisation_Space             : Oklab
 Optimization_Kwargs            : {}
 Reference_Colour_Checker       : ISO 17321-1
 Rgb_Display_Colourspace        : sRGB
+Sampling_Cache_Directory       :
+Sampling_Cache_Size            : 268435456
+Sampling_Duplicate_Frames      : False
+Sampling_Early_Stop            : False
+Sampling_Early_Stop_Tolerance  : 0.001
+Sampling_Prefetch              : 2
+Sampling_Reduced_Resolution    : False
+Sampling_Region_Of_Interest    : False
+Sampling_Swatch_Index          : False
+Sampling_Video_Frames          : 10
+Sampling_Workers               : 1
 Schema_Version                 : 0.1.0
 Temperature                    : 6000
 Working_Directory              :
@@ -136,19 +158,185 @@ Working_Directory              :
         with open(expected_file) as file:
             expected = json.load(file)
 
-        colour_checkers_result = generator.samples_analysis.get(
-            DirectoryStructure.COLOUR_CHECKER
-        )
+        samples_analysis = generator.samples_analysis.to_dict()
+        colour_checkers_result = samples_analysis.get(DirectoryStructure.COLOUR_CHECKER)
         expected_colour_checkers = expected.get(DirectoryStructure.COLOUR_CHECKER)
         for key in colour_checkers_result:
             a = colour_checkers_result[key]
             e = expected_colour_checkers[str(key)]
             self.assertEqual(a, e)
 
-        grey_result = generator.samples_analysis.get(DirectoryStructure.GREY_CARD)
+        grey_result = samples_analysis.get(DirectoryStructure.GREY_CARD)
         grey_expected = expected.get(DirectoryStructure.GREY_CARD)
         self.assertEqual(grey_result, grey_expected)
 
+    def test_log_camera_generator_sample_workers(self) -> None:
+        """
+        Test the :class:`aces.idt.IDTGeneratorLogCamera.sample` method with
+        multiple worker processes and frames prefetching.
+        """
+
+        archive = os.path.join(self.get_test_resources_folder(), "synthetic_001.zip")
+
+        samples_analysis = []
+        for sampling_workers, sampling_prefetch in ((1, 0), (1, 2), (2, 0)):
+            idt_application = IDTGeneratorApplication()
+            idt_application.generator = "IDTGeneratorLogCamera"
+            working_directory = idt_application.extract(archive)
+            idt_application.project_settings.working_directory = working_directory
+            idt_application.project_settings.sampling_workers = sampling_workers
+            idt_application.project_settings.sampling_prefetch = sampling_prefetch
+
+            generator = idt_application.generator
+            generator.sample()
+            samples_analysis.append(generator.samples_analysis.to_dict())
+
+        self.assertEqual(samples_analysis[0], samples_analysis[1])
+        self.assertEqual(samples_analysis[0], samples_analysis[2])
+
+    def test_log_camera_generator_sample_duplicate_frames(self) -> None:
+        """
+        Test the :class:`aces.idt.IDTGeneratorLogCamera.sample` method with
+        frames shared by several exposures.
+        """
+
+        archive = os.path.join(self.get_test_resources_folder(), "synthetic_001.zip")
+
+        idt_application = IDTGeneratorApplication()
+        idt_application.generator = "IDTGeneratorLogCamera"
+        working_directory = idt_application.extract(archive)
+        idt_application.project_settings.working_directory = working_directory
+
+        paths_colour_checker = idt_application.project_settings.data[
+            DirectoryStructure.COLOUR_CHECKER
+        ]
+        paths_colour_checker[1] = list(paths_colour_checker[0])
+
+        generator = idt_application.generator
+        generator.sample()
+
+        # The duplicate frames are only detected when enabled.
+        self.assertEqual(len(generator.samples_analysis.colour_checker_sequence(0)), 3)
+
+        idt_application.project_settings.sampling_duplicate_frames = True
+        with self.assertLogs("aces.idt.generators.base_generator", "INFO") as logs:
+            generator.sample()
+
+        self.assertTrue(
+            any("exposure bracket is likely broken" in log for log in logs.output)
+        )
+
+        # The frames of an exposure having the same content, only the first
+        # one is retained in its samples.
+        self.assertTrue(any("Dropped 2 duplicate" in log for log in logs.output))
+        self.assertEqual(len(generator.samples_analysis.colour_checker_sequence(0)), 1)
+        np.testing.assert_array_equal(
+            generator.samples_analysis.colour_checker_sequence(1),
+            generator.samples_analysis.colour_checker_sequence(0),
+        )
+
+    def test_log_camera_generator_sample_threads(self) -> None:
+        """
+        Test the :class:`aces.idt.IDTGeneratorLogCamera.sample` method with
+        several generators sampling concurrently in threads.
+        """
+
+        archive = os.path.join(self.get_test_resources_folder(), "synthetic_001.zip")
+
+        def sample() -> dict:
+            """Sample the archive with a new application."""
+
+            idt_application = IDTGeneratorApplication()
+            idt_application.generator = "IDTGeneratorLogCamera"
+            working_directory = idt_application.extract(archive)
+            idt_application.project_settings.working_directory = working_directory
+
+            generator = idt_application.generator
+            generator.sample()
+
+            return generator.samples_analysis.to_dict()
+
+        current_working_directory = os.getcwd()
+
+        with ThreadPoolExecutor(2) as executor:
+            samples_analysis = list(executor.map(lambda _x: sample(), range(2)))
+
+        self.assertEqual(os.getcwd(), current_working_directory)
+        self.assertEqual(samples_analysis[0], sample())
+        self.assertEqual(samples_analysis[1], samples_analysis[0])
+
+    def test_log_camera_generator_sample_stream(self) -> None:
+        """
+        Test the :class:`aces.idt.IDTGeneratorLogCamera.sample` method with
+        the frames read from the archive on demand.
+        """
+
+        archive = os.path.join(self.get_test_resources_folder(), "synthetic_001.zip")
+
+        samples_analysis = []
+        for stream, sampling_workers in ((False, 1), (True, 1), (True, 2)):
+            idt_application = IDTGeneratorApplication()
+            idt_application.generator = "IDTGeneratorLogCamera"
+            working_directory = idt_application.extract(archive, stream=stream)
+            idt_application.project_settings.working_directory = working_directory
+            idt_application.project_settings.sampling_workers = sampling_workers
+
+            if stream:
+                self.assertIsNotNone(idt_application.generator.archive)
+                # Only the project settings file is read before sampling.
+                self.assertListEqual(
+                    [
+                        file
+                        for _root, _directories, files in os.walk(working_directory)
+                        for file in files
+                    ],
+                    ["synthetic_001.json"],
+                )
+
+            generator = idt_application.generator
+            generator.sample()
+            samples_analysis.append(generator.samples_analysis.to_dict())
+
+        self.assertEqual(samples_analysis[0], samples_analysis[1])
+        self.assertEqual(samples_analysis[0], samples_analysis[2])
+
+    def test_log_camera_generator_sample_extraction_cache(self) -> None:
+        """
+        Test the :class:`aces.idt.IDTGeneratorLogCamera.sample` method with
+        the archive extracted into an extraction cache.
+        """
+
+        archive = os.path.join(self.get_test_resources_folder(), "synthetic_001.zip")
+
+        with tempfile.TemporaryDirectory() as directory:
+            extraction_cache = ExtractionCache(directory)
+
+            working_directories, samples_analysis = [], []
+            for stream in (False, False, True):
+                idt_application = IDTGeneratorApplication(
+                    extraction_cache=extraction_cache
+                )
+                idt_application.generator = "IDTGeneratorLogCamera"
+                working_directories.append(
+                    idt_application.extract(archive, stream=stream)
+                )
+                self.assertFalse(idt_application.project_settings.cleanup)
+                self.assertTrue(
+                    os.path.exists(
+                        os.path.join(working_directories[-1], FILENAME_INDEX_DIRECTORY)
+                    )
+                )
+
+                generator = idt_application.generator
+                generator.sample()
+                samples_analysis.append(generator.samples_analysis.to_dict())
+
+            self.assertEqual(working_directories[0], working_directories[1])
+            self.assertEqual(working_directories[0], working_directories[2])
+            self.assertTrue(os.path.exists(working_directories[0]))
+            self.assertEqual(samples_analysis[0], samples_analysis[1])
+            self.assertEqual(samples_analysis[0], samples_analysis[2])
+
     def test_log_camera_generator_sort(self) -> None:
         """Test the :class:`aces.idt.IDTGeneratorLogCamera.sort` method."""
 
@@ -185,6 +373,71 @@ Working_Directory              :
             atol=TOLERANCE_ABSOLUTE_TESTS,
         )
 
+    def test_log_camera_generator_generate_LUT(self) -> None:
+        """
+        Test the :class:`aces.idt.IDTGeneratorLogCamera.generate_LUT` method
+        against the per-channel implementation for all the *LUT* sizes.
+        """
+
+        with open(
+            os.path.join(self.get_test_resources_folder(), "samples_camera.json")
+        ) as file:
+            samples_camera = np.array(json.load(file))
+
+        with open(
+            os.path.join(self.get_test_resources_folder(), "samples_reference.json")
+        ) as file:
+            samples_reference = np.array(json.load(file))
+
+        for size in LUTSize.ALL:
+            project_settings = IDTProjectSettings()
+            project_settings.lut_size = size
+
+            generator = IDTGeneratorLogCamera(project_settings)
+            generator._samples_camera = samples_camera  # noqa: SLF001
+            generator._samples_reference = samples_reference  # noqa: SLF001
+
+            np.testing.assert_allclose(
+                generator.generate_LUT().table,
+                generate_LUT_per_channel(samples_camera, samples_reference, size),
+                rtol=1e-12,
+                atol=1e-12,
+            )
+
+    def test_log_camera_generator_filter_LUT(self) -> None:
+        """
+        Test the :class:`aces.idt.IDTGeneratorLogCamera.filter_LUT` method
+        against the per-channel implementation for all the *LUT* sizes.
+        """
+
+        with open(
+            os.path.join(self.get_test_resources_folder(), "samples_camera.json")
+        ) as file:
+            samples_camera = np.array(json.load(file))
+
+        with open(
+            os.path.join(self.get_test_resources_folder(), "samples_reference.json")
+        ) as file:
+            samples_reference = np.array(json.load(file))
+
+        for size in LUTSize.ALL:
+            for sigma in (4, 16, 64):
+                project_settings = IDTProjectSettings()
+                project_settings.lut_size = size
+                project_settings.lut_smoothing = sigma
+
+                generator = IDTGeneratorLogCamera(project_settings)
+                generator._samples_camera = samples_camera  # noqa: SLF001
+                generator._samples_reference = samples_reference  # noqa: SLF001
+                table = generator.generate_LUT().table
+
+                np.testing.assert_allclose(
+                    generator.filter_LUT().table,
+                    filter_LUT_per_channel(table, sigma),
+                    rtol=1e-12,
+                    atol=1e-12,
+                )
+
     def test_log_camera_generator_process_archive(self) -> None:
         """
         Test the :class:`aces.idt.IDTGeneratorLogCamera.process_archive`
@@ -1332,6 +1585,99 @@ Working_Directory              :
         )
         self.assertEqual(os.path.exists(zip_file), True)
 
+    def test_log_camera_generator_zip_bytes(self) -> None:
+        """Test the :class:`aces.idt.IDTGeneratorLogCamera.zip_bytes` method."""
+
+        idt_application = IDTGeneratorApplication()
+        idt_application.generator = "IDTGeneratorLogCamera"
+
+        archive = os.path.join(self.get_test_resources_folder(), "synthetic_001.zip")
+        idt_application.process_archive(archive)
+
+        output_directory = self.get_test_output_folder()
+        clf_path = idt_application.generator.to_clf(output_directory)
+        with open(clf_path) as clf_file:
+            clf = clf_file.read()
+
+        with zipfile.ZipFile(io.BytesIO(idt_application.zip_bytes())) as zip_file:
+            self.assertListEqual(zip_file.namelist(), [clf_path.name])
+            self.assertEqual(zip_file.read(clf_path.name).decode("utf8"), clf)
+
+        with zipfile.ZipFile(
+            io.BytesIO(idt_application.zip_bytes(archive_serialised_generator=True))
+        ) as zip_file:
+            self.assertEqual(len(zip_file.namelist()), 2)
+            self.assertTrue(zip_file.namelist()[1].endswith(".npz"))
+
+        zip_path = idt_application.zip(output_directory)
+        self.assertEqual(zip_path.name, idt_application.generator.zip_filename)
+        with zipfile.ZipFile(zip_path) as zip_file:
+            self.assertListEqual(zip_file.namelist(), [clf_path.name])
+
+    def test_preflight(self) -> None:
+        """Test the :class:`aces.idt.IDTGeneratorApplication.preflight` method."""
+
+        idt_application = IDTGeneratorApplication()
+        idt_application.generator = "IDTGeneratorLogCamera"
+
+        archive = os.path.join(self.get_test_resources_folder(), "synthetic_001.zip")
+        idt_application.extract(archive, stream=True)
+
+        report = idt_application.preflight()
+
+        self.assertTrue(report["valid"])
+        self.assertEqual(report["frames"], 24)
+        self.assertListEqual(report["inconsistencies"], [])
+        self.assertGreater(report["size"], 0)
+
+        idt_application.archive.close()
+
+    def test_log_camera_generator_npz(self) -> None:
+        """
+        Test the :class:`aces.idt.IDTGeneratorLogCamera.to_npz` and
+        :class:`aces.idt.IDTGeneratorLogCamera.from_npz` methods.
+        """
+
+        idt_application = IDTGeneratorApplication()
+        idt_application.generator = "IDTGeneratorLogCamera"
+
+        archive = os.path.join(self.get_test_resources_folder(), "synthetic_001.zip")
+        generator = idt_application.process_archive(archive)
+
+        buffer = io.BytesIO()
+        generator.to_npz(buffer)
+        buffer.seek(0)
+        generator_loaded = IDTBaseGenerator.from_npz(buffer)
+
+        self.assertIsInstance(generator_loaded, IDTGeneratorLogCamera)
+        self.assertIsNone(generator_loaded.image_colour_checker_segmentation)
+        self.assertEqual(
+            generator_loaded.project_settings.to_json(),
+            generator.project_settings.to_json(),
+        )
+        self.assertEqual(generator_loaded._clf(), generator._clf())  # noqa: SLF001
+
+        np.testing.assert_array_equal(generator_loaded.M, generator.M)
+        np.testing.assert_array_equal(
+            generator_loaded.LUT_decoding.table, generator.LUT_decoding.table
+        )
+        np.testing.assert_array_equal(
+            generator_loaded.samples_analysis.colour_checker_medians,
+            generator.samples_analysis.colour_checker_medians,
+        )
+        for EV, samples in generator.samples_decoded.items():
+            np.testing.assert_array_equal(generator_loaded.samples_decoded[EV], samples)
+
+        buffer = io.BytesIO()
+        generator.to_npz(buffer, include_images=True)
+        buffer.seek(0)
+        generator_loaded = IDTBaseGenerator.from_npz(buffer)
+
+        np.testing.assert_array_equal(
+            generator_loaded.image_colour_checker_segmentation,
+            generator.image_colour_checker_segmentation,
+        )
+
     def test_prelinearized_idt_generator_from_archive_zip(self) -> None:
         """Test the :class:`aces.idt.IDTGeneratorPreLinearizedCamera.zip` method."""
 
@@ -0,0 +1,217 @@
+"""Define the unit tests for the :mod:`aces.idt.core.archive` module."""
+
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from aces.idt.core.archive import ZipArchiveReader, resolve_path
+from aces.idt.core.common import hash_file
+from tests.test_utils import TestIDTBase
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestZipArchiveReader",
+    "TestResolvePath",
+]
+
+
+class TestZipArchiveReader(TestIDTBase):
+    """
+    Define :class:`aces.idt.core.archive.ZipArchiveReader` class unit tests
+    methods.
+    """
+
+    def setUp(self) -> None:
+        """Initialise the common tests attributes."""
+
+        self._temporary_directory = tempfile.TemporaryDirectory()
+
+        self._archive = os.path.join(self._temporary_directory.name, "archive.zip")
+        with zipfile.ZipFile(self._archive, "w") as zip_file:
+            zip_file.writestr("root/data/0/frame_0001.exr", b"frame_0001")
+            zip_file.writestr(
+                "root/data/0/frame_0002.exr",
+                b"frame_0002",
+                compress_type=zipfile.ZIP_DEFLATED,
+            )
+            zip_file.writestr("root/settings.json", b"{}")
+
+        self._reader = ZipArchiveReader(
+            self._archive, os.path.join(self._temporary_directory.name, "archive")
+        )
+
+    def tearDown(self) -> None:
+        """After tests actions."""
+
+        self._reader.close()
+        self._temporary_directory.cleanup()
+
+    def test_listing(self) -> None:
+        """
+        Test :meth:`aces.idt.core.archive.ZipArchiveReader.exists`,
+        :meth:`aces.idt.core.archive.ZipArchiveReader.is_dir` and
+        :meth:`aces.idt.core.archive.ZipArchiveReader.iterdir` methods.
+        """
+
+        directory = Path(self._reader.directory)
+
+        self.assertTrue(self._reader.exists("root/data/0"))
+        self.assertTrue(self._reader.exists(directory / "root/settings.json"))
+        self.assertFalse(self._reader.exists("root/data/1"))
+        self.assertTrue(self._reader.is_dir("root/data"))
+        self.assertFalse(self._reader.is_dir("root/settings.json"))
+
+        self.assertListEqual(self._reader.iterdir(directory), [directory / "root"])
+        self.assertListEqual(
+            self._reader.iterdir("root"),
+            [directory / "root/data", directory / "root/settings.json"],
+        )
+
+        # Nothing is materialised by listing the archive.
+        self.assertListEqual(os.listdir(directory), [])
+
+    def test_extract(self) -> None:
+        """Test :meth:`aces.idt.core.archive.ZipArchiveReader.extract` method."""
+
+        for name in ("frame_0001", "frame_0002"):
+            path = self._reader.extract(f"root/data/0/{name}.exr")
+
+            self.assertEqual(
+                path,
+                os.path.join(
+                    self._reader.directory, "root", "data", "0", f"{name}.exr"
+                ),
+            )
+
+            with open(path, "rb") as file:
+                self.assertEqual(file.read(), name.encode())
+
+        self.assertListEqual(
+            sorted(os.listdir(os.path.join(self._reader.directory, "root"))), ["data"]
+        )
+
+    def test_extract_outside_directory(self) -> None:
+        """
+        Test that :class:`aces.idt.core.archive.ZipArchiveReader` class does not
+        write outside of its directory.
+        """
+
+        for name in ("../../escaped.txt", "root/../../escaped.txt", "/escaped.txt"):
+            archive = os.path.join(self._temporary_directory.name, "malicious.zip")
+            with zipfile.ZipFile(archive, "w") as zip_file:
+                zip_file.writestr("root/settings.json", b"{}")
+                zip_file.writestr(name, b"escaped")
+
+            self.assertRaises(
+                ValueError,
+                ZipArchiveReader,
+                archive,
+                os.path.join(self._temporary_directory.name, "malicious", "archive"),
+            )
+
+        self.assertRaises(ValueError, self._reader.extract, "../escaped.txt")
+
+        # A directory symbolic link must not redirect the members either.
+        directory = os.path.join(self._temporary_directory.name, "outside")
+        os.makedirs(directory)
+        os.symlink(directory, os.path.join(self._reader.directory, "root"))
+
+        self.assertRaises(ValueError, self._reader.extract, "root/settings.json")
+        self.assertListEqual(os.listdir(directory), [])
+        self.assertFalse(
+            os.path.exists(os.path.join(self._temporary_directory.name, "escaped.txt"))
+        )
+
+    def test_digest(self) -> None:
+        """
+        Test :meth:`aces.idt.core.archive.ZipArchiveReader.size`,
+        :meth:`aces.idt.core.archive.ZipArchiveReader.fingerprint` and
+        :meth:`aces.idt.core.archive.ZipArchiveReader.digest` methods.
+        """
+
+        path = "root/data/0/frame_0002.exr"
+
+        self.assertEqual(self._reader.size(path), 10)
+        self.assertEqual(self._reader.fingerprint(path)[0], 10)
+        self.assertNotEqual(
+            self._reader.fingerprint(path),
+            self._reader.fingerprint("root/data/0/frame_0001.exr"),
+        )
+
+        with mock.patch.object(
+            zipfile.ZipFile, "open", autospec=True, side_effect=zipfile.ZipFile.open
+        ) as open_mock:
+            digest = self._reader.digest(path)
+
+            # The archive member is materialised while it is hashed, it is not
+            # decompressed again when it is read.
+            target = self._reader.extract(path)
+
+            self.assertEqual(open_mock.call_count, 1)
+
+        self.assertEqual(digest, hash_file(target))
+
+        # The archive member materialised by another reader is hashed from the
+        # disk.
+        reader = ZipArchiveReader(self._reader.archive, self._reader.directory)
+        with mock.patch.object(zipfile.ZipFile, "open") as open_mock:
+            self.assertEqual(reader.digest(path), digest)
+
+            open_mock.assert_not_called()
+        reader.close()
+
+        self.assertRaises(KeyError, self._reader.fingerprint, "root/missing.exr")
+
+    def test_pickle(self) -> None:
+        """Test :class:`aces.idt.core.archive.ZipArchiveReader` class pickling."""
+
+        self._reader.extract("root/settings.json")
+
+        reader = pickle.loads(pickle.dumps(self._reader))  # noqa: S301
+
+        self.assertEqual(reader.directory, self._reader.directory)
+        self.assertTupleEqual(reader.names, self._reader.names)
+        self.assertTrue(os.path.exists(reader.extract("root/data/0/frame_0001.exr")))
+
+        reader.close()
+
+
+class TestResolvePath(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.archive.resolve_path` definition unit tests
+    methods.
+    """
+
+    def test_resolve_path(self) -> None:
+        """Test :func:`aces.idt.core.archive.resolve_path` definition."""
+
+        self.assertEqual(
+            resolve_path("frame.exr", "directory"),
+            os.path.join("directory", "frame.exr"),
+        )
+        self.assertEqual(resolve_path("/frame.exr", "directory"), "/frame.exr")
+
+        with tempfile.TemporaryDirectory() as directory:
+            archive = os.path.join(directory, "archive.zip")
+            with zipfile.ZipFile(archive, "w") as zip_file:
+                zip_file.writestr("frame.exr", b"frame")
+
+            reader = ZipArchiveReader(archive, os.path.join(directory, "archive"))
+
+            self.assertEqual(
+                resolve_path("frame.exr", reader),
+                os.path.join(directory, "archive", "frame.exr"),
+            )
+
+            reader.close()
@@ -0,0 +1,175 @@
+"""Define the unit tests for the :mod:`aces.idt.batch` module."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import zipfile
+
+from aces.idt.batch import (
+    archive_output_names,
+    expand_archives,
+    main,
+    process_archives,
+)
+from tests.test_utils import TestIDTBase
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestExpandArchives",
+    "TestArchiveOutputNames",
+    "TestProcessArchives",
+    "TestMain",
+]
+
+
+class TestExpandArchives(TestIDTBase):
+    """
+    Define :func:`aces.idt.batch.expand_archives` definition unit tests
+    methods.
+    """
+
+    def test_expand_archives(self) -> None:
+        """Test :func:`aces.idt.batch.expand_archives` definition."""
+
+        resources = self.get_test_resources_folder()
+        archive = os.path.join(resources, "synthetic_001.zip")
+
+        archives = expand_archives(
+            [archive, os.path.join(resources, "synthetic_00*.zip")]
+        )
+
+        self.assertEqual(archives[0], archive)
+        self.assertEqual(len(archives), 4)
+        self.assertListEqual(expand_archives(["missing.zip"]), ["missing.zip"])
+
+
+class TestArchiveOutputNames(TestIDTBase):
+    """
+    Define :func:`aces.idt.batch.archive_output_names` definition unit tests
+    methods.
+    """
+
+    def test_archive_output_names(self) -> None:
+        """Test :func:`aces.idt.batch.archive_output_names` definition."""
+
+        self.assertListEqual(
+            archive_output_names(
+                [
+                    os.path.join("fleet", "camA", "data.zip"),
+                    os.path.join("fleet", "camB", "data.zip"),
+                    os.path.join("fleet", "camB", "2024", "data.zip"),
+                ]
+            ),
+            ["camA/data", "camB/data", "camB/2024/data"],
+        )
+        self.assertListEqual(
+            archive_output_names([os.path.join("fleet", "camA", "data.zip")]),
+            ["data"],
+        )
+        self.assertListEqual(archive_output_names([]), [])
+
+
+class TestProcessArchives(TestIDTBase):
+    """
+    Define :func:`aces.idt.batch.process_archives` definition unit tests
+    methods.
+    """
+
+    def test_process_archives(self) -> None:
+        """Test :func:`aces.idt.batch.process_archives` definition."""
+
+        resources = self.get_test_resources_folder()
+        archives = [
+            os.path.join(resources, "synthetic_001.zip"),
+            os.path.join(resources, "synthetic_002.zip"),
+            os.path.join(resources, "missing.zip"),
+        ]
+
+        with tempfile.TemporaryDirectory() as output_directory:
+            summaries = process_archives(
+                archives, output_directory=output_directory, jobs=2
+            )
+
+            self.assertListEqual(
+                [summary["archive"] for summary in summaries], archives
+            )
+            self.assertListEqual(
+                [summary["status"] for summary in summaries],
+                ["success", "success", "failure"],
+            )
+
+            for summary in summaries[:2]:
+                self.assertTrue(
+                    summary["zip"].startswith(
+                        os.path.join(
+                            output_directory,
+                            os.path.splitext(os.path.basename(summary["archive"]))[0],
+                        )
+                    )
+                )
+                self.assertTrue(zipfile.is_zipfile(summary["zip"]))
+                self.assertEqual(len(summary["M"]), 3)
+                self.assertEqual(len(summary["RGB_w"]), 3)
+                self.assertGreater(summary["k"], 0)
+                self.assertLess(summary["delta_E"]["median"], 5)
+                self.assertGreater(summary["timings"]["total"], 0)
+
+            self.assertIn("error", summaries[2])
+
+    def test_raise_exception_process_archives(self) -> None:
+        """
+        Test :func:`aces.idt.batch.process_archives` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, process_archives, [], "IDTGeneratorMissing")
+
+
+class TestMain(TestIDTBase):
+    """Define :func:`aces.idt.batch.main` definition unit tests methods."""
+
+    def test_main(self) -> None:
+        """Test :func:`aces.idt.batch.main` definition."""
+
+        archive = os.path.join(self.get_test_resources_folder(), "synthetic_001.zip")
+
+        with tempfile.TemporaryDirectory() as output_directory:
+            self.assertEqual(
+                main([archive, "--output-directory", output_directory, "--jobs", "1"]),
+                0,
+            )
+
+            with open(os.path.join(output_directory, "summary.json")) as summary_file:
+                summaries = json.load(summary_file)
+
+            self.assertEqual(len(summaries), 1)
+            self.assertEqual(summaries[0]["status"], "success")
+            self.assertNotIn("preflight", summaries[0])
+
+            self.assertEqual(
+                main(
+                    [
+                        archive,
+                        "--output-directory",
+                        output_directory,
+                        "--jobs",
+                        "1",
+                        "--preflight",
+                    ]
+                ),
+                0,
+            )
+
+            with open(os.path.join(output_directory, "summary.json")) as summary_file:
+                summaries = json.load(summary_file)
+
+            self.assertTrue(summaries[0]["preflight"]["valid"])
+            self.assertIn("preflight", summaries[0]["timings"])
@@ -0,0 +1,275 @@
+"""Define the unit tests for the :mod:`aces.idt.core.cache` module."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+import zipfile
+from unittest import mock
+
+import numpy as np
+
+from aces.idt.core import SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC
+from aces.idt.core.cache import ExtractionCache, SamplesCache
+from aces.idt.core.common import hash_file
+from tests.test_utils import TestIDTBase
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestSamplesCache",
+    "TestExtractionCache",
+]
+
+
+class TestSamplesCache(TestIDTBase):
+    """
+    Define :class:`aces.idt.core.cache.SamplesCache` class unit tests
+    methods.
+    """
+
+    def setUp(self) -> None:
+        """Initialise the common tests attributes."""
+
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self._cache = SamplesCache(
+            os.path.join(self._temporary_directory.name, "cache")
+        )
+
+        self._path = os.path.join(self._temporary_directory.name, "frame.bin")
+        with open(self._path, "wb") as file:
+            file.write(b"frame")
+
+    def tearDown(self) -> None:
+        """After tests actions."""
+
+        self._temporary_directory.cleanup()
+
+    def test_key(self) -> None:
+        """Test :meth:`aces.idt.core.cache.SamplesCache.key` method."""
+
+        settings = SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC
+        quadrilateral = np.array([[10, 0], [10, 10], [0, 10], [0, 0]])
+
+        key = self._cache.key(self._path, settings, quadrilateral)
+
+        self.assertEqual(key, self._cache.key(self._path, settings, quadrilateral))
+        self.assertNotEqual(
+            key, self._cache.key(self._path, settings, quadrilateral + 1)
+        )
+        self.assertNotEqual(
+            key,
+            self._cache.key(
+                self._path, dict(settings, working_width=800), quadrilateral
+            ),
+        )
+        self.assertNotEqual(
+            key,
+            self._cache.key(
+                self._path, settings, quadrilateral, region_of_interest=True
+            ),
+        )
+
+        with open(self._path, "wb") as file:
+            file.write(b"modified frame")
+
+        self.assertNotEqual(key, self._cache.key(self._path, settings, quadrilateral))
+
+        digest = self._cache.digest(self._path)
+        self.assertEqual(
+            self._cache.key(self._path, settings, quadrilateral),
+            self._cache.key("missing.bin", settings, quadrilateral, digest),
+        )
+
+    def test_digest(self) -> None:
+        """Test :meth:`aces.idt.core.cache.SamplesCache.digest` method."""
+
+        with mock.patch(
+            "aces.idt.core.cache.hash_file", side_effect=hash_file
+        ) as hash_file_mock:
+            digest = self._cache.digest(self._path)
+
+            self.assertEqual(digest, hash_file(self._path))
+            self.assertEqual(self._cache.digest(self._path), digest)
+            self.assertEqual(hash_file_mock.call_count, 1)
+
+            with open(self._path, "wb") as file:
+                file.write(b"modified frame")
+            os.utime(self._path, ns=(0, 0))
+
+            self.assertNotEqual(self._cache.digest(self._path), digest)
+            self.assertEqual(hash_file_mock.call_count, 2)
+
+    def test_get_set(self) -> None:
+        """
+        Test :meth:`aces.idt.core.cache.SamplesCache.get` and
+        :meth:`aces.idt.core.cache.SamplesCache.set` methods.
+        """
+
+        swatch_colours = np.random.random((24, 3)).astype(np.float32)
+
+        self.assertIsNone(self._cache.get("key"))
+
+        self._cache.set("key", swatch_colours)
+
+        np.testing.assert_array_equal(self._cache.get("key"), swatch_colours)
+
+        self._cache.clear()
+
+        self.assertIsNone(self._cache.get("key"))
+
+    def test_evict(self) -> None:
+        """Test :meth:`aces.idt.core.cache.SamplesCache.evict` method."""
+
+        swatch_colours = np.zeros((24, 3), dtype=np.float32)
+
+        cache = SamplesCache(self._cache.directory, 0)
+        for i in range(4):
+            cache.set(str(i), swatch_colours, evict=False)
+            os.utime(cache._path(str(i)), (i, i))  # noqa: SLF001
+
+        size = os.path.getsize(cache._path("0"))  # noqa: SLF001
+        cache._size = size * 2  # noqa: SLF001
+
+        # Reading an entry marks it as the most recently used.
+        cache.get("0")
+        cache.evict()
+
+        self.assertIsNotNone(cache.get("0"))
+        self.assertIsNone(cache.get("1"))
+        self.assertIsNone(cache.get("2"))
+        self.assertIsNotNone(cache.get("3"))
+
+
+class TestExtractionCache(TestIDTBase):
+    """
+    Define :class:`aces.idt.core.cache.ExtractionCache` class unit tests
+    methods.
+    """
+
+    def setUp(self) -> None:
+        """Initialise the common tests attributes."""
+
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self._cache = ExtractionCache(
+            os.path.join(self._temporary_directory.name, "cache")
+        )
+
+    def tearDown(self) -> None:
+        """After tests actions."""
+
+        self._temporary_directory.cleanup()
+
+    def _archive(self, name: str, content: bytes) -> str:
+        """Create an archive with given name storing given content."""
+
+        path = os.path.join(self._temporary_directory.name, f"{name}.zip")
+        with zipfile.ZipFile(path, "w") as zip_file:
+            zip_file.writestr(f"{name}/data/frame_0001.exr", content)
+            zip_file.writestr(f"{name}/data/frame_0002.exr", content)
+
+        return path
+
+    def test_extract(self) -> None:
+        """Test :meth:`aces.idt.core.cache.ExtractionCache.extract` method."""
+
+        archive = self._archive("archive", b"frame")
+
+        directory = self._cache.extract(archive)
+        path = os.path.join(directory, "archive", "data", "frame_0001.exr")
+
+        self.assertEqual(os.path.basename(directory), self._cache.key(archive))
+        self.assertTrue(os.path.exists(path))
+
+        # The existing members are reused, and the missing ones extracted.
+        os.utime(path, (0, 0))
+        os.remove(os.path.join(directory, "archive", "data", "frame_0002.exr"))
+
+        self.assertEqual(self._cache.extract(archive), directory)
+        self.assertEqual(os.path.getmtime(path), 0)
+        self.assertTrue(
+            os.path.exists(os.path.join(directory, "archive", "data", "frame_0002.exr"))
+        )
+
+    def test_remove_stale(self) -> None:
+        """
+        Test :class:`aces.idt.core.cache.ExtractionCache` class stale
+        temporary files removal.
+        """
+
+        directory = self._cache.entry(self._archive("archive", b"frame"))
+
+        stale = os.path.join(directory, "stale.tmp")
+        recent = os.path.join(directory, "recent.tmp")
+        for path in (stale, recent):
+            with open(path, "wb") as file:
+                file.write(b"partial")
+
+        os.utime(stale, (0, 0))
+
+        ExtractionCache(self._cache.directory)
+
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(recent))
+
+    def test_extract_outside_directory(self) -> None:
+        """
+        Test that :meth:`aces.idt.core.cache.ExtractionCache.extract` method
+        does not write outside of the cache entry.
+        """
+
+        archive = os.path.join(self._temporary_directory.name, "malicious.zip")
+        with zipfile.ZipFile(archive, "w") as zip_file:
+            zip_file.writestr("archive/data/frame_0001.exr", b"frame")
+            zip_file.writestr("../../escaped.exr", b"escaped")
+
+        self.assertRaises(ValueError, self._cache.extract, archive)
+        self.assertFalse(
+            os.path.exists(os.path.join(self._temporary_directory.name, "escaped.exr"))
+        )
+
+    def test_evict(self) -> None:
+        """Test :meth:`aces.idt.core.cache.ExtractionCache.evict` method."""
+
+        def age(directory: str, mtime: float) -> None:
+            """Set the modification time of given entry and its content."""
+
+            for root, directories, files in os.walk(directory):
+                for name in directories + files:
+                    os.utime(os.path.join(root, name), (mtime, mtime))
+
+            os.utime(directory, (mtime, mtime))
+
+        archives = [self._archive(f"archive_{i}", bytes([i]) * 1024) for i in range(3)]
+        directories = [self._cache.extract(archive) for archive in archives]
+        for i, directory in enumerate(directories):
+            age(directory, time.time() - 7200 + i)
+
+        # Using an entry marks it as the most recently used.
+        self._cache.entry(archives[0])
+
+        cache = ExtractionCache(self._cache.directory, 2048 * 2)
+        cache.evict()
+
+        self.assertTrue(os.path.exists(directories[0]))
+        self.assertFalse(os.path.exists(directories[1]))
+        self.assertTrue(os.path.exists(directories[2]))
+
+        # The recently used entries might be in use by another process.
+        cache = ExtractionCache(self._cache.directory, 0)
+        cache.evict(os.path.basename(directories[2]))
+
+        self.assertTrue(os.path.exists(directories[0]))
+        self.assertTrue(os.path.exists(directories[2]))
+
+        age(directories[0], time.time() - 7200)
+        cache.evict(os.path.basename(directories[2]))
+
+        self.assertFalse(os.path.exists(directories[0]))
+        self.assertTrue(os.path.exists(directories[2]))
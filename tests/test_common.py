@@ -4,15 +4,31 @@ from __future__ import annotations
 
 import json
 import os.path
+import tempfile
 
 import numpy as np
+import scipy.ndimage
+import scipy.optimize
+from colour import LUT1D, Extrapolator, LinearInterpolator, LUT3x1D
+from colour.algebra import vecmul
+from colour.models import RGB_COLOURSPACE_ACES2065_1
 
 from aces.idt.core import EXPOSURE_CLIPPING_THRESHOLD
 from aces.idt.core.common import (
+    RGB_COLORCHECKER_CLASSIC_ACES,
+    StreamingHasher,
+    apply_LUT_uniform,
     calculate_camera_npm_and_primaries_wp,
+    extrapolate_channels,
+    filter_gaussian,
     find_clipped_exposures,
     find_similar_rows,
+    generate_optimisation_targets,
     generate_reference_colour_checker,
+    get_sds_illuminant,
+    hash_file,
+    optimisation_factory_IPT,
+    optimisation_factory_Oklab,
 )
 from tests.test_utils import TestIDTBase
 
@@ -28,6 +44,12 @@ __all__ = [
     "TestCalculateCameraNpmAndPrimariesWp",
     "TestFindSimilarRows",
     "TestFindClippedExposures",
+    "TestStreamingHasher",
+    "TestExtrapolateChannels",
+    "TestFilterGaussian",
+    "TestApplyLUTUniform",
+    "TestJacobianFactoryIab",
+    "TestGenerateOptimisationTargets",
 ]
 
 
@@ -74,6 +96,28 @@ class TestGenerateReferenceColourChecker:
             atol=1e-15,
         )
 
+        # The memoised values are copied so that the callers can modify them.
+        reference_colour_checker = generate_reference_colour_checker()
+        reference_colour_checker *= 0
+
+        np.testing.assert_array_equal(
+            generate_reference_colour_checker(), RGB_COLORCHECKER_CLASSIC_ACES
+        )
+
+        # The memoised values are keyed by content.
+        reference_colour_checker = generate_reference_colour_checker(
+            illuminant=get_sds_illuminant("D50")
+        )
+
+        assert not np.allclose(reference_colour_checker, RGB_COLORCHECKER_CLASSIC_ACES)
+        assert not np.allclose(
+            reference_colour_checker,
+            generate_reference_colour_checker(
+                illuminant=get_sds_illuminant("D50"),
+                chromatic_adaptation_transform="Bradford",
+            ),
+        )
+
 
 class TestCalculateCameraNpmAndPrimariesWp:
     """
@@ -360,3 +404,290 @@ class TestFindClippedExposures(TestIDTBase):
         )
         expected_ev_keys = [-6.0, -5.0, -4.0, 4.0, 5.0, 6.0]
         self.assertEqual(removed_evs, expected_ev_keys)
+
+
+class TestStreamingHasher(TestIDTBase):
+    """
+    Define :class:`aces.idt.core.common.StreamingHasher` class unit tests
+    methods.
+    """
+
+    def setUp(self) -> None:
+        """Initialise the common tests attributes."""
+
+        self._data = np.random.default_rng(4).bytes(1000)
+
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(self._data)
+
+        self._path = file.name
+        self._hash = hash_file(self._path)
+
+    def tearDown(self) -> None:
+        """After tests actions."""
+
+        os.remove(self._path)
+
+    def test_update(self) -> None:
+        """Test :meth:`aces.idt.core.common.StreamingHasher.update` method."""
+
+        hasher = StreamingHasher()
+        for i in range(0, len(self._data), 100):
+            hasher.update(self._data[i : i + 100])
+
+        self.assertEqual(hasher.size, len(self._data))
+        self.assertEqual(hasher.hexdigest(len(self._data)), self._hash)
+
+    def test_update_out_of_order(self) -> None:
+        """
+        Test :meth:`aces.idt.core.common.StreamingHasher.update` method with
+        out of order and re-sent chunks.
+        """
+
+        hasher = StreamingHasher()
+        for i in (300, 100, 0, 0, 200, 100, 600, 400, 500, 700, 900, 800):
+            hasher.update(self._data[i : i + 100], i)
+
+        self.assertEqual(hasher.hexdigest(len(self._data)), self._hash)
+
+        hasher = StreamingHasher()
+        for i in (0, 100, 300):
+            hasher.update(self._data[i : i + 100], i)
+
+        self.assertEqual(hasher.size, 200)
+        self.assertIsNone(hasher.hexdigest(len(self._data)))
+
+    def test_update_overflow(self) -> None:
+        """
+        Test :meth:`aces.idt.core.common.StreamingHasher.update` method when
+        the out of order chunks exceed the buffer size.
+        """
+
+        hasher = StreamingHasher(150)
+        for i in range(900, -1, -100):
+            hasher.update(self._data[i : i + 100], i)
+
+        self.assertIsNone(hasher.hexdigest())
+
+
+class TestExtrapolateChannels(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.common.extrapolate_channels` definition unit
+    tests methods.
+    """
+
+    def test_extrapolate_channels(self) -> None:
+        """Test :func:`aces.idt.core.common.extrapolate_channels` definition."""
+
+        with open(
+            os.path.join(self.get_test_resources_folder(), "samples_camera.json")
+        ) as file:
+            samples_camera = np.array(json.load(file))
+
+        with open(
+            os.path.join(self.get_test_resources_folder(), "samples_reference.json")
+        ) as file:
+            samples_reference = np.array(json.load(file))
+
+        # The last channel is not sorted and has duplicate values.
+        samples_camera[..., 2] = np.roll(samples_camera[..., 2], 3)
+        samples_camera[5, 2] = samples_camera[4, 2]
+
+        size = 1024
+        x = samples_camera * (size - 1)
+        samples = np.arange(size)
+
+        samples_linear, samples_constant = extrapolate_channels(
+            x, samples_reference, samples
+        )
+
+        self.assertTupleEqual(samples_linear.shape, (size, 3))
+
+        for i in range(3):
+            interpolator = LinearInterpolator(x[..., i], samples_reference[..., i])
+
+            np.testing.assert_array_equal(
+                samples_linear[..., i], Extrapolator(interpolator)(samples)
+            )
+            np.testing.assert_array_equal(
+                samples_constant[..., i],
+                Extrapolator(interpolator, method="Constant")(samples),
+            )
+
+
+class TestFilterGaussian(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.common.filter_gaussian` definition unit tests
+    methods.
+    """
+
+    def test_filter_gaussian(self) -> None:
+        """Test :func:`aces.idt.core.common.filter_gaussian` definition."""
+
+        array = np.random.default_rng(4).random([2, 3, 4096])
+
+        np.testing.assert_array_equal(
+            filter_gaussian(array, 8), scipy.ndimage.gaussian_filter1d(array, 8)
+        )
+
+        # Large kernels are convolved in the frequency domain.
+        for sigma, axis in ((32, -1), (64, 1), (512, -1)):
+            np.testing.assert_allclose(
+                filter_gaussian(np.moveaxis(array, -1, axis), sigma, axis=axis),
+                scipy.ndimage.gaussian_filter1d(
+                    np.moveaxis(array, -1, axis), sigma, axis=axis
+                ),
+                atol=1e-12,
+            )
+
+        array[0, 0, 16] = np.nan
+
+        np.testing.assert_array_equal(
+            filter_gaussian(array, 64), scipy.ndimage.gaussian_filter1d(array, 64)
+        )
+
+
+class TestApplyLUTUniform(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.common.apply_LUT_uniform` definition unit
+    tests methods.
+    """
+
+    def test_apply_LUT_uniform(self) -> None:
+        """Test :func:`aces.idt.core.common.apply_LUT_uniform` definition."""
+
+        # The values are partly outside the domain to test the extrapolation.
+        RGB = np.random.default_rng(4).uniform(-0.25, 1.75, [4, 6, 3])
+
+        table = LUT3x1D.linear_table(1024) ** [2.0, 2.2, 2.4]
+        for LUT in (
+            LUT1D(LUT1D.linear_table(1024) ** 2.2),
+            LUT1D(LUT1D.linear_table(1024) ** 2.2, domain=[-0.1, 1.5]),
+            LUT3x1D(np.asfortranarray(table)),
+            LUT3x1D(np.ascontiguousarray(table)),
+            LUT3x1D(table, domain=[[-0.1, 0, 0.1], [1.0, 1.5, 2.0]]),
+            LUT3x1D(
+                np.linspace([0, 0, 0], [1, 2, 4], 4),
+                domain=np.array(
+                    [[0, 0, 0], [0.1, 0.2, 0.4], [0.5, 0.6, 0.8], [1, 1, 1]]
+                ),
+            ),
+        ):
+            np.testing.assert_allclose(
+                apply_LUT_uniform(LUT, RGB), LUT.apply(RGB), atol=1e-12
+            )
+
+        LUT = LUT3x1D(table)
+        RGB[0, 0, 1] = np.nan
+
+        RGB_LUT = apply_LUT_uniform(LUT, RGB, np.float32)
+
+        self.assertEqual(RGB_LUT.dtype, np.float32)
+        self.assertTrue(np.isnan(RGB_LUT[0, 0, 1]))
+        np.testing.assert_allclose(
+            RGB_LUT[1:], apply_LUT_uniform(LUT, RGB)[1:], atol=1e-3
+        )
+        self.assertEqual(
+            apply_LUT_uniform(LUT1D(LUT1D.linear_table(5) ** 2), 0.5), 0.25
+        )
+
+
+class TestJacobianFactoryIab(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.common.jacobian_factory_Iab` definition unit
+    tests methods.
+    """
+
+    def test_jacobian_factory_Iab(self) -> None:
+        """Test :func:`aces.idt.core.common.jacobian_factory_Iab` definition."""
+
+        generator = np.random.default_rng(4)
+
+        XYZ = vecmul(
+            RGB_COLOURSPACE_ACES2065_1.matrix_RGB_to_XYZ,
+            RGB_COLORCHECKER_CLASSIC_ACES,
+        )
+        RGB = vecmul(
+            np.identity(3) + generator.normal(0, 0.1, (3, 3)),
+            RGB_COLORCHECKER_CLASSIC_ACES,
+        )
+
+        for optimisation_factory in (
+            optimisation_factory_Oklab,
+            optimisation_factory_IPT,
+        ):
+            self.assertEqual(len(optimisation_factory()), 4)
+
+            (
+                x_0,
+                objective_function,
+                XYZ_to_optimization_colour_model,
+                _finaliser_function,
+                jacobian_function,
+            ) = optimisation_factory(jacobian=True)
+
+            arguments = (RGB, XYZ_to_optimization_colour_model(XYZ))
+            for M in (x_0, x_0 + generator.normal(0, 0.2, 6)):
+                np.testing.assert_allclose(
+                    jacobian_function(M, *arguments),
+                    scipy.optimize.approx_fprime(
+                        M, objective_function, 1e-7, *arguments
+                    ),
+                    atol=1e-5,
+                )
+
+            # The samples matching the reference values have a null distance.
+            self.assertTrue(
+                np.all(
+                    np.isfinite(
+                        jacobian_function(
+                            x_0,
+                            RGB_COLORCHECKER_CLASSIC_ACES,
+                            XYZ_to_optimization_colour_model(XYZ),
+                        )
+                    )
+                )
+            )
+
+
+class TestGenerateOptimisationTargets(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.common.generate_optimisation_targets`
+    definition unit tests methods.
+    """
+
+    def test_generate_optimisation_targets(self) -> None:
+        """
+        Test :func:`aces.idt.core.common.generate_optimisation_targets`
+        definition.
+        """
+
+        XYZ = vecmul(
+            RGB_COLOURSPACE_ACES2065_1.matrix_RGB_to_XYZ,
+            RGB_COLORCHECKER_CLASSIC_ACES,
+        )
+
+        for optimisation_factory in (
+            optimisation_factory_Oklab,
+            optimisation_factory_IPT,
+        ):
+            XYZ_to_optimization_colour_model = optimisation_factory()[2]
+
+            for _ in range(2):
+                targets = generate_optimisation_targets(
+                    RGB_COLORCHECKER_CLASSIC_ACES, optimisation_factory
+                )
+
+                np.testing.assert_array_equal(
+                    targets, XYZ_to_optimization_colour_model(XYZ)
+                )
+
+                targets *= 0
+
+        np.testing.assert_allclose(
+            generate_optimisation_targets(
+                RGB_COLORCHECKER_CLASSIC_ACES * 2, optimisation_factory_Oklab
+            ),
+            optimisation_factory_Oklab()[2](XYZ * 2),
+            atol=1e-15,
+        )
@@ -0,0 +1,255 @@
+"""Define the unit tests for the :mod:`aces.idt.core.index` module."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from aces.idt.core.archive import ZipArchiveReader
+from aces.idt.core.common import hash_file
+from aces.idt.core.index import (
+    FILENAME_INDEX_DIRECTORY,
+    DirectoryIndex,
+    find_duplicate_frames,
+)
+from tests.test_utils import TestIDTBase
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestDirectoryIndex",
+    "TestFindDuplicateFrames",
+]
+
+
+class TestDirectoryIndex(TestIDTBase):
+    """
+    Define :class:`aces.idt.core.index.DirectoryIndex` class unit tests
+    methods.
+    """
+
+    def setUp(self) -> None:
+        """Initialise the common tests attributes."""
+
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self._directory = self._temporary_directory.name
+
+        for name in (
+            "data/colour_checker/0/frame_0002.exr",
+            "data/colour_checker/0/frame_0001.exr",
+            "data/colour_checker/1/frame_0001.exr",
+            "data/grey_card/frame_0001.exr",
+        ):
+            path = os.path.join(self._directory, *name.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(b"frame")
+
+    def tearDown(self) -> None:
+        """After tests actions."""
+
+        self._temporary_directory.cleanup()
+
+    def test_scan(self) -> None:
+        """Test :meth:`aces.idt.core.index.DirectoryIndex.scan` method."""
+
+        index = DirectoryIndex.scan(self._directory)
+        path = os.path.join("data", "colour_checker", "0", "frame_0001.exr")
+
+        self.assertEqual(len(index.files), 4)
+        self.assertIn(os.path.join("data", "colour_checker", "1"), index.directories)
+        self.assertEqual(index.size(path), 5)
+        self.assertEqual(
+            index.mtime(path),
+            os.stat(os.path.join(self._directory, path)).st_mtime_ns,
+        )
+
+        self.assertTrue(index.exists(path))
+        self.assertTrue(index.exists(os.path.join(self._directory, path)))
+        self.assertFalse(index.exists("missing.exr"))
+        self.assertTrue(index.is_dir("data"))
+        self.assertFalse(index.is_dir(path))
+
+        self.assertListEqual(
+            index.iterdir(Path(self._directory, "data", "colour_checker", "0")),
+            [
+                Path(self._directory, "data", "colour_checker", "0", "frame_0001.exr"),
+                Path(self._directory, "data", "colour_checker", "0", "frame_0002.exr"),
+            ],
+        )
+        self.assertListEqual(
+            index.iterdir(self._directory), [Path(self._directory, "data")]
+        )
+
+    def test_from_directory(self) -> None:
+        """
+        Test :meth:`aces.idt.core.index.DirectoryIndex.from_directory` and
+        :meth:`aces.idt.core.index.DirectoryIndex.save` methods.
+        """
+
+        path = os.path.join(self._directory, FILENAME_INDEX_DIRECTORY)
+
+        DirectoryIndex.from_directory(self._directory)
+
+        self.assertFalse(os.path.exists(path))
+
+        index = DirectoryIndex.from_directory(self._directory, persist=True)
+
+        self.assertTrue(os.path.exists(path))
+        self.assertFalse(index.is_stale())
+        self.assertNotIn(FILENAME_INDEX_DIRECTORY, index.files)
+
+        # The content hashes are persisted along the index.
+        path_frame = os.path.join("data", "grey_card", "frame_0001.exr")
+        digest = index.digest(path_frame)
+        index.save()
+
+        self.assertEqual(digest, hash_file(os.path.join(self._directory, path_frame)))
+        self.assertEqual(
+            DirectoryIndex.from_directory(self._directory).digest(path_frame), digest
+        )
+
+        # The persisted index is loaded rather than walking the directory.
+        with open(path) as index_file:
+            data = json.load(index_file)
+
+        data["files"] = {"data/frame.exr": [1, 0]}
+        with open(path, "w") as index_file:
+            json.dump(data, index_file)
+
+        self.assertListEqual(
+            list(DirectoryIndex.from_directory(self._directory).files),
+            ["data/frame.exr"],
+        )
+
+        # Adding a file modifies its directory, the index is then stale.
+        path = os.path.join(self._directory, "data", "frame.exr")
+        with open(path, "wb") as file:
+            file.write(b"frame")
+        os.utime(os.path.dirname(path), ns=(0, 0))
+
+        self.assertTrue(index.is_stale())
+        self.assertEqual(len(DirectoryIndex.from_directory(self._directory).files), 5)
+
+        # The content hashes of the unchanged files of a stale index are
+        # retained.
+        index = DirectoryIndex.from_directory(self._directory, persist=True)
+        index.digest(path_frame)
+        index.save()
+        os.utime(self._directory, ns=(0, 0))
+
+        with mock.patch("aces.idt.core.index.hash_file") as hash_file_mock:
+            index = DirectoryIndex.from_directory(self._directory)
+
+            self.assertTrue(index.files)
+            self.assertEqual(index.digest(path_frame), digest)
+            hash_file_mock.assert_not_called()
+
+
+class TestFindDuplicateFrames(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.index.find_duplicate_frames` definition unit
+    tests methods.
+    """
+
+    def test_find_duplicate_frames(self) -> None:
+        """Test :func:`aces.idt.core.index.find_duplicate_frames` definition."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            archive = os.path.join(directory, "archive.zip")
+            with zipfile.ZipFile(archive, "w") as zip_file:
+                for name, content in (
+                    ("data/colour_checker/0/frame_0001.exr", b"frame_0"),
+                    ("data/colour_checker/0/frame_0002.exr", b"frame_0"),
+                    ("data/colour_checker/1/frame_0001.exr", b"frame_1"),
+                    ("data/colour_checker/1/frame_0002.exr", b"frame_0"),
+                    ("data/grey_card/frame_0001.exr", b"grey_card"),
+                ):
+                    zip_file.writestr(name, content)
+                    path = os.path.join(directory, "directory", *name.split("/"))
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    with open(path, "wb") as file:
+                        file.write(content)
+
+            paths = [
+                "data/colour_checker/0/frame_0001.exr",
+                "data/colour_checker/0/frame_0002.exr",
+                "data/colour_checker/1/frame_0001.exr",
+                "data/colour_checker/1/frame_0002.exr",
+                "data/colour_checker/1/frame_0002.exr",
+                "data/grey_card/frame_0001.exr",
+                "data/missing.exr",
+            ]
+            duplicates = {
+                "data/colour_checker/0/frame_0002.exr": (
+                    "data/colour_checker/0/frame_0001.exr"
+                ),
+                "data/colour_checker/1/frame_0002.exr": (
+                    "data/colour_checker/0/frame_0001.exr"
+                ),
+            }
+
+            reader = ZipArchiveReader(archive, os.path.join(directory, "archive"))
+
+            self.assertDictEqual(find_duplicate_frames(paths, reader), duplicates)
+            self.assertDictEqual(
+                find_duplicate_frames(
+                    paths, DirectoryIndex.scan(os.path.join(directory, "directory"))
+                ),
+                duplicates,
+            )
+
+            reader.close()
+
+    def test_find_duplicate_frames_fingerprint(self) -> None:
+        """
+        Test that :func:`aces.idt.core.index.find_duplicate_frames` definition
+        only fully hashes the frames sharing a fingerprint.
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            # The frames have the same size, the same header, and differ at
+            # their end, or in the middle for the duplicate candidates.
+            size = 2**18
+            for name, offset, value in (
+                ("frame_0001.exr", size - 1, 1),
+                ("frame_0002.exr", size - 1, 2),
+                ("frame_0003.exr", size // 2, 3),
+                ("frame_0004.exr", size // 2, 4),
+                ("frame_0005.exr", size // 2, 3),
+                ("frame_0006.exr", 0, 6),
+            ):
+                content = bytearray(size)
+                content[offset] = value
+                with open(os.path.join(directory, name), "wb") as file:
+                    file.write(content)
+
+            index = DirectoryIndex.scan(directory)
+            paths = sorted(index.files)
+
+            self.assertEqual(len({index.fingerprint(path) for path in paths}), 4)
+
+            with mock.patch(
+                "aces.idt.core.index.hash_file", side_effect=hash_file
+            ) as hash_file_mock:
+                self.assertDictEqual(
+                    find_duplicate_frames(paths, index),
+                    {"frame_0005.exr": "frame_0003.exr"},
+                )
+
+            self.assertListEqual(
+                sorted(
+                    os.path.basename(call.args[0])
+                    for call in hash_file_mock.call_args_list
+                ),
+                ["frame_0003.exr", "frame_0004.exr", "frame_0005.exr"],
+            )
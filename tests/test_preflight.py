@@ -0,0 +1,118 @@
+"""Define the unit tests for the :mod:`aces.idt.core.preflight` module."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+import numpy as np
+from colour import write_image
+
+from aces.idt.core.preflight import preflight_frames, read_frame_header
+from tests.test_utils import TestIDTBase
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestReadFrameHeader",
+    "TestPreflightFrames",
+]
+
+
+class TestReadFrameHeader(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.preflight.read_frame_header` definition unit
+    tests methods.
+    """
+
+    def test_read_frame_header(self) -> None:
+        """Test :func:`aces.idt.core.preflight.read_frame_header` definition."""
+
+        directory = os.path.join(self.get_test_resources_folder(), "synthetic_001")
+        path = os.path.join("data", "colour_checker", "0", "colour_checker_0001.tif")
+
+        header = read_frame_header(path, directory)
+
+        self.assertEqual(header["path"], path)
+        self.assertEqual(header["format_name"], "tiff")
+        self.assertListEqual(header["resolution"], [1024, 788])
+        self.assertEqual(header["channels"], 3)
+        self.assertEqual(header["type"], "uint16")
+        self.assertEqual(header["size"], 1024 * 788 * 3 * 2)
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "corrupt.exr")
+            with open(path, "wb") as file:
+                file.write(b"corrupt")
+
+            self.assertIn("error", read_frame_header(path))
+
+        self.assertIn("error", read_frame_header("missing.exr", directory))
+
+
+class TestPreflightFrames(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.preflight.preflight_frames` definition unit
+    tests methods.
+    """
+
+    def test_preflight_frames(self) -> None:
+        """Test :func:`aces.idt.core.preflight.preflight_frames` definition."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            for name, shape in (
+                ("frame_0001.tif", (8, 16, 3)),
+                ("frame_0002.tif", (8, 16, 3)),
+                ("frame_0003.tif", (4, 16, 3)),
+                ("frame_0004.tif", (8, 16)),
+            ):
+                write_image(np.zeros(shape), os.path.join(directory, name), "uint8")
+
+            report = preflight_frames(
+                {"colour_checker": ["frame_0001.tif", "frame_0002.tif"]},
+                directory,
+                workers_sampling=2,
+            )
+
+            self.assertTrue(report["valid"])
+            self.assertEqual(report["frames"], 2)
+            self.assertEqual(report["size"], 2 * 8 * 16 * 3)
+            self.assertGreater(report["duration"], 0)
+
+            # Frames are only expected to be consistent within a group.
+            report = preflight_frames(
+                {
+                    "colour_checker": ["frame_0001.tif", "frame_0002.tif"],
+                    "grey_card": ["frame_0003.tif"],
+                },
+                directory,
+            )
+
+            self.assertTrue(report["valid"])
+
+            report = preflight_frames(
+                {
+                    "colour_checker": [
+                        "frame_0001.tif",
+                        "frame_0002.tif",
+                        "frame_0003.tif",
+                        "frame_0004.tif",
+                        "missing.tif",
+                    ]
+                },
+                directory,
+            )
+
+            self.assertFalse(report["valid"])
+            self.assertEqual(len(report["errors"]), 1)
+            self.assertEqual(report["errors"][0]["path"], "missing.tif")
+            self.assertEqual(len(report["inconsistencies"]), 3)
+            self.assertIn('"resolution"', report["inconsistencies"][0])
+            self.assertIn("frame_0003.tif", report["inconsistencies"][0])
+            self.assertIn('"channels"', report["inconsistencies"][1])
+            self.assertIn("fewer than 3 channels", report["inconsistencies"][2])
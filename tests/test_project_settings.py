@@ -6,8 +6,11 @@ from __future__ import annotations
 
 import json
 import os
+import shutil
+import tempfile
 
 from aces.idt.core import constants
+from aces.idt.core.index import FILENAME_INDEX_DIRECTORY
 from aces.idt.framework.project_settings import IDTProjectSettings
 from tests.test_utils import TestIDTBase
 
@@ -89,6 +92,30 @@ class TestIDTProjectSettings(TestIDTBase):
 
         self.assertEqual(actual, expected)
 
+    def test_from_directory_persist_index(self) -> None:
+        """
+        Test :class:`aces.idt.IDTProjectSettings.from_directory` method with a
+        persisted directory index.
+        """
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            folder_path = os.path.join(temporary_directory, "synthetic_001")
+            shutil.copytree(
+                os.path.join(self.get_test_resources_folder(), "synthetic_001"),
+                folder_path,
+            )
+
+            settings = IDTProjectSettings.from_directory(
+                folder_path, persist_index=True
+            )
+
+            self.assertTrue(
+                os.path.exists(os.path.join(folder_path, FILENAME_INDEX_DIRECTORY))
+            )
+            self.assertDictEqual(
+                IDTProjectSettings.from_directory(folder_path).data, settings.data
+            )
+
     def test_property_names_and_metadata_names_equality(self) -> None:
         """Test that the property names are equal to the metadata names."""
 
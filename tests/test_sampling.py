@@ -0,0 +1,527 @@
+"""Define the unit tests for the :mod:`aces.idt.core.sampling` module."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from unittest import mock
+
+import cv2
+import numpy as np
+from colour_checker_detection.detection import reformat_image, sample_colour_checker
+from OpenImageIO import ImageBuf, ImageBufAlgo, ImageOutput, ImageSpec, MakeTextureMode
+
+from aces.idt.core import (
+    SAMPLES_COUNT_DEFAULT,
+    SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC,
+)
+from aces.idt.core.cache import SamplesCache
+from aces.idt.core.common import hash_file
+from aces.idt.core.index import DirectoryIndex
+from aces.idt.core.sampling import (
+    FRAMES_COUNT_EARLY_STOP_MINIMUM,
+    prefetch_frames,
+    read_frame,
+    read_frame_reduced,
+    read_frame_region,
+    sample_frames,
+    sample_frames_until_stable,
+    sample_stack,
+    swatch_index,
+)
+from aces.idt.core.video import VideoFrame
+from tests.test_utils import TestIDTBase
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestReadFrameReduced",
+    "TestReadFrameRegion",
+    "TestPrefetchFrames",
+    "TestSwatchIndex",
+    "TestSampleStack",
+    "TestSampleFrames",
+    "TestSampleFramesUntilStable",
+]
+
+
+def _write_image(path: str, image: np.ndarray, tile_size: int = 0) -> None:
+    """Write given image at given path, optionally tiled."""
+
+    height, width, channels = image.shape
+    specification = ImageSpec(width, height, channels, "float")
+    if tile_size:
+        specification.tile_width = tile_size
+        specification.tile_height = tile_size
+
+    image_output = ImageOutput.create(path)
+    image_output.open(path, specification)
+    image_output.write_image(image)
+    image_output.close()
+
+
+def _write_texture(path: str, image: np.ndarray) -> None:
+    """Write given image at given path as a box filtered MIP-mapped texture."""
+
+    configuration = ImageSpec()
+    configuration.attribute("maketx:filtername", "box")
+
+    ImageBufAlgo.make_texture(
+        MakeTextureMode.MakeTxTexture, ImageBuf(image), path, configuration
+    )
+
+
+def _smooth_image() -> np.ndarray:
+    """Return a smooth image."""
+
+    y, x = np.mgrid[0:1400, 0:2100] / 100
+
+    return np.stack(
+        [np.sin(x) * np.cos(y), np.sin(x + y), np.cos(x - y)], axis=-1
+    ).astype(np.float32)
+
+
+class TestReadFrameReduced(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.sampling.read_frame_reduced` definition unit
+    tests methods.
+    """
+
+    def setUp(self) -> None:
+        """Initialise the common tests attributes."""
+
+        self._temporary_directory = tempfile.TemporaryDirectory()
+
+        self._image = _smooth_image()
+
+    def tearDown(self) -> None:
+        """After tests actions."""
+
+        self._temporary_directory.cleanup()
+
+    def test_read_frame_reduced(self) -> None:
+        """Test :func:`aces.idt.core.sampling.read_frame_reduced` definition."""
+
+        settings = SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC
+
+        for name, tile_size in (("scanline.exr", 0), ("tiled.exr", 48)):
+            path = os.path.join(self._temporary_directory.name, name)
+            _write_image(path, self._image, tile_size)
+
+            np.testing.assert_allclose(
+                read_frame_reduced(path, settings),
+                read_frame(path, settings),
+                atol=1e-5,
+            )
+
+        path = os.path.join(self._temporary_directory.name, "texture.exr")
+        _write_texture(path, self._image)
+
+        image = self._image
+        image = (
+            image[0::2, 0::2]
+            + image[1::2, 0::2]
+            + image[0::2, 1::2]
+            + image[1::2, 1::2]
+        ) / 4
+
+        np.testing.assert_allclose(
+            read_frame_reduced(path, dict(settings, working_width=800)),
+            reformat_image(image, 800, cv2.INTER_CUBIC),
+            atol=1e-5,
+        )
+
+
+class TestReadFrameRegion(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.sampling.read_frame_region` definition unit
+    tests methods.
+    """
+
+    def setUp(self) -> None:
+        """Initialise the common tests attributes."""
+
+        self._temporary_directory = tempfile.TemporaryDirectory()
+
+        self._image = _smooth_image()
+
+    def tearDown(self) -> None:
+        """After tests actions."""
+
+        self._temporary_directory.cleanup()
+
+    def test_read_frame_region(self) -> None:
+        """Test :func:`aces.idt.core.sampling.read_frame_region` definition."""
+
+        settings = SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC
+        quadrilateral = np.array([[1210, 150], [1190, 760], [250, 770], [270, 160]])
+
+        for name, tile_size in (("scanline.exr", 0), ("tiled.exr", 64)):
+            path = os.path.join(self._temporary_directory.name, name)
+            _write_image(path, self._image, tile_size)
+
+            image = read_frame(path, settings)
+            region, quadrilateral_region = read_frame_region(
+                path, settings, quadrilateral
+            )
+
+            x, y = (quadrilateral - quadrilateral_region)[0].astype(int)
+            height, width = region.shape[:2]
+
+            np.testing.assert_array_equal(quadrilateral_region[0], [1210 - x, 150 - y])
+            np.testing.assert_allclose(
+                region, image[y : y + height, x : x + width], atol=1e-5
+            )
+
+
+class TestPrefetchFrames(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.sampling.prefetch_frames` definition unit tests
+    methods.
+    """
+
+    def test_prefetch_frames(self) -> None:
+        """Test :func:`aces.idt.core.sampling.prefetch_frames` definition."""
+
+        self.assertListEqual(
+            list(prefetch_frames([(i,) for i in range(10)], 2, lambda x: x * 2)),
+            list(range(0, 20, 2)),
+        )
+
+    def test_raise_exception_prefetch_frames(self) -> None:
+        """
+        Test :func:`aces.idt.core.sampling.prefetch_frames` definition raised
+        exception.
+        """
+
+        def reader(x: int) -> int:
+            """Read given frame, failing on the third one."""
+
+            if x == 2:
+                msg = "Unreadable frame!"
+
+                raise ValueError(msg)
+
+            return x
+
+        frames = prefetch_frames([(i,) for i in range(10)], 2, reader)
+
+        self.assertEqual(next(frames), 0)
+        self.assertEqual(next(frames), 1)
+        self.assertRaises(ValueError, next, frames)
+
+
+class TestSwatchIndex(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.sampling.swatch_index` definition unit tests
+    methods.
+    """
+
+    def test_swatch_index(self) -> None:
+        """Test :func:`aces.idt.core.sampling.swatch_index` definition."""
+
+        settings = dict(SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC)
+        quadrilateral = np.array([[1210, 150], [1190, 760], [250, 770], [270, 160]])
+        rectangle = np.array([[1600, 0], [1600, 1066], [0, 1066], [0, 0]])
+
+        self.assertIsNone(
+            swatch_index(quadrilateral, rectangle, (1066, 1600), settings)
+        )
+
+        settings["reference_values"] = None
+        image = reformat_image(_smooth_image(), 1600)
+
+        for swatches_horizontal, swatches_vertical in ((6, 4), (1, 1)):
+            settings["swatches_horizontal"] = swatches_horizontal
+            settings["swatches_vertical"] = swatches_vertical
+
+            indexes, matrix = swatch_index(
+                quadrilateral, rectangle, image.shape, settings
+            )
+
+            self.assertEqual(matrix.shape[0], swatches_horizontal * swatches_vertical)
+
+            np.testing.assert_allclose(
+                matrix @ np.reshape(image, (-1, 3))[indexes],
+                sample_colour_checker(
+                    image, quadrilateral, rectangle, SAMPLES_COUNT_DEFAULT, **settings
+                ).swatch_colours,
+                atol=1e-5,
+            )
+
+
+class TestSampleStack(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.sampling.sample_stack` definition unit tests
+    methods.
+    """
+
+    def test_sample_stack(self) -> None:
+        """Test :func:`aces.idt.core.sampling.sample_stack` definition."""
+
+        settings = dict(SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC)
+        settings["reference_values"] = None
+        quadrilateral = np.array([[1210, 150], [1190, 760], [250, 770], [270, 160]])
+        rectangle = np.array([[1600, 0], [1600, 1066], [0, 1066], [0, 0]])
+
+        image = reformat_image(_smooth_image(), 1600)
+        images = np.stack([image * 0.5, image, image * 2])
+
+        swatch_colours = sample_stack(images, quadrilateral, rectangle, settings)
+
+        self.assertTupleEqual(swatch_colours.shape, (3, 24, 3))
+        np.testing.assert_array_equal(
+            swatch_colours[1],
+            sample_colour_checker(
+                image, quadrilateral, rectangle, SAMPLES_COUNT_DEFAULT, **settings
+            ).swatch_colours,
+        )
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            stack = np.lib.format.open_memmap(
+                os.path.join(temporary_directory, "stack.npy"),
+                mode="w+",
+                dtype=images.dtype,
+                shape=images.shape,
+            )
+            stack[:] = images
+
+            np.testing.assert_allclose(
+                sample_stack(stack, quadrilateral, rectangle, settings, True),
+                swatch_colours,
+                atol=1e-5,
+            )
+
+            del stack
+
+
+class TestSampleFrames(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.sampling.sample_frames` definition unit tests
+    methods.
+    """
+
+    def setUp(self) -> None:
+        """Initialise the common tests attributes."""
+
+        self._temporary_directory = tempfile.TemporaryDirectory()
+
+        self._image = _smooth_image()
+
+    def tearDown(self) -> None:
+        """After tests actions."""
+
+        self._temporary_directory.cleanup()
+
+    def test_memo(self) -> None:
+        """
+        Test :func:`aces.idt.core.sampling.sample_frames` definition memo.
+        """
+
+        settings = dict(SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC)
+        settings["reference_values"] = None
+        settings_grey_card = dict(settings, swatches_horizontal=1, swatches_vertical=1)
+        quadrilateral = np.array([[1210, 150], [1190, 760], [250, 770], [270, 160]])
+        rectangle = np.array([[1600, 0], [1600, 1066], [0, 1066], [0, 0]])
+
+        paths = []
+        for i in range(2):
+            path = os.path.join(self._temporary_directory.name, f"frame_{i}.exr")
+            _write_image(path, self._image * (1 + i))
+            paths.append(path)
+
+        frames = [
+            (paths[0], settings, False),
+            (paths[1], settings, False),
+            (paths[0], settings, False),
+            (paths[0], settings_grey_card, False),
+            (paths[0], settings, False),
+        ]
+
+        expected = [
+            swatch_colours
+            for swatch_colours, _image in sample_frames(
+                frames, quadrilateral, rectangle
+            )
+        ]
+
+        for prefetch in (0, 2):
+            memo = {}
+            samples = [
+                swatch_colours
+                for swatch_colours, _image in sample_frames(
+                    frames, quadrilateral, rectangle, prefetch=prefetch, memo=memo
+                )
+            ]
+
+            self.assertEqual(len(memo), 3)
+            for swatch_colours, swatch_colours_expected in zip(
+                samples, expected, strict=True
+            ):
+                np.testing.assert_array_equal(swatch_colours, swatch_colours_expected)
+
+        # The memo is shared across calls, the frames are not read again.
+        for path in paths:
+            os.remove(path)
+
+        samples = [
+            swatch_colours
+            for swatch_colours, _image in sample_frames(
+                frames[:2], quadrilateral, rectangle, memo=memo
+            )
+        ]
+
+        np.testing.assert_array_equal(samples, expected[:2])
+
+    def test_cache(self) -> None:
+        """
+        Test :func:`aces.idt.core.sampling.sample_frames` definition cache.
+        """
+
+        settings = dict(SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC)
+        settings["reference_values"] = None
+        quadrilateral = np.array([[1210, 150], [1190, 760], [250, 770], [270, 160]])
+        rectangle = np.array([[1600, 0], [1600, 1066], [0, 1066], [0, 0]])
+
+        directory = os.path.join(self._temporary_directory.name, "frames")
+        os.makedirs(directory)
+        paths = []
+        for i in range(2):
+            path = os.path.join(directory, f"frame_{i}.exr")
+            _write_image(path, self._image * (1 + i))
+            paths.append(path)
+
+        frames = [(path, settings, False) for path in paths]
+        cache = SamplesCache(os.path.join(self._temporary_directory.name, "cache"))
+        index = DirectoryIndex.scan(directory)
+
+        expected = [
+            swatch_colours
+            for swatch_colours, _image in sample_frames(
+                frames, quadrilateral, rectangle
+            )
+        ]
+
+        # The content hashes keying the cache are computed once per frame and
+        # retained by the index across the calls.
+        with mock.patch(
+            "aces.idt.core.index.hash_file", side_effect=hash_file
+        ) as hash_file_mock:
+            for _i in range(2):
+                samples = [
+                    swatch_colours
+                    for swatch_colours, _image in sample_frames(
+                        frames, quadrilateral, rectangle, cache=cache, index=index
+                    )
+                ]
+
+                np.testing.assert_array_equal(samples, expected)
+
+            self.assertEqual(hash_file_mock.call_count, len(paths))
+
+    def test_cache_video(self) -> None:
+        """
+        Test :func:`aces.idt.core.sampling.sample_frames` definition cache with
+        the frames of a video file.
+        """
+
+        path = os.path.join(self._temporary_directory.name, "clip.mov")
+        with open(path, "wb") as file:
+            file.write(b"clip")
+
+        frames = [
+            (VideoFrame(path, i), SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC, False)
+            for i in range(4)
+        ]
+        cache = SamplesCache(os.path.join(self._temporary_directory.name, "cache"))
+        quadrilateral = np.array([[1210, 150], [1190, 760], [250, 770], [270, 160]])
+        rectangle = np.array([[1600, 0], [1600, 1066], [0, 1066], [0, 0]])
+
+        # The video file is only hashed once, its frames being keyed by their
+        # index.
+        with (
+            mock.patch(
+                "aces.idt.core.sampling.sample_frame",
+                side_effect=lambda path, *_args, **_kwargs: (
+                    np.full((24, 3), path.index, dtype=np.float32),
+                    None,
+                ),
+            ),
+            mock.patch(
+                "aces.idt.core.cache.hash_file", side_effect=hash_file
+            ) as hash_file_mock,
+        ):
+            for _i in range(2):
+                samples = [
+                    swatch_colours[0, 0]
+                    for swatch_colours, _image in sample_frames(
+                        frames, quadrilateral, rectangle, cache=cache
+                    )
+                ]
+
+                self.assertListEqual(samples, [0, 1, 2, 3])
+
+            self.assertEqual(hash_file_mock.call_count, 1)
+
+
+class TestSampleFramesUntilStable(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.sampling.sample_frames_until_stable` definition
+    unit tests methods.
+    """
+
+    def setUp(self) -> None:
+        """Initialise the common tests attributes."""
+
+        self._temporary_directory = tempfile.TemporaryDirectory()
+
+        self._image = _smooth_image()
+
+    def tearDown(self) -> None:
+        """After tests actions."""
+
+        self._temporary_directory.cleanup()
+
+    def test_sample_frames_until_stable(self) -> None:
+        """
+        Test :func:`aces.idt.core.sampling.sample_frames_until_stable`
+        definition.
+        """
+
+        settings = dict(SETTINGS_SEGMENTATION_COLORCHECKER_CLASSIC)
+        settings["reference_values"] = None
+        quadrilateral = np.array([[1210, 150], [1190, 760], [250, 770], [270, 160]])
+        rectangle = np.array([[1600, 0], [1600, 1066], [0, 1066], [0, 0]])
+
+        frames_stable, frames_unstable = [], []
+        for i in range(8):
+            path = os.path.join(self._temporary_directory.name, f"stable_{i}.exr")
+            _write_image(path, self._image)
+            frames_stable.append((path, settings, False))
+
+            path = os.path.join(self._temporary_directory.name, f"unstable_{i}.exr")
+            _write_image(path, self._image * (1 + i / 10))
+            frames_unstable.append((path, settings, False))
+
+        self.assertEqual(
+            len(
+                sample_frames_until_stable(
+                    frames_stable, quadrilateral, rectangle, workers=2, prefetch=2
+                )
+            ),
+            FRAMES_COUNT_EARLY_STOP_MINIMUM,
+        )
+
+        self.assertEqual(
+            len(
+                sample_frames_until_stable(
+                    frames_unstable, quadrilateral, rectangle, prefetch=2
+                )
+            ),
+            8,
+        )
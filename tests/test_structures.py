@@ -0,0 +1,143 @@
+"""Define the unit tests for the :mod:`aces.idt.core.structures` module."""
+
+from __future__ import annotations
+
+import json
+import os
+from unittest import mock
+
+import numpy as np
+
+from aces.idt.core.structures import SamplesAnalysis
+from tests.test_utils import TestIDTBase
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestSamplesAnalysis",
+]
+
+
+class TestSamplesAnalysis(TestIDTBase):
+    """
+    Define :class:`aces.idt.core.structures.SamplesAnalysis` class unit tests
+    methods.
+    """
+
+    def test_json(self) -> None:
+        """
+        Test :meth:`aces.idt.core.structures.SamplesAnalysis.to_json` and
+        :meth:`aces.idt.core.structures.SamplesAnalysis.from_json` methods.
+        """
+
+        with open(
+            os.path.join(self.get_test_resources_folder(), "samples_analysis.json")
+        ) as file:
+            expected = json.load(file)
+
+        samples_analysis = SamplesAnalysis.from_json(expected)
+
+        self.assertTupleEqual(
+            samples_analysis.EVs, (-3.0, -2.0, -1.0, 0.0, 1.0, 2.0, 3.0)
+        )
+        self.assertTupleEqual(samples_analysis.colour_checker_medians.shape, (7, 24, 3))
+        self.assertIsNone(samples_analysis.flatfield_median)
+        np.testing.assert_array_equal(
+            samples_analysis.colour_checker_median(0.0),
+            expected["colour_checker"]["0.0"]["samples_median"],
+        )
+
+        self.assertDictEqual(json.loads(samples_analysis.to_json()), expected)
+
+        samples_analysis.add_colour_checker(
+            4.0, np.ones([2, 24, 3]), np.ones([24, 3]), ["colour_checker_0003.exr"]
+        )
+        samples_analysis = SamplesAnalysis.from_json(samples_analysis.to_json())
+
+        self.assertTupleEqual(
+            samples_analysis.colour_checker_frames_skipped(4.0),
+            ("colour_checker_0003.exr",),
+        )
+        self.assertTupleEqual(samples_analysis.colour_checker_frames_skipped(0.0), ())
+
+    def test_arrays(self) -> None:
+        """
+        Test :meth:`aces.idt.core.structures.SamplesAnalysis.to_arrays` and
+        :meth:`aces.idt.core.structures.SamplesAnalysis.from_arrays` methods.
+        """
+
+        samples_analysis = SamplesAnalysis()
+        samples_analysis.add_colour_checker(0.0, np.ones([3, 24, 3]), np.ones([24, 3]))
+        samples_analysis.add_colour_checker(
+            1.0, np.zeros([2, 24, 3]), np.zeros([24, 3]), ["colour_checker_0003.exr"]
+        )
+        samples_analysis.set_flatfield(np.ones([2, 24, 3]), np.ones([24, 3]))
+
+        arrays = samples_analysis.to_arrays()
+        self.assertTrue(all(isinstance(array, np.ndarray) for array in arrays.values()))
+
+        samples_analysis_loaded = SamplesAnalysis.from_arrays(arrays)
+
+        self.assertTupleEqual(samples_analysis_loaded.EVs, (0.0, 1.0))
+        self.assertTupleEqual(
+            samples_analysis_loaded.colour_checker_frames_skipped(1.0),
+            ("colour_checker_0003.exr",),
+        )
+        self.assertIsNone(samples_analysis_loaded.grey_card_median)
+        self.assertEqual(samples_analysis_loaded.to_json(), samples_analysis.to_json())
+
+    def test_add_colour_checker(self) -> None:
+        """
+        Test :meth:`aces.idt.core.structures.SamplesAnalysis.add_colour_checker`
+        method.
+        """
+
+        samples_analysis = SamplesAnalysis()
+        with mock.patch(
+            "aces.idt.core.structures.np.concatenate", wraps=np.concatenate
+        ) as concatenate:
+            for EV in range(8):
+                samples_analysis.add_colour_checker(
+                    float(EV), np.full([EV + 1, 24, 3], EV), np.full([24, 3], EV)
+                )
+
+            concatenate.assert_not_called()
+
+            self.assertTupleEqual(
+                samples_analysis.colour_checker_medians.shape, (8, 24, 3)
+            )
+            self.assertEqual(concatenate.call_count, 2)
+
+        samples_analysis.add_colour_checker(
+            8.0, np.full([2, 24, 3], 8), np.ones([24, 3])
+        )
+
+        for EV in range(9):
+            sequence = samples_analysis.colour_checker_sequence(float(EV))
+
+            self.assertEqual(len(sequence), 2 if EV == 8 else EV + 1)
+            np.testing.assert_array_equal(sequence, EV)
+
+        np.testing.assert_array_equal(samples_analysis.colour_checker_median(8.0), 1)
+
+    def test_raise_exception_add_colour_checker(self) -> None:
+        """
+        Test :meth:`aces.idt.core.structures.SamplesAnalysis.add_colour_checker`
+        method raised exception.
+        """
+
+        samples_analysis = SamplesAnalysis()
+        samples_analysis.add_colour_checker(0.0, np.ones([3, 24, 3]), np.ones([24, 3]))
+
+        self.assertRaises(
+            ValueError,
+            samples_analysis.add_colour_checker,
+            0.0,
+            np.ones([3, 24, 3]),
+            np.ones([24, 3]),
+        )
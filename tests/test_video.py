@@ -0,0 +1,251 @@
+"""Define the unit tests for the :mod:`aces.idt.core.video` module."""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import shutil
+import subprocess
+import tempfile
+import typing
+import unittest
+from fractions import Fraction
+from unittest import mock
+
+import numpy as np
+
+from aces.idt.core.preflight import read_frame_header
+from aces.idt.core.sampling import read_frame
+from aces.idt.core.video import (
+    VideoFrame,
+    expand_video_frames,
+    is_video,
+    probe_video,
+    read_video_frame,
+    select_video_frames,
+)
+from tests.test_utils import TestIDTBase
+
+__author__ = "Alex Forsythe, Joshua Pines, Thomas Mansencal, Nick Shaw, Adam Davis"
+__copyright__ = "Copyright 2022 Academy of Motion Picture Arts and Sciences"
+__license__ = "Academy of Motion Picture Arts and Sciences License Terms"
+__maintainer__ = "Academy of Motion Picture Arts and Sciences"
+__email__ = "acessupport@oscars.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestVideoFrame",
+    "TestIsVideo",
+    "TestSelectVideoFrames",
+    "TestProbeVideo",
+    "TestReadVideoFrame",
+]
+
+_HAS_FFMPEG = shutil.which("ffmpeg") is not None and shutil.which("ffprobe") is not None
+
+
+class TestVideoFrame(TestIDTBase):
+    """
+    Define :class:`aces.idt.core.video.VideoFrame` class unit tests methods.
+    """
+
+    def test_video_frame(self) -> None:
+        """Test :class:`aces.idt.core.video.VideoFrame` class."""
+
+        frame = VideoFrame("clip.mov", 12, (16, 8), Fraction(24000, 1001))
+
+        self.assertEqual(str(frame), "clip.mov[12]")
+        self.assertEqual(frame, VideoFrame("clip.mov", 12))
+        self.assertNotEqual(frame, VideoFrame("clip.mov", 13))
+        self.assertEqual(len({frame, VideoFrame("clip.mov", 12)}), 1)
+
+        frame = pickle.loads(pickle.dumps(frame))  # noqa: S301
+
+        self.assertListEqual(frame.resolution, [16, 8])
+        self.assertEqual(frame.frame_rate, Fraction(24000, 1001))
+
+
+class TestIsVideo(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.video.is_video` definition unit tests methods.
+    """
+
+    def test_is_video(self) -> None:
+        """Test :func:`aces.idt.core.video.is_video` definition."""
+
+        self.assertTrue(is_video("data/colour_checker/0/clip.MOV"))
+        self.assertTrue(is_video("clip.mxf"))
+        self.assertFalse(is_video("frame.exr"))
+        self.assertFalse(is_video(VideoFrame("clip.mov", 0)))
+
+        self.assertListEqual(
+            expand_video_frames(["frame_0001.exr", "frame_0002.exr"], 10),
+            ["frame_0001.exr", "frame_0002.exr"],
+        )
+
+
+class TestSelectVideoFrames(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.video.select_video_frames` definition unit
+    tests methods.
+    """
+
+    def test_select_video_frames(self) -> None:
+        """Test :func:`aces.idt.core.video.select_video_frames` definition."""
+
+        self.assertListEqual(select_video_frames(100, 4), [12, 37, 62, 87])
+        self.assertListEqual(select_video_frames(10, 10), list(range(10)))
+        self.assertListEqual(select_video_frames(3, 10), [0, 1, 2])
+        self.assertListEqual(select_video_frames(5, 0), list(range(5)))
+        self.assertListEqual(select_video_frames(0, 10), [])
+
+
+class TestProbeVideo(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.video.probe_video` definition frame count unit
+    tests methods.
+    """
+
+    def _probe(self, stream: dict, format_: dict) -> tuple:
+        """Probe a video file whose *ffprobe* output is mocked."""
+
+        def run(arguments: list, **_kwargs: typing.Any) -> typing.Any:
+            """Return the mocked *ffprobe* output."""
+
+            stream_probed = dict(stream)
+            if "-count_packets" in arguments:
+                stream_probed["nb_read_packets"] = "8"
+
+            return subprocess.CompletedProcess(
+                arguments,
+                0,
+                json.dumps({"streams": [stream_probed], "format": format_}).encode(),
+                b"",
+            )
+
+        with mock.patch(
+            "aces.idt.core.video.subprocess.run", side_effect=run
+        ) as run_mock:
+            properties = probe_video("clip.mov")
+
+        return properties["frames"], [
+            "-count_packets" in call.args[0] for call in run_mock.call_args_list
+        ]
+
+    def test_probe_video(self) -> None:
+        """Test :func:`aces.idt.core.video.probe_video` definition."""
+
+        stream = {"width": 32, "height": 16, "r_frame_rate": "24/1"}
+        format_ = {"format_name": "mov,mp4"}
+
+        self.assertTupleEqual(
+            self._probe(dict(stream, nb_frames="8"), format_), (8, [False])
+        )
+        self.assertTupleEqual(
+            self._probe(dict(stream, duration="0.333"), format_), (8, [False])
+        )
+        self.assertTupleEqual(
+            self._probe(stream, dict(format_, duration="0.333")), (8, [False])
+        )
+        self.assertTupleEqual(self._probe(stream, format_), (8, [False, True]))
+
+
+@unittest.skipIf(not _HAS_FFMPEG, "ffmpeg is not available.")
+class TestReadVideoFrame(TestIDTBase):
+    """
+    Define :func:`aces.idt.core.video.read_video_frame` definition unit tests
+    methods.
+    """
+
+    def setUp(self) -> None:
+        """Initialise the common tests attributes."""
+
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self._directory = self._temporary_directory.name
+
+        # Every frame of the lossless clip has a distinct value so that the
+        # decoded frame index can be verified.
+        self._frames = np.tile(
+            np.arange(1, 9, dtype=np.uint16)[:, None, None, None] * 4096,
+            (1, 16, 32, 3),
+        )
+        self._frames[..., 1] += 1
+        subprocess.run(  # noqa: S603
+            [  # noqa: S607
+                "ffmpeg",
+                "-v",
+                "error",
+                "-f",
+                "rawvideo",
+                "-pix_fmt",
+                "rgb48le",
+                "-s",
+                "32x16",
+                "-r",
+                "24",
+                "-i",
+                "-",
+                "-c:v",
+                "ffv1",
+                "-pix_fmt",
+                "gbrp16le",
+                os.path.join(self._directory, "clip.mkv"),
+            ],
+            input=self._frames.astype("<u2").tobytes(),
+            check=True,
+        )
+
+    def tearDown(self) -> None:
+        """After tests actions."""
+
+        self._temporary_directory.cleanup()
+
+    def test_probe_video(self) -> None:
+        """Test :func:`aces.idt.core.video.probe_video` definition."""
+
+        properties = probe_video("clip.mkv", self._directory)
+
+        self.assertListEqual(properties["resolution"], [32, 16])
+        self.assertEqual(properties["frames"], 8)
+        self.assertEqual(properties["frame_rate"], 24)
+
+        self.assertIsNone(
+            probe_video("clip.mkv", self._directory, count_frames=False)["frames"]
+        )
+
+        self.assertRaises(ValueError, probe_video, "missing.mkv", self._directory)
+
+        header = read_frame_header("clip.mkv", self._directory, 4)
+
+        self.assertListEqual(header["resolution"], [32, 16])
+        self.assertEqual(header["size"], 32 * 16 * 3 * 2 * 4)
+
+    def test_read_video_frame(self) -> None:
+        """Test :func:`aces.idt.core.video.read_video_frame` definition."""
+
+        frames = expand_video_frames(["clip.mkv"], 4, self._directory)
+
+        self.assertListEqual([frame.index for frame in frames], [1, 3, 5, 7])
+
+        for frame in [*frames, VideoFrame("clip.mkv", 0)]:
+            np.testing.assert_allclose(
+                read_video_frame(frame, self._directory),
+                self._frames[frame.index] / 65535,
+                atol=1e-7,
+            )
+
+        image = read_frame(
+            frames[0],
+            {"working_width": 16, "interpolation_method": 3},
+            self._directory,
+        )
+
+        self.assertTupleEqual(image.shape, (8, 16, 3))
+
+        self.assertRaises(
+            ValueError,
+            read_video_frame,
+            VideoFrame("clip.mkv", 0, (64, 64), Fraction(24)),
+            self._directory,
+        )